@@ -0,0 +1,5 @@
+"""
+Benchmarks des chemins critiques du SDK ROMAPI Search
+
+Voir ``python -m benchmarks --help``.
+"""
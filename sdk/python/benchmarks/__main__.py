@@ -0,0 +1,76 @@
+"""
+Exécution des benchmarks du SDK
+
+Usage:
+    python -m benchmarks                              # tous les benchmarks
+    python -m benchmarks --group parsing cache        # certains groupes
+    python -m benchmarks --output results/main.json   # enregistrer les résultats
+    python -m benchmarks --compare results/main.json  # comparer à une référence
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime
+
+from .harness import REGISTRY, compare_results, format_duration, load_results, run_benchmark, save_results
+from .stub_server import StubServer
+from . import suite  # noqa: F401  (enregistre les benchmarks)
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description="Benchmarks du SDK ROMAPI Search")
+    parser.add_argument('--group', nargs='*', help="Groupes à exécuter (client, transport, parsing, codec, cache, geo)")
+    parser.add_argument('--filter', help="Ne garder que les benchmarks dont le nom contient ce texte")
+    parser.add_argument('--scale', type=float, default=1.0, help="Facteur sur le nombre de tours (défaut: 1.0)")
+    parser.add_argument('--output', help="Fichier de résultats JSON (défaut: benchmarks/results/<date>.json)")
+    parser.add_argument('--compare', help="Fichier de résultats de référence")
+    parser.add_argument('--threshold', type=float, default=0.10, help="Seuil de régression relatif (défaut: 0.10)")
+    args = parser.parse_args(argv)
+
+    specs = [
+        spec for spec in REGISTRY
+        if (not args.group or spec.group in args.group)
+        and (not args.filter or args.filter in spec.name)
+    ]
+    if not specs:
+        print("Aucun benchmark sélectionné", file=sys.stderr)
+        return 2
+
+    results = []
+    server = StubServer().start() if any(spec.needs_server for spec in specs) else None
+    try:
+        for spec in specs:
+            result = run_benchmark(spec, server.base_url if server else None, scale=args.scale)
+            results.append(result)
+            print(
+                f"{spec.group + '.' + spec.name:<40} "
+                f"median {format_duration(result.median):>10}  "
+                f"p95 {format_duration(result.p95):>10}  "
+                f"{result.ops_per_second:>12,.0f} ops/s"
+            )
+    finally:
+        if server:
+            server.stop()
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%d-%H%M%S}.json")
+    save_results(results, output)
+    print(f"\nRésultats enregistrés dans {output}")
+
+    if args.compare:
+        comparisons = compare_results(load_results(args.compare), results, args.threshold)
+        regressions = [c for c in comparisons if c['regression']]
+        print(f"\nComparaison avec {args.compare}:")
+        for comparison in comparisons:
+            marker = '  REGRESSION' if comparison['regression'] else ''
+            print(f"{comparison['benchmark']:<40} x{comparison['ratio']:.2f}{marker}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
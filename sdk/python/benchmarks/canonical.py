@@ -0,0 +1,98 @@
+"""
+Taux de succès du cache avec et sans canonicalisation des requêtes
+
+Rejoue un journal de recherches synthétique (termes courants saisis avec
+des variantes de casse et d'espaces, filtres dans un ordre quelconque,
+pagination explicite ou non) contre le faux serveur, avec un client sans
+canonicalisation puis un client avec, et compare les requêtes envoyées à
+l'API et les taux de succès du cache.
+
+Usage:
+    python -m benchmarks.canonical
+    python -m benchmarks.canonical --searches 2000 --seed 7
+"""
+
+import argparse
+import random
+import sys
+from typing import Any, Dict, List, Optional
+
+from romapi_search import ROMAPISearchClient
+from romapi_search.testing import FakeSearchServer
+from romapi_search.utils import COMMON_SEARCH_TERMS
+
+_CATEGORIES = ['cat-restaurants', 'cat-fintech', 'cat-transport']
+_CITIES = ['Douala', 'Yaoundé', None]
+
+
+def _variant(term: str, rng: random.Random) -> str:
+    """Saisie d'un terme : casse et espaces variables"""
+    words = term.split()
+    if rng.random() < 0.3:
+        words = [word.capitalize() for word in words]
+    if rng.random() < 0.1:
+        words = [word.upper() for word in words]
+    separator = '  ' if rng.random() < 0.2 else ' '
+    return (' ' if rng.random() < 0.1 else '') + separator.join(words)
+
+
+def query_log(searches: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Arguments de ``search`` d'un journal synthétique (termes populaires en tête)"""
+    rng = random.Random(seed)
+    terms = COMMON_SEARCH_TERMS[:30]
+    # Popularité décroissante (loi de Zipf approchée)
+    weights = [1.0 / (rank + 1) for rank in range(len(terms))]
+    log = []
+    for _ in range(searches):
+        search: Dict[str, Any] = {'query': _variant(rng.choices(terms, weights)[0], rng)}
+        city = rng.choice(_CITIES)
+        if city:
+            search['city'] = city
+        if rng.random() < 0.3:
+            search['categories'] = rng.sample(_CATEGORIES, 2)
+        if rng.random() < 0.2:
+            search['page'] = 2
+        log.append(search)
+    return log
+
+
+def replay(base_url: str, log: List[Dict[str, Any]], canonicalize: bool) -> Dict[str, Any]:
+    client = ROMAPISearchClient(base_url=base_url, retries=0, canonicalize=canonicalize, cache_timeout=3600)
+    try:
+        for search in log:
+            client.search(**search)
+        lookups = client.cache.hits + client.cache.misses
+        report = {
+            'requests': client.cache.misses,
+            'hit_ratio': client.cache.hits / lookups if lookups else 0.0,
+            'entries': client.cache.size,
+        }
+        if client.canonicalizer is not None:
+            report['estimated_raw_hit_ratio'] = client.canonicalizer.raw_hit_ratio
+        return report
+    finally:
+        client.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.canonical', description="Taux de succès du cache et canonicalisation"
+    )
+    parser.add_argument('--searches', type=int, default=1000, help="Recherches rejouées (défaut: 1000)")
+    parser.add_argument('--seed', type=int, default=0, help="Graine du journal synthétique (défaut: 0)")
+    args = parser.parse_args(argv)
+
+    log = query_log(args.searches, args.seed)
+    with FakeSearchServer() as server:
+        raw = replay(server.base_url, log, canonicalize=False)
+        canonical = replay(server.base_url, log, canonicalize=True)
+
+    print(f"{'':<22}{'requêtes API':>14}{'entrées':>10}{'taux de succès':>16}")
+    for label, report in (('sans canonicalisation', raw), ('avec canonicalisation', canonical)):
+        print(f"{label:<22}{report['requests']:>14,}{report['entries']:>10,}{report['hit_ratio']:>16.1%}")
+    print(f"\nTaux sans canonicalisation estimé par le client : {canonical['estimated_raw_hit_ratio']:.1%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
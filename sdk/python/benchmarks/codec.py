@@ -0,0 +1,85 @@
+"""
+Taille et fidélité du codec binaire
+
+Pour chaque réponse enregistrée (et une recherche par catégorie du catalogue
+synthétique), compare la taille du bloc produit par ``romapi_search.codec``
+(MessagePack et JSON compact) à pickle et au JSON brut de l'API, et vérifie
+que ``decode(encode(x)) == x`` dans chaque format disponible.
+
+Usage:
+    python -m benchmarks.codec
+
+Code de sortie 1 si un aller-retour ne restitue pas le résultat d'origine.
+Les vitesses d'encodage et de décodage sont mesurées par
+``python -m benchmarks --group codec``.
+"""
+
+import argparse
+import json
+import os
+import pickle
+import sys
+from typing import Any, List, Optional, Tuple
+
+from romapi_search import codec
+from romapi_search.testing import SyntheticCatalogue
+from romapi_search.types import CategorySearchResults, MultiTypeSearchResults, SearchResults, Suggestion
+
+from .stub_server import PAYLOADS_DIR
+
+
+def _payloads() -> List[Tuple[str, bytes, Any]]:
+    """(nom, JSON brut, résultat construit) de chaque cas mesuré"""
+    cases = []
+    for filename, build in (
+        ('search.json', SearchResults.from_dict),
+        ('nearby.json', SearchResults.from_dict),
+        ('multi_type.json', MultiTypeSearchResults.from_dict),
+        ('suggest.json', lambda data: [Suggestion.from_dict(item) for item in data]),
+    ):
+        with open(os.path.join(PAYLOADS_DIR, filename), 'rb') as f:
+            body = f.read()
+        cases.append((filename[:-5], body, build(json.loads(body))))
+
+    category = SyntheticCatalogue().category_search({'limit': '20'}, 'restaurants')
+    body = json.dumps(category).encode('utf-8')
+    cases.append(('category', body, CategorySearchResults.from_dict(category)))
+
+    search = cases[0][2]
+    cases.append(('hit', json.dumps(json.loads(cases[0][1])['hits'][0]).encode('utf-8'), search.hits[0]))
+    return cases
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.codec', description="Taille et fidélité du codec binaire")
+    parser.parse_args(argv)
+
+    formats = [('json', codec.FORMAT_JSON)]
+    if codec.msgpack is not None:
+        formats.insert(0, ('msgpack', codec.FORMAT_MSGPACK))
+    else:
+        print("msgpack non installé : format MessagePack ignoré (pip install romapi-search-sdk[msgpack])\n")
+
+    columns = [name for name, _ in formats] + ['pickle', 'api json']
+    print(f"{'réponse':<12}" + ''.join(f"{column:>12}" for column in columns) + f"{'gain':>10}")
+
+    failed = False
+    for name, body, value in _payloads():
+        sizes = []
+        for format_name, format_id in formats:
+            data = codec.encode(value, format_id)
+            sizes.append(len(data))
+            if codec.decode(data) != value:
+                print(f"{name}: aller-retour {format_name} infidèle", file=sys.stderr)
+                failed = True
+        sizes.append(len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)))
+        sizes.append(len(body))
+        # Gain du format par défaut par rapport à pickle
+        gain = 1 - sizes[0] / sizes[-2]
+        print(f"{name:<12}" + ''.join(f"{size:>12,}" for size in sizes) + f"{gain:>10.0%}")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
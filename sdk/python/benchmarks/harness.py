@@ -0,0 +1,204 @@
+"""
+Harnais de mesure des benchmarks du SDK
+
+Chaque benchmark est une fonction qui prépare son contexte et renvoie
+l'opération à chronométrer. L'opération est exécutée ``inner`` fois par
+tour ; le temps retenu est le temps moyen d'une opération pour chaque tour.
+"""
+
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+RESULTS_FORMAT_VERSION = 1
+
+
+@dataclass
+class BenchmarkSpec:
+    """Description d'un benchmark enregistré"""
+    name: str
+    group: str
+    setup: Callable[..., Callable[[], Any]]
+    inner: int = 1
+    rounds: int = 30
+    warmup: int = 3
+    needs_server: bool = False
+
+
+@dataclass
+class BenchmarkResult:
+    """Résultat d'un benchmark (temps en secondes par opération)"""
+    name: str
+    group: str
+    rounds: int
+    inner: int
+    min: float
+    median: float
+    mean: float
+    p95: float
+    stdev: float
+    ops_per_second: float
+
+
+REGISTRY: List[BenchmarkSpec] = []
+
+
+def benchmark(
+    group: str,
+    inner: int = 1,
+    rounds: int = 30,
+    warmup: int = 3,
+    needs_server: bool = False
+) -> Callable:
+    """
+    Enregistrer une fonction de préparation comme benchmark
+
+    Args:
+        group: Groupe du benchmark (client, transport, parsing, cache, geo)
+        inner: Nombre d'opérations par tour
+        rounds: Nombre de tours mesurés
+        warmup: Nombre de tours de chauffe non mesurés
+        needs_server: La préparation reçoit l'URL du serveur local
+    """
+    def decorator(setup: Callable) -> Callable:
+        REGISTRY.append(BenchmarkSpec(
+            name=setup.__name__.replace('bench_', ''),
+            group=group,
+            setup=setup,
+            inner=inner,
+            rounds=rounds,
+            warmup=warmup,
+            needs_server=needs_server
+        ))
+        return setup
+    return decorator
+
+
+def run_benchmark(spec: BenchmarkSpec, base_url: Optional[str] = None, scale: float = 1.0) -> BenchmarkResult:
+    """
+    Exécuter un benchmark
+
+    Args:
+        spec: Benchmark à exécuter
+        base_url: URL du serveur local (benchmarks client)
+        scale: Facteur appliqué au nombre de tours (ex: 0.1 pour un essai rapide)
+
+    Returns:
+        BenchmarkResult: Statistiques par opération
+    """
+    operation = spec.setup(base_url) if spec.needs_server else spec.setup()
+    rounds = max(int(spec.rounds * scale), 3)
+    inner = spec.inner
+    timer = time.perf_counter
+
+    for _ in range(spec.warmup):
+        operation()
+
+    samples = []
+    for _ in range(rounds):
+        start = timer()
+        for _ in range(inner):
+            operation()
+        samples.append((timer() - start) / inner)
+
+    samples.sort()
+    mean = statistics.fmean(samples)
+    return BenchmarkResult(
+        name=spec.name,
+        group=spec.group,
+        rounds=rounds,
+        inner=inner,
+        min=samples[0],
+        median=statistics.median(samples),
+        mean=mean,
+        p95=samples[min(int(len(samples) * 0.95), len(samples) - 1)],
+        stdev=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        ops_per_second=1.0 / mean if mean else 0.0
+    )
+
+
+def environment_info() -> Dict[str, Any]:
+    """Informations d'environnement enregistrées avec les résultats"""
+    from romapi_search import __version__
+
+    return {
+        'sdk_version': __version__,
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def save_results(results: List[BenchmarkResult], path: str) -> None:
+    """Enregistrer les résultats au format JSON comparable"""
+    document = {
+        'format_version': RESULTS_FORMAT_VERSION,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'environment': environment_info(),
+        'benchmarks': {f"{r.group}.{r.name}": asdict(r) for r in results},
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Dict[str, Any]]:
+    """Charger un fichier de résultats"""
+    with open(path, 'r', encoding='utf-8') as f:
+        document = json.load(f)
+    return document['benchmarks']
+
+
+def compare_results(
+    baseline: Dict[str, Dict[str, Any]],
+    current: List[BenchmarkResult],
+    threshold: float = 0.10
+) -> List[Dict[str, Any]]:
+    """
+    Comparer des résultats à une référence (sur la médiane)
+
+    Args:
+        baseline: Résultats de référence (load_results)
+        current: Résultats courants
+        threshold: Dégradation relative au-delà de laquelle un benchmark
+            est signalé comme régression (0.10 = +10%)
+
+    Returns:
+        List[Dict]: Une entrée par benchmark commun aux deux jeux de résultats
+    """
+    comparisons = []
+    for result in current:
+        key = f"{result.group}.{result.name}"
+        if key not in baseline:
+            continue
+        reference = baseline[key]['median']
+        ratio = result.median / reference if reference else float('inf')
+        comparisons.append({
+            'benchmark': key,
+            'baseline': reference,
+            'current': result.median,
+            'ratio': ratio,
+            'regression': ratio > 1 + threshold,
+        })
+    return comparisons
+
+
+def format_duration(seconds: float) -> str:
+    """Formater une durée avec l'unité adaptée"""
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    if seconds >= 1e-6:
+        return f"{seconds * 1e6:.2f} µs"
+    return f"{seconds * 1e9:.0f} ns"
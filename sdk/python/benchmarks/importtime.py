@@ -0,0 +1,128 @@
+"""
+Budget de temps d'import du SDK (démarrage à froid)
+
+Chaque module est importé dans un interpréteur neuf lancé avec
+``-X importtime`` ; le temps cumulé rapporté pour le module est comparé à
+son budget (médiane de plusieurs lancements). Le paquet ``romapi_search``
+ne doit par ailleurs charger aucune dépendance lourde avant le premier
+accès à un de ses noms.
+
+Usage:
+    python -m benchmarks.importtime
+    python -m benchmarks.importtime --runs 9 --scale 2.0
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+SDK_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Module -> budget en millisecondes (temps cumulé rapporté par -X importtime)
+BUDGETS_MS = {
+    'romapi_search': 5.0,
+    'romapi_search.types': 60.0,
+    'romapi_search.client': 250.0,
+}
+
+# Modules qui ne doivent pas être chargés par ``import romapi_search``
+LAZY_MODULES = (
+    'requests',
+    'urllib3',
+    'msgpack',
+    'hashlib',
+    'romapi_search.client',
+    'romapi_search.types',
+    'romapi_search.utils',
+)
+
+
+def _run_python(code: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [SDK_DIR, env.get('PYTHONPATH')]))
+    command = [sys.executable]
+    if importtime:
+        command += ['-X', 'importtime']
+    command += ['-c', code]
+    return subprocess.run(command, env=env, capture_output=True, text=True, check=True)
+
+
+def measure_import(module: str, runs: int = 5) -> float:
+    """
+    Mesurer le temps d'import cumulé d'un module
+
+    Args:
+        module: Nom du module
+        runs: Nombre d'interpréteurs lancés
+
+    Returns:
+        float: Médiane du temps cumulé en millisecondes
+    """
+    samples = []
+    for _ in range(runs):
+        stderr = _run_python(f"import {module}", importtime=True).stderr
+        for line in stderr.splitlines():
+            # import time: self [us] | cumulative | imported package
+            parts = line.split('|')
+            if len(parts) == 3 and parts[2].strip() == module:
+                samples.append(int(parts[1]) / 1000)
+    if not samples:
+        raise RuntimeError(f"No -X importtime entry for {module}")
+    return statistics.median(samples)
+
+
+def eagerly_loaded_modules() -> List[str]:
+    """Modules de LAZY_MODULES présents dans sys.modules après ``import romapi_search``"""
+    code = "import json, sys, romapi_search; print(json.dumps(sorted(sys.modules)))"
+    loaded = set(json.loads(_run_python(code).stdout))
+    return [module for module in LAZY_MODULES if module in loaded]
+
+
+def check_budgets(runs: int = 5, scale: float = 1.0) -> Dict[str, Dict[str, float]]:
+    """
+    Mesurer chaque module de BUDGETS_MS
+
+    Args:
+        runs: Nombre de lancements par module
+        scale: Facteur appliqué aux budgets (machines lentes)
+
+    Returns:
+        Dict: Module -> temps mesuré, budget et dépassement
+    """
+    results = {}
+    for module, budget in BUDGETS_MS.items():
+        elapsed = measure_import(module, runs)
+        results[module] = {
+            'elapsed_ms': elapsed,
+            'budget_ms': budget * scale,
+            'over_budget': elapsed > budget * scale,
+        }
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.importtime', description="Budget d'import du SDK")
+    parser.add_argument('--runs', type=int, default=5, help="Lancements par module (défaut: 5)")
+    parser.add_argument('--scale', type=float, default=1.0, help="Facteur appliqué aux budgets (défaut: 1.0)")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module, result in check_budgets(args.runs, args.scale).items():
+        marker = '  DÉPASSEMENT' if result['over_budget'] else ''
+        print(f"{module:<30} {result['elapsed_ms']:>8.1f} ms  (budget {result['budget_ms']:.1f} ms){marker}")
+        failed = failed or result['over_budget']
+
+    eager = eagerly_loaded_modules()
+    if eager:
+        print(f"\nChargés par 'import romapi_search' : {', '.join(eager)}")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""
+Serveur HTTP local servant des réponses enregistrées de l'API de recherche
+
+Les réponses de /search, /search/suggest, /search/nearby et
+/search/multi-type sont lues une fois depuis ``benchmarks/payloads`` puis
+servies telles quelles par ``romapi_search.testing.FakeSearchServer``, sans
+aucune latence ajoutée par défaut : les mesures reflètent uniquement le coût
+côté client (HTTP local, décodage, construction des objets). Un
+``FaultProfile`` peut être fourni pour mesurer le client dans des conditions
+dégradées.
+"""
+
+import os
+from typing import Dict, Optional
+
+from romapi_search.testing import FakeSearchServer, FaultProfile
+
+PAYLOADS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'payloads')
+
+# Clé de route de FakeSearchServer -> fichier de réponse enregistrée
+ROUTES = {
+    'search': 'search.json',
+    'suggest': 'suggest.json',
+    'nearby': 'nearby.json',
+    'multi_type': 'multi_type.json',
+}
+
+
+def load_payloads() -> Dict[str, bytes]:
+    """Charger les réponses enregistrées (corps JSON bruts)"""
+    payloads = {}
+    for route, filename in ROUTES.items():
+        with open(os.path.join(PAYLOADS_DIR, filename), 'rb') as f:
+            payloads[route] = f.read()
+    return payloads
+
+
+class StubServer(FakeSearchServer):
+    """
+    Serveur de réponses enregistrées exécuté dans un thread
+
+    Example:
+        >>> with StubServer() as server:
+        ...     client = ROMAPISearchClient(base_url=server.base_url)
+        ...     client.search(query="restaurant")
+    """
+
+    def __init__(self, profile: Optional[FaultProfile] = None, host: str = '127.0.0.1', port: int = 0):
+        super().__init__(fixtures=load_payloads(), profile=profile, host=host, port=port)
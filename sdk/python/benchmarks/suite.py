@@ -0,0 +1,227 @@
+"""
+Benchmarks des chemins critiques du SDK
+
+- client : latence de bout en bout contre le serveur local (cache désactivé)
+- transport : surcoût par requête de chaque transport HTTP disponible
+- parsing : coût de ``from_dict`` par résultat et par réponse
+- cache : canonicalisation, génération de clé, écriture et lecture dans CacheUtils
+- codec : encodage et décodage binaires comparés à pickle et JSON
+- geo : calculs de GeoUtils
+"""
+
+import importlib.util
+import json
+import os
+import pickle
+
+from romapi_search import ROMAPISearchClient, GeoLocation, GeoUtils, CacheUtils
+from romapi_search import codec
+from romapi_search.canonical import QueryCanonicalizer
+from romapi_search.transport import TRANSPORTS
+from romapi_search.types import MultiTypeSearchResults, SearchHit, SearchResults, Suggestion
+
+from .harness import benchmark
+from .stub_server import PAYLOADS_DIR
+
+
+def _load_payload(filename: str):
+    with open(os.path.join(PAYLOADS_DIR, filename), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _client(base_url: str) -> ROMAPISearchClient:
+    return ROMAPISearchClient(base_url=base_url, enable_cache=False, retries=0)
+
+
+# Client (bout en bout)
+
+@benchmark('client', rounds=50, needs_server=True)
+def bench_search(base_url):
+    client = _client(base_url)
+    return lambda: client.search(query="restaurant douala", verified=True, limit=20)
+
+
+@benchmark('client', rounds=50, needs_server=True)
+def bench_suggest(base_url):
+    client = _client(base_url)
+    return lambda: client.suggest("rest", limit=8)
+
+
+@benchmark('client', rounds=50, needs_server=True)
+def bench_search_nearby(base_url):
+    client = _client(base_url)
+    return lambda: client.search_nearby(latitude=4.0511, longitude=9.7679, radius=5, query="restaurant")
+
+
+@benchmark('client', rounds=50, needs_server=True)
+def bench_search_multi_type(base_url):
+    client = _client(base_url)
+    return lambda: client.search_multi_type(query="payment")
+
+
+@benchmark('client', rounds=50, needs_server=True)
+def bench_search_cached(base_url):
+    client = ROMAPISearchClient(base_url=base_url, retries=0)
+    client.search(query="restaurant douala", limit=20)
+    return lambda: client.search(query="restaurant douala", limit=20)
+
+
+# Transports HTTP (suggestions : petite réponse, le surcoût du transport domine)
+
+def _transport_available(transport: str) -> bool:
+    if transport != 'http2':
+        return True
+    return all(importlib.util.find_spec(module) for module in ('httpx', 'h2'))
+
+
+def _register_transport_benchmarks(transport: str) -> None:
+    def bench_suggest(base_url):
+        client = ROMAPISearchClient(base_url=base_url, enable_cache=False, retries=0, transport=transport)
+        return lambda: client.suggest("rest", limit=8)
+
+    def bench_search(base_url):
+        client = ROMAPISearchClient(base_url=base_url, enable_cache=False, retries=0, transport=transport)
+        return lambda: client.search(query="restaurant douala", verified=True, limit=20)
+
+    bench_suggest.__name__ = f"bench_suggest_{transport}"
+    bench_search.__name__ = f"bench_search_{transport}"
+    benchmark('transport', rounds=100, needs_server=True)(bench_suggest)
+    benchmark('transport', rounds=50, needs_server=True)(bench_search)
+
+
+for _transport in TRANSPORTS:
+    if _transport_available(_transport):
+        _register_transport_benchmarks(_transport)
+
+
+# Décodage des réponses
+
+@benchmark('parsing', inner=200)
+def bench_search_hit_from_dict():
+    hit_data = _load_payload('search.json')['hits'][0]
+    return lambda: SearchHit.from_dict(hit_data)
+
+
+@benchmark('parsing', inner=20)
+def bench_search_results_from_dict():
+    data = _load_payload('search.json')
+    return lambda: SearchResults.from_dict(data)
+
+
+@benchmark('parsing', inner=20)
+def bench_multi_type_results_from_dict():
+    data = _load_payload('multi_type.json')
+    return lambda: MultiTypeSearchResults.from_dict(data)
+
+
+@benchmark('parsing', inner=200)
+def bench_suggestions_from_dict():
+    data = _load_payload('suggest.json')
+    return lambda: [Suggestion.from_dict(item) for item in data]
+
+
+@benchmark('parsing', inner=20)
+def bench_json_decode_search():
+    with open(os.path.join(PAYLOADS_DIR, 'search.json'), 'rb') as f:
+        body = f.read()
+    return lambda: json.loads(body)
+
+
+# Sérialisation binaire (codec, comparé à pickle et JSON)
+
+@benchmark('codec', inner=20)
+def bench_codec_encode_search():
+    results = SearchResults.from_dict(_load_payload('search.json'))
+    return lambda: codec.encode(results)
+
+
+@benchmark('codec', inner=20)
+def bench_codec_decode_search():
+    data = codec.encode(SearchResults.from_dict(_load_payload('search.json')))
+    return lambda: codec.decode(data)
+
+
+@benchmark('codec', inner=20)
+def bench_pickle_dumps_search():
+    results = SearchResults.from_dict(_load_payload('search.json'))
+    return lambda: pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+@benchmark('codec', inner=20)
+def bench_pickle_loads_search():
+    data = pickle.dumps(SearchResults.from_dict(_load_payload('search.json')), protocol=pickle.HIGHEST_PROTOCOL)
+    return lambda: pickle.loads(data)
+
+
+@benchmark('codec', inner=20)
+def bench_json_loads_from_dict_search():
+    with open(os.path.join(PAYLOADS_DIR, 'search.json'), 'rb') as f:
+        body = f.read()
+    return lambda: SearchResults.from_dict(json.loads(body))
+
+
+@benchmark('codec', inner=20)
+def bench_codec_decode_multi_type():
+    data = codec.encode(MultiTypeSearchResults.from_dict(_load_payload('multi_type.json')))
+    return lambda: codec.decode(data)
+
+
+# Cache local
+
+_CACHE_PARAMS = {
+    'q': 'restaurant douala',
+    'verified': 'true',
+    'categories': 'c1,c2',
+    'page': 1,
+    'limit': 20,
+}
+
+
+@benchmark('cache', inner=1000)
+def bench_cache_generate_key():
+    cache = CacheUtils()
+    return lambda: cache.generate_cache_key('https://api.romapi.com/api/v1/search', _CACHE_PARAMS)
+
+
+@benchmark('cache', inner=1000)
+def bench_cache_canonical_key():
+    cache = CacheUtils()
+    canonicalizer = QueryCanonicalizer()
+    url = 'https://api.romapi.com/api/v1/search'
+    return lambda: cache.generate_cache_key(url, canonicalizer.canonicalize('/search', _CACHE_PARAMS))
+
+
+@benchmark('cache', inner=1000)
+def bench_cache_set():
+    cache = CacheUtils()
+    data = _load_payload('search.json')
+    return lambda: cache.set('key', data, 300)
+
+
+@benchmark('cache', inner=1000)
+def bench_cache_get_hit():
+    cache = CacheUtils()
+    cache.set('key', _load_payload('search.json'), 300)
+    return lambda: cache.get('key')
+
+
+@benchmark('cache', inner=1000)
+def bench_cache_get_miss():
+    cache = CacheUtils()
+    return lambda: cache.get('missing')
+
+
+# Géolocalisation
+
+_DOUALA = GeoLocation(latitude=4.0511, longitude=9.7679)
+_YAOUNDE = GeoLocation(latitude=3.848, longitude=11.502)
+
+
+@benchmark('geo', inner=1000)
+def bench_geo_calculate_distance():
+    return lambda: GeoUtils.calculate_distance(_DOUALA, _YAOUNDE)
+
+
+@benchmark('geo', inner=1000)
+def bench_geo_bounding_box():
+    return lambda: GeoUtils.get_bounding_box(_DOUALA, 10)
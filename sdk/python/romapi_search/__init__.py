@@ -22,36 +22,92 @@ Example:
     >>> suggestions = client.suggest("rest", limit=5)
 """
 
-from .client import ROMAPISearchClient
-from .types import (
-    ResourceType,
-    ResourcePlan,
-    SortField,
-    SortOrder,
-    SuggestionType,
-    SearchParams,
-    SearchResults,
-    SearchHit,
-    Suggestion,
-    GeoLocation,
-    SearchFilters,
-    CategorySearchResults,
-    MultiTypeSearchResults,
-    SearchAnalytics,
-)
-from .exceptions import (
-    ROMAPIError,
-    ValidationError,
-    RateLimitError,
-    NotFoundError,
-    ServerError,
-)
-from .utils import (
-    SearchParamsBuilder,
-    GeoUtils,
-    FormatUtils,
-    CacheUtils,
-)
+from typing import TYPE_CHECKING
+import importlib
+
+# Les sous-modules (et requests/urllib3) ne sont chargés qu'au premier accès
+# à l'un de leurs noms : ``import romapi_search`` reste quasi instantané.
+_LAZY_EXPORTS = {
+    # Client principal
+    "ROMAPISearchClient": ".client",
+    
+    # Types et enums
+    "ResourceType": ".types",
+    "ResourcePlan": ".types",
+    "SortField": ".types",
+    "SortOrder": ".types",
+    "SuggestionType": ".types",
+    
+    # Structures de données
+    "SearchParams": ".types",
+    "SearchResults": ".types",
+    "SearchHit": ".types",
+    "Suggestion": ".types",
+    "GeoLocation": ".types",
+    "SearchFilters": ".types",
+    "CategorySearchResults": ".types",
+    "MultiTypeSearchResults": ".types",
+    "SearchAnalytics": ".types",
+    
+    # Exceptions
+    "ROMAPIError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "RateLimitError": ".exceptions",
+    "NotFoundError": ".exceptions",
+    "ServerError": ".exceptions",
+    
+    # Utilitaires
+    "SearchParamsBuilder": ".utils",
+    "GeoUtils": ".utils",
+    "FormatUtils": ".utils",
+    "CacheUtils": ".utils",
+}
+
+if TYPE_CHECKING:
+    from .client import ROMAPISearchClient
+    from .types import (
+        ResourceType,
+        ResourcePlan,
+        SortField,
+        SortOrder,
+        SuggestionType,
+        SearchParams,
+        SearchResults,
+        SearchHit,
+        Suggestion,
+        GeoLocation,
+        SearchFilters,
+        CategorySearchResults,
+        MultiTypeSearchResults,
+        SearchAnalytics,
+    )
+    from .exceptions import (
+        ROMAPIError,
+        ValidationError,
+        RateLimitError,
+        NotFoundError,
+        ServerError,
+    )
+    from .utils import (
+        SearchParamsBuilder,
+        GeoUtils,
+        FormatUtils,
+        CacheUtils,
+    )
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Mise en cache dans le module : __getattr__ n'est appelé qu'une fois par nom
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 __version__ = "1.0.0"
 __author__ = "ROMAPI Team"
@@ -0,0 +1,257 @@
+"""
+Répartition de charge entre plusieurs réplicas de l'API
+
+Le client construit un ``LoadBalancer`` lorsqu'il reçoit plusieurs URLs de
+base. Chaque ``Replica`` possède son propre transport (et donc son pool de
+connexions) ; le choix d'un réplica suit l'algorithme des deux choix
+aléatoires (« power of two choices ») : deux réplicas disponibles sont tirés
+au hasard et celui dont le score ``latence moyenne × (requêtes en cours + 1)``
+est le plus faible est retenu.
+
+Un réplica est éjecté (éjection passive) après ``max_failures`` échecs
+consécutifs : erreur réseau, timeout ou réponse 5xx. Il est réintégré dès
+qu'une sonde de santé (``GET /health/live``) réussit ; les sondes sont
+envoyées par un thread d'arrière-plan toutes les ``probe_interval``
+secondes, ou, sans thread, le réplica est réintégré à l'essai après
+``ejection_time`` secondes.
+
+Example:
+    >>> client = ROMAPISearchClient(base_url=[
+    ...     "https://eu.api.romapi.com/api/v1",
+    ...     "https://af.api.romapi.com/api/v1",
+    ... ])
+    >>> client.search(query="restaurant")
+    >>> client.balancer.snapshot()
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from .exceptions import ROMAPIError, ValidationError
+
+logger = logging.getLogger(__name__)
+
+HEALTH_ENDPOINT = '/health/live'
+
+
+class Replica:
+    """
+    Réplica de l'API et son état observé
+
+    Args:
+        base_url: URL de base du réplica
+        transport: Transport dédié au réplica
+    """
+
+    def __init__(self, base_url: str, transport: Any):
+        self.base_url = base_url.rstrip('/')
+        self.transport = transport
+        self.in_flight = 0
+        self.latency: Optional[float] = None
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.ejections = 0
+        self.ejected_until: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def ejected(self) -> bool:
+        return self.ejected_until is not None
+
+    def score(self) -> float:
+        """Coût estimé d'une nouvelle requête (plus faible = préférable)"""
+        # Réplica encore jamais mesuré : exploré en priorité
+        return (self.latency or 0.0) * (self.in_flight + 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'base_url': self.base_url,
+            'in_flight': self.in_flight,
+            'latency': self.latency,
+            'requests': self.requests,
+            'failures': self.failures,
+            'ejections': self.ejections,
+            'ejected': self.ejected,
+            'last_error': self.last_error,
+        }
+
+
+class LoadBalancer:
+    """
+    Choix du réplica par requête, éjection passive et sondes de santé
+
+    Args:
+        replicas: Réplicas (URL de base et transport dédié)
+        max_failures: Échecs consécutifs avant éjection (défaut: 3)
+        ejection_time: Durée minimale d'éjection en secondes (défaut: 30)
+        probe_interval: Intervalle des sondes de santé en secondes
+            (défaut: 10, None pour ne pas démarrer de thread)
+        probe_timeout: Timeout d'une sonde en secondes (défaut: 2)
+        latency_decay: Poids d'une nouvelle mesure dans la moyenne mobile
+            exponentielle de latence (défaut: 0.3)
+        seed: Graine du tirage aléatoire (reproductibilité)
+
+    Raises:
+        ValidationError: Si la liste de réplicas est vide
+    """
+
+    def __init__(
+        self,
+        replicas: Sequence[Replica],
+        max_failures: int = 3,
+        ejection_time: float = 30.0,
+        probe_interval: Optional[float] = 10.0,
+        probe_timeout: float = 2.0,
+        latency_decay: float = 0.3,
+        seed: Optional[int] = None
+    ):
+        if not replicas:
+            raise ValidationError("Au moins un réplica est requis")
+        self.replicas: List[Replica] = list(replicas)
+        self.max_failures = max_failures
+        self.ejection_time = ejection_time
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self.latency_decay = latency_decay
+        self.headers: Dict[str, str] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._prober: Optional[threading.Thread] = None
+
+    def acquire(self) -> Replica:
+        """
+        Choisir le réplica d'une requête et le marquer comme occupé
+
+        Returns:
+            Replica: Réplica à utiliser (à rendre avec ``release``)
+        """
+        now = time.monotonic()
+        with self._lock:
+            # Sans sonde active, les réplicas éjectés depuis assez longtemps sont réessayés
+            candidates = [
+                replica for replica in self.replicas
+                if not replica.ejected or (self.probe_interval is None and replica.ejected_until <= now)
+            ]
+            if not candidates:
+                # Tous éjectés : mieux vaut tenter le moins récemment éjecté que d'échouer
+                candidates = [min(self.replicas, key=lambda replica: replica.ejected_until)]
+
+            if len(candidates) == 1:
+                replica = candidates[0]
+            else:
+                first, second = self._random.sample(candidates, 2)
+                replica = first if first.score() <= second.score() else second
+            replica.in_flight += 1
+            return replica
+
+    def release(self, replica: Replica, elapsed: float, error: Optional[BaseException] = None) -> None:
+        """
+        Rendre un réplica après une requête
+
+        Args:
+            replica: Réplica obtenu avec ``acquire``
+            elapsed: Durée de la requête en secondes
+            error: Échec de la requête (erreur réseau, timeout ou 5xx)
+        """
+        with self._lock:
+            replica.in_flight -= 1
+            replica.requests += 1
+            if error is None:
+                replica.consecutive_failures = 0
+                if replica.latency is None:
+                    replica.latency = elapsed
+                else:
+                    replica.latency += self.latency_decay * (elapsed - replica.latency)
+                if replica.ejected:
+                    self._reinstate(replica)
+                return
+
+            replica.failures += 1
+            replica.consecutive_failures += 1
+            replica.last_error = str(error)
+            if not replica.ejected and replica.consecutive_failures >= self.max_failures:
+                self._eject(replica)
+
+    def _eject(self, replica: Replica) -> None:
+        replica.ejected_until = time.monotonic() + self.ejection_time
+        replica.ejections += 1
+        logger.warning("Replica %s ejected after %d failures", replica.base_url, replica.consecutive_failures)
+        self._start_prober()
+
+    def _reinstate(self, replica: Replica) -> None:
+        replica.ejected_until = None
+        replica.consecutive_failures = 0
+        logger.info("Replica %s reinstated", replica.base_url)
+
+    def probe(self, replica: Replica) -> bool:
+        """
+        Envoyer une sonde de santé à un réplica
+
+        Un succès réintègre le réplica ; un échec l'éjecte (ou prolonge son éjection).
+
+        Returns:
+            bool: True si le réplica répond correctement
+        """
+        try:
+            response = replica.transport.request(
+                'GET',
+                f"{replica.base_url}{HEALTH_ENDPOINT}",
+                headers=self.headers,
+                timeout=self.probe_timeout
+            )
+            healthy = response.ok
+            error = None if healthy else f"HTTP {response.status_code}"
+        except ROMAPIError as e:
+            healthy = False
+            error = str(e)
+
+        with self._lock:
+            if healthy:
+                if replica.ejected:
+                    self._reinstate(replica)
+            else:
+                replica.last_error = error
+                if replica.ejected:
+                    replica.ejected_until = time.monotonic() + self.ejection_time
+                else:
+                    self._eject(replica)
+        return healthy
+
+    def probe_ejected(self) -> None:
+        """Sonder les réplicas éjectés dont la durée d'éjection est écoulée"""
+        now = time.monotonic()
+        for replica in self.replicas:
+            ejected_until = replica.ejected_until
+            if ejected_until is not None and ejected_until <= now:
+                self.probe(replica)
+
+    def _start_prober(self) -> None:
+        if self.probe_interval is None or self._prober is not None or self._stop.is_set():
+            return
+        self._prober = threading.Thread(target=self._probe_loop, name='romapi-health-probe', daemon=True)
+        self._prober.start()
+
+    def _probe_loop(self) -> None:
+        # Le thread s'arrête de lui-même lorsque plus aucun réplica n'est éjecté
+        while not self._stop.wait(self.probe_interval):
+            self.probe_ejected()
+            with self._lock:
+                if not any(replica.ejected for replica in self.replicas):
+                    self._prober = None
+                    return
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """État de chaque réplica"""
+        with self._lock:
+            return [replica.to_dict() for replica in self.replicas]
+
+    def close(self) -> None:
+        """Arrêter les sondes et fermer les transports des réplicas"""
+        self._stop.set()
+        for transport in {id(replica.transport): replica.transport for replica in self.replicas}.values():
+            transport.close()
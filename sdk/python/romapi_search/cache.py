@@ -0,0 +1,225 @@
+"""
+Backends de cache partagés
+
+Par défaut, ``CacheUtils`` conserve les réponses dans la mémoire du
+processus. Avec un backend, les entrées (réponse, TTL et validateurs
+ETag/Last-Modified) sont sérialisées en octets et stockées dans un cache
+partagé : tous les hôtes d'un cluster profitent des réponses obtenues par
+chacun.
+
+- ``MemoryCacheBackend`` : backend en mémoire (un processus, ou tests) ;
+- ``RedisCacheBackend`` : serveur Redis (ou compatible) via un client
+  ``redis-py`` ; nécessite ``pip install romapi-search-sdk[redis]`` sauf si
+  un client compatible est fourni (par exemple ``testing.FakeRedis``).
+
+Un backend indisponible ne fait pas échouer les requêtes : les erreurs sont
+journalisées et traitées comme des absences du cache.
+
+``cache_policy_scope`` applique une ``CachePolicy`` aux requêtes d'un bloc
+(dans ce thread) : les entrées plus anciennes que ``max_age`` sont
+rafraîchies auprès de l'API (ou le cache est contourné avec ``bypass``), et
+la politique compte les lectures servies par le cache.
+
+Example:
+    >>> backend = RedisCacheBackend("redis://cache.internal:6379/0")
+    >>> client = ROMAPISearchClient(cache_backend=backend)
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CachePolicy:
+    """
+    Politique de lecture du cache pour les requêtes d'un bloc
+
+    Args:
+        max_age: Âge maximum, en secondes, d'une entrée servie depuis le
+            cache ; au-delà, la requête est envoyée (revalidation
+            conditionnelle si l'entrée a un validateur) et l'entrée
+            rafraîchie (défaut: None, TTL du cache)
+        bypass: Ni lire ni écrire le cache : les réponses (exports massifs,
+            lectures uniques) n'y occupent pas de mémoire (défaut: False)
+
+    Attributes:
+        hits: Requêtes servies par le cache
+        misses: Requêtes envoyées à l'API (absentes, expirées ou trop anciennes)
+    """
+
+    def __init__(self, max_age: Optional[float] = None, bypass: bool = False):
+        self.max_age = max_age
+        self.bypass = bypass
+        self.hits = 0
+        self.misses = 0
+
+    def accepts(self, age: Optional[float]) -> bool:
+        """Une entrée de cet âge peut-elle être servie ?"""
+        return self.max_age is None or (age is not None and age <= self.max_age)
+
+
+_local = threading.local()
+
+
+def current_cache_policy() -> Optional[CachePolicy]:
+    """Politique de cache du thread courant (None hors d'un ``cache_policy_scope``)"""
+    return getattr(_local, 'policy', None)
+
+
+@contextmanager
+def cache_policy_scope(policy: CachePolicy) -> Iterator[CachePolicy]:
+    """Appliquer une politique de cache aux requêtes du bloc (dans ce thread)"""
+    previous = current_cache_policy()
+    _local.policy = policy
+    try:
+        yield policy
+    finally:
+        _local.policy = previous
+
+
+class CacheBackend:
+    """
+    Interface des backends de cache (clés textuelles, valeurs en octets)
+
+    ``get_many`` doit être surchargée lorsque le backend sait lire plusieurs
+    clés en un aller-retour.
+    """
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Valeur d'une clé (None si absente ou expirée)"""
+        raise NotImplementedError
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        """Valeurs de plusieurs clés, dans l'ordre des clés"""
+        return [self.get(key) for key in keys]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Écrire une valeur avec une durée de vie en secondes"""
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """Supprimer une clé"""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Supprimer toutes les clés du backend"""
+        raise NotImplementedError
+
+    def size(self) -> int:
+        """Nombre de clés stockées"""
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Backend en mémoire avec expiration (thread-safe)"""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[bytes, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            with self._lock:
+                self._entries.pop(key, None)
+            return None
+        return entry[0]
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def size(self):
+        now = time.monotonic()
+        return sum(1 for _, expires_at in list(self._entries.values()) if expires_at > now)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Backend Redis (protocole RESP) via un client ``redis-py``
+
+    Les clés sont préfixées pour isoler le cache du SDK des autres données
+    de la base ; ``clear()`` et ``size()`` ne parcourent que ce préfixe.
+
+    Args:
+        url: URL du serveur (défaut: redis://localhost:6379/0)
+        client: Client compatible redis-py déjà construit (prioritaire sur ``url``)
+        prefix: Préfixe des clés (défaut: 'romapi:')
+
+    Raises:
+        ImportError: Si redis-py n'est pas installé et qu'aucun client n'est fourni
+    """
+
+    def __init__(self, url: str = 'redis://localhost:6379/0', client: Any = None, prefix: str = 'romapi:'):
+        # Import à la construction : les erreurs redis-py sont interceptées même avec un client fourni
+        try:
+            import redis
+        except ImportError:
+            if client is None:
+                raise ImportError(
+                    "The Redis cache backend requires redis-py: pip install romapi-search-sdk[redis]"
+                )
+            redis = None
+        self._errors: Tuple[type, ...] = (redis.RedisError, OSError) if redis is not None else (OSError,)
+        if client is None:
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key):
+        try:
+            return self.client.get(self.prefix + key)
+        except self._errors as e:
+            logger.warning("Redis cache read failed: %s", e)
+            return None
+
+    def get_many(self, keys):
+        if not keys:
+            return []
+        try:
+            return list(self.client.mget([self.prefix + key for key in keys]))
+        except self._errors as e:
+            logger.warning("Redis cache read failed: %s", e)
+            return [None] * len(keys)
+
+    def set(self, key, value, ttl):
+        try:
+            self.client.set(self.prefix + key, value, px=max(int(ttl * 1000), 1))
+        except self._errors as e:
+            logger.warning("Redis cache write failed: %s", e)
+
+    def delete(self, key):
+        try:
+            self.client.delete(self.prefix + key)
+        except self._errors as e:
+            logger.warning("Redis cache delete failed: %s", e)
+
+    def clear(self):
+        try:
+            keys = list(self.client.scan_iter(match=self.prefix + '*'))
+            # Suppression par lots pour ne pas bloquer le serveur
+            for start in range(0, len(keys), 500):
+                self.client.delete(*keys[start:start + 500])
+        except self._errors as e:
+            logger.warning("Redis cache clear failed: %s", e)
+
+    def size(self):
+        try:
+            return sum(1 for _ in self.client.scan_iter(match=self.prefix + '*'))
+        except self._errors as e:
+            logger.warning("Redis cache size failed: %s", e)
+            return 0
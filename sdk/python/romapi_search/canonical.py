@@ -0,0 +1,263 @@
+"""
+Canonicalisation des requêtes pour les clés de cache
+
+La clé de cache est calculée à partir des paramètres de requête : sans
+canonicalisation, "Restaurant  Douala" et "restaurant douala", ou les mêmes
+catégories dans un autre ordre, occupent des entrées distinctes et coûtent
+chacune un appel à l'API. ``QueryCanonicalizer`` réécrit les paramètres
+avant le calcul de la clé (la requête envoyée reste inchangée) :
+
+- textes (``q``) nettoyés par ``FormatUtils.sanitize_query`` puis mis en
+  minuscules (sauf pour les suggestions, dont la casse de la saisie est
+  conservée), accents retirés en option ;
+- listes (``categories``, ``tags``...) triées et dédoublonnées ;
+- nombres normalisés (``20``, ``"20"`` et ``20.0`` donnent ``"20"``) ;
+- paramètres égaux à la valeur par défaut du serveur retirés.
+
+Les règles sont définies par endpoint (motifs ``fnmatch``). Pour mesurer le
+gain, ``stats['raw_hits']`` estime les succès qu'aurait obtenus le cache sans
+canonicalisation, à comparer à ``stats['hits']``.
+
+Example:
+    >>> canonicalizer = QueryCanonicalizer()
+    >>> canonicalizer.canonicalize('/search', {'q': 'Restaurant  Douala', 'page': 1, 'limit': 20})
+    {'q': 'restaurant douala'}
+"""
+
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from .utils import FormatUtils
+
+# Paramètres numériques connus de l'API
+NUMBER_PARAMS = (
+    'page', 'limit', 'minPrice', 'maxPrice', 'latitude', 'longitude', 'lat', 'lon', 'radius', 'maxDepth',
+)
+
+# Paramètres multi-valeurs sans ordre significatif (filtres combinés)
+LIST_PARAMS = ('categories', 'resourceTypes', 'includeTypes', 'plans', 'tags')
+
+
+@dataclass
+class CanonicalRules:
+    """
+    Règles de canonicalisation des paramètres d'un endpoint
+
+    Args:
+        text_params: Paramètres textuels nettoyés (défaut: ``q``)
+        list_params: Paramètres multi-valeurs (séparés par des virgules) triés
+        number_params: Paramètres numériques normalisés
+        defaults: Valeurs par défaut du serveur, retirées de la clé
+        fold_case: Mettre les textes en minuscules (défaut: True)
+        fold_accents: Retirer les accents des textes (défaut: False)
+    """
+    text_params: Tuple[str, ...] = ('q',)
+    list_params: Tuple[str, ...] = LIST_PARAMS
+    number_params: Tuple[str, ...] = NUMBER_PARAMS
+    defaults: Dict[str, Any] = field(default_factory=dict)
+    fold_case: bool = True
+    fold_accents: bool = False
+
+
+_PAGED_DEFAULTS = {'page': 1, 'limit': 20, 'sort': 'relevance', 'order': 'desc'}
+
+# Valeurs par défaut des endpoints de l'API (du plus spécifique au plus général)
+DEFAULT_ENDPOINT_RULES: Dict[str, Optional[CanonicalRules]] = {
+    '/search': CanonicalRules(defaults=_PAGED_DEFAULTS),
+    '/search/nearby': CanonicalRules(defaults={**_PAGED_DEFAULTS, 'radius': 10}),
+    '/search/categories/*/hierarchy': CanonicalRules(defaults={
+        **_PAGED_DEFAULTS, 'includeSubcategories': True, 'maxDepth': 3, 'showCounts': True,
+    }),
+    '/search/categories/*': CanonicalRules(defaults=_PAGED_DEFAULTS),
+    '/search/category/*': CanonicalRules(defaults=_PAGED_DEFAULTS),
+    '/search/type/*': CanonicalRules(defaults=_PAGED_DEFAULTS),
+    '/search/multi-type': CanonicalRules(defaults={
+        **_PAGED_DEFAULTS, 'groupByType': True, 'globalRelevanceSort': True,
+    }),
+    # Suggestions : les complétions suivent la casse de la saisie, qui reste dans la clé
+    '/search/suggest': CanonicalRules(fold_case=False, defaults={'limit': 10, 'includePopular': True}),
+    '/search/suggest/smart': CanonicalRules(fold_case=False, defaults={'limit': 10}),
+}
+
+
+def fold_accents(text: str) -> str:
+    """Retirer les accents d'un texte ("Yaoundé" -> "Yaounde")"""
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def _format_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def _format_number(value: Any) -> str:
+    if isinstance(value, bool):
+        return _format_value(value)
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return _format_value(value)
+    if number.is_integer() and abs(number) < 1e15:
+        return str(int(number))
+    return repr(number)
+
+
+class QueryCanonicalizer:
+    """
+    Réécrit les paramètres de requête sous une forme canonique pour le cache
+
+    Args:
+        rules: Règles des endpoints sans règle spécifique (défaut: textes,
+            listes et nombres normalisés, sans valeurs par défaut)
+        endpoints: Règles par motif d'endpoint, prioritaires sur
+            ``DEFAULT_ENDPOINT_RULES`` ; None désactive la canonicalisation
+            d'un endpoint
+        max_tracked: Requêtes brutes suivies au maximum pour estimer le taux
+            de succès sans canonicalisation (défaut: 10000)
+
+    Attributes:
+        stats: Compteurs : ``lookups`` (lectures du cache), ``hits``
+            (succès du cache), ``raw_hits`` (succès estimés sans
+            canonicalisation)
+
+    Example:
+        >>> canonicalizer = QueryCanonicalizer(endpoints={
+        ...     '/search': CanonicalRules(fold_accents=True, defaults={'page': 1, 'limit': 20}),
+        ...     '/search/nearby': None,
+        ... })
+    """
+
+    def __init__(
+        self,
+        rules: Optional[CanonicalRules] = None,
+        endpoints: Optional[Mapping[str, Optional[CanonicalRules]]] = None,
+        max_tracked: int = 10000
+    ):
+        self.rules = rules or CanonicalRules()
+        self.endpoints: Dict[str, Optional[CanonicalRules]] = dict(endpoints or {})
+        for pattern, endpoint_rules in DEFAULT_ENDPOINT_RULES.items():
+            self.endpoints.setdefault(pattern, endpoint_rules)
+        self.max_tracked = max_tracked
+        self.stats: Dict[str, int] = {'lookups': 0, 'hits': 0, 'raw_hits': 0}
+        # Requête brute -> date de la dernière écriture qu'aurait faite un cache sans canonicalisation
+        self._raw_writes: 'OrderedDict[Tuple, float]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._resolved: Dict[str, Optional[CanonicalRules]] = {}
+
+    def rules_for(self, endpoint: str) -> Optional[CanonicalRules]:
+        """Règles applicables à un endpoint (None si désactivée)"""
+        try:
+            return self._resolved[endpoint]
+        except KeyError:
+            pass
+        rules = self.rules
+        for pattern, endpoint_rules in self.endpoints.items():
+            if fnmatchcase(endpoint, pattern):
+                rules = endpoint_rules
+                break
+        if len(self._resolved) < 1000:
+            self._resolved[endpoint] = rules
+        return rules
+
+    def canonicalize(self, endpoint: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Forme canonique des paramètres d'une requête
+
+        Args:
+            endpoint: Endpoint de la requête
+            params: Paramètres de requête
+
+        Returns:
+            Dict: Paramètres canoniques (valeurs textuelles), ou paramètres
+            inchangés si la canonicalisation est désactivée pour l'endpoint
+        """
+        params = params or {}
+        rules = self.rules_for(endpoint)
+        if rules is None:
+            return params
+
+        canonical = {}
+        for name, value in params.items():
+            if value is None:
+                continue
+            if name in rules.text_params:
+                text = FormatUtils.sanitize_query(str(value))
+                if rules.fold_case:
+                    text = text.casefold()
+                if rules.fold_accents:
+                    text = fold_accents(text)
+                if not text:
+                    continue
+                canonical[name] = text
+            elif name in rules.list_params:
+                items = value.split(',') if isinstance(value, str) else [_format_value(item) for item in value]
+                items = sorted({item.strip() for item in items if item and item.strip()})
+                if not items:
+                    continue
+                canonical[name] = ','.join(items)
+            elif name in rules.number_params:
+                canonical[name] = _format_number(value)
+            else:
+                canonical[name] = _format_value(value)
+
+            default = rules.defaults.get(name)
+            if default is not None and canonical[name] == self._default_value(name, default, rules):
+                del canonical[name]
+        return canonical
+
+    @staticmethod
+    def _default_value(name: str, default: Any, rules: CanonicalRules) -> str:
+        return _format_number(default) if name in rules.number_params else _format_value(default)
+
+    def observe(self, endpoint: str, params: Optional[Dict[str, Any]], hit: bool, ttl: float) -> None:
+        """
+        Compter une lecture du cache et estimer son issue sans canonicalisation
+
+        Un cache indexé par les paramètres bruts est simulé : une requête
+        brute y est un succès si la même requête brute y a été écrite depuis
+        moins de ``ttl`` secondes.
+
+        Args:
+            endpoint: Endpoint de la requête
+            params: Paramètres de requête bruts
+            hit: Lecture servie par le cache (clé canonique)
+            ttl: Durée de vie des entrées du cache
+        """
+        raw = (endpoint, tuple(sorted((name, str(value)) for name, value in (params or {}).items())))
+        now = time.monotonic()
+        with self._lock:
+            self.stats['lookups'] += 1
+            self.stats['hits'] += hit
+            written_at = self._raw_writes.get(raw)
+            if written_at is not None and now - written_at <= ttl:
+                self.stats['raw_hits'] += 1
+                self._raw_writes.move_to_end(raw)
+                return
+            self._raw_writes[raw] = now
+            self._raw_writes.move_to_end(raw)
+            while len(self._raw_writes) > self.max_tracked:
+                self._raw_writes.popitem(last=False)
+
+    @property
+    def hit_ratio(self) -> float:
+        """Taux de succès du cache (clés canoniques)"""
+        lookups = self.stats['lookups']
+        return self.stats['hits'] / lookups if lookups else 0.0
+
+    @property
+    def raw_hit_ratio(self) -> float:
+        """Taux de succès estimé sans canonicalisation (clés brutes)"""
+        lookups = self.stats['lookups']
+        return self.stats['raw_hits'] / lookups if lookups else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Compteurs et taux de succès avec et sans canonicalisation"""
+        with self._lock:
+            return {**self.stats, 'hit_ratio': self.hit_ratio, 'raw_hit_ratio': self.raw_hit_ratio}
@@ -0,0 +1,164 @@
+"""
+Interface en ligne de commande du SDK ROMAPI Search
+
+Usage:
+    romapi-search loadtest queries.jsonl --qps 50 --duration 60
+    romapi-search loadtest queries.jsonl --workers 16 --requests 10000 --json report.json
+    romapi-search loadtest queries.jsonl --qps 50 --fake-server --latency-ms 20 --error-rate 0.01
+    romapi-search fake-server --port 8080 --rate-limit 100 --reset-rate 0.001
+"""
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from . import __version__
+from .client import ROMAPISearchClient
+from .exceptions import ROMAPIError
+from .loadtest import LoadGenerator, load_query_log
+from .testing import FakeSearchServer, FaultProfile, LogNormalLatency, SyntheticCatalogue
+
+
+def _add_fault_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("pathologies du faux serveur")
+    group.add_argument('--latency-ms', type=float, default=0.0, help="Latence médiane en millisecondes")
+    group.add_argument('--latency-sigma', type=float, default=0.5,
+                       help="Dispersion log-normale de la latence (défaut: 0.5)")
+    group.add_argument('--rate-limit', type=int, help="Requêtes autorisées par fenêtre (réponses 429 au-delà)")
+    group.add_argument('--rate-limit-window', type=float, default=60.0,
+                       help="Durée de la fenêtre de limitation en secondes (défaut: 60)")
+    group.add_argument('--error-rate', type=float, default=0.0, help="Probabilité de déclencher une rafale 5xx")
+    group.add_argument('--error-burst', type=int, default=1, help="Longueur des rafales 5xx (défaut: 1)")
+    group.add_argument('--slow-body-bps', type=float, help="Débit d'envoi des corps en octets par seconde")
+    group.add_argument('--reset-rate', type=float, default=0.0, help="Probabilité de réinitialiser la connexion")
+    group.add_argument('--catalogue-size', type=int, default=500, help="Taille du catalogue synthétique")
+    group.add_argument('--seed', type=int, help="Graine des tirages aléatoires")
+
+
+def _fake_server_from_args(args: argparse.Namespace, host: str = '127.0.0.1', port: int = 0) -> FakeSearchServer:
+    profile = FaultProfile(
+        latency=LogNormalLatency(args.latency_ms / 1000, args.latency_sigma) if args.latency_ms > 0 else None,
+        rate_limit=args.rate_limit,
+        rate_limit_window=args.rate_limit_window,
+        error_rate=args.error_rate,
+        error_burst=args.error_burst,
+        slow_body_bytes_per_second=args.slow_body_bps,
+        reset_rate=args.reset_rate,
+        seed=args.seed
+    )
+    catalogue = SyntheticCatalogue(size=args.catalogue_size, seed=args.seed or 0)
+    return FakeSearchServer(profile=profile, catalogue=catalogue, host=host, port=port)
+
+
+def _add_loadtest_parser(subparsers) -> None:
+    parser = subparsers.add_parser(
+        'loadtest',
+        help="Rejouer un journal de requêtes et mesurer les latences",
+        description="Rejoue un journal JSONL (search/suggest/nearby) à cadence fixe "
+                    "(boucle ouverte) ou avec N workers (boucle fermée)."
+    )
+    parser.add_argument('query_log', help="Journal de requêtes JSONL")
+    parser.add_argument('--base-url', default='https://api.romapi.com/api/v1', help="URL de base de l'API")
+    parser.add_argument('--api-key', help="Clé API")
+    parser.add_argument('--timeout', type=float, default=30.0, help="Timeout des requêtes en secondes")
+    parser.add_argument('--retries', type=int, default=0, help="Nombre de tentatives du client (défaut: 0)")
+    parser.add_argument('--no-cache', action='store_true', help="Désactiver le cache local du client")
+
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument('--qps', type=float, help="Cadence cible en boucle ouverte")
+    mode.add_argument('--workers', type=int, help="Nombre de workers en boucle fermée")
+
+    parser.add_argument('--duration', type=float, help="Durée maximale en secondes")
+    parser.add_argument('--requests', type=int, help="Nombre maximum de requêtes (défaut: une passe du journal)")
+    parser.add_argument('--max-concurrency', type=int, default=64,
+                        help="Requêtes simultanées maximum en boucle ouverte (défaut: 64)")
+    parser.add_argument('--json', dest='json_output', help="Écrire le rapport JSON dans ce fichier ('-' pour stdout)")
+    parser.add_argument('--fake-server', action='store_true',
+                        help="Cibler un faux serveur local (ignore --base-url)")
+    _add_fault_arguments(parser)
+    parser.set_defaults(handler=_run_loadtest)
+
+
+def _run_loadtest(args: argparse.Namespace) -> int:
+    entries = load_query_log(args.query_log)
+    server = _fake_server_from_args(args).start() if args.fake_server else None
+    try:
+        return _replay(args, entries, server.base_url if server else args.base_url)
+    finally:
+        if server:
+            server.stop()
+
+
+def _replay(args: argparse.Namespace, entries, base_url: str) -> int:
+    client = ROMAPISearchClient(
+        base_url=base_url,
+        api_key=args.api_key,
+        timeout=args.timeout,
+        retries=args.retries,
+        enable_cache=not args.no_cache
+    )
+
+    generator = LoadGenerator(client, entries)
+    report = generator.run(
+        qps=args.qps,
+        workers=args.workers,
+        duration=args.duration,
+        max_requests=args.requests,
+        max_concurrency=args.max_concurrency
+    )
+
+    if args.json_output == '-':
+        json.dump(report.to_dict(), sys.stdout, indent=2)
+        print()
+    else:
+        print(report.format())
+        if args.json_output:
+            with open(args.json_output, 'w', encoding='utf-8') as f:
+                json.dump(report.to_dict(), f, indent=2)
+    return 0
+
+
+def _add_fake_server_parser(subparsers) -> None:
+    parser = subparsers.add_parser(
+        'fake-server',
+        help="Démarrer un faux serveur de l'API de recherche",
+        description="Sert les endpoints de recherche à partir d'un catalogue synthétique, "
+                    "avec latence, limitation de débit, erreurs 5xx, corps lents et resets injectés."
+    )
+    parser.add_argument('--host', default='127.0.0.1', help="Adresse d'écoute (défaut: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8080, help="Port d'écoute (défaut: 8080)")
+    _add_fault_arguments(parser)
+    parser.set_defaults(handler=_run_fake_server)
+
+
+def _run_fake_server(args: argparse.Namespace) -> int:
+    server = _fake_server_from_args(args, host=args.host, port=args.port)
+    print(f"Faux serveur à l'écoute sur {server.base_url}", flush=True)
+    server.serve_forever()
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='romapi-search', description="Outils du SDK ROMAPI Search")
+    parser.add_argument('--version', action='version', version=f"%(prog)s {__version__}")
+    subparsers = parser.add_subparsers(dest='command')
+    _add_loadtest_parser(subparsers)
+    _add_fake_server_parser(subparsers)
+
+    args = parser.parse_args(argv)
+    if not getattr(args, 'handler', None):
+        parser.print_help()
+        return 2
+
+    try:
+        return args.handler(args)
+    except ROMAPIError as e:
+        print(f"Erreur: {e.message}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+
+
+if __name__ == '__main__':
+    sys.exit(main())
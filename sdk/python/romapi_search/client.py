@@ -2,13 +2,15 @@
 Client principal pour l'API de recherche ROMAPI
 """
 
+import heapq
 import json
+import logging
 import time
-from typing import Dict, List, Optional, Any, Union
-from urllib.parse import urlencode, urljoin
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Any, Sequence, Tuple, Union
+from urllib.parse import urlencode, urljoin, urlsplit
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from .types import (
     SearchParams,
@@ -18,8 +20,12 @@ from .types import (
     CategorySearchResults,
     MultiTypeSearchParams,
     MultiTypeSearchResults,
+    TypedSearchResults,
+    RequestMetadata,
+    SearchHit,
     Suggestion,
     SearchAnalytics,
+    PopularTerm,
     GeoLocation,
     ResourceType,
     SortField,
@@ -34,8 +40,35 @@ from .exceptions import (
     RateLimitError,
     NotFoundError,
     ServerError,
+    NetworkError,
 )
 from .utils import CacheUtils
+from .cache import CacheBackend, current_cache_policy
+from .streaming import iter_json_arrays
+from .metrics import ClientMetrics
+from .transport import RequestsTransport, Transport, create_transport
+from .resolver import DNSCache
+from .balancer import HEALTH_ENDPOINT, LoadBalancer, Replica
+from .deadline import Deadline, TimeoutValue, current_deadline, deadline_scope, deadline_sleep
+from .scheduler import RequestScheduler, current_priority, priority_scope
+from .quota import FileQuotaCoordinator
+from .instrumentation import (
+    HOOK_EVENTS,
+    CACHE_HIT,
+    CACHE_MISS,
+    CACHE_REVALIDATED,
+    Hook,
+    RequestEvent,
+    RequestTiming,
+    timing_scope,
+)
+
+if TYPE_CHECKING:
+    from .canonical import QueryCanonicalizer
+    from .prefetch import PredictivePrefetcher, Predictor
+    from .watch import ChangeSet
+
+logger = logging.getLogger(__name__)
 
 
 class ROMAPISearchClient:
@@ -47,13 +80,40 @@ class ROMAPISearchClient:
     la recherche géographique et les analytics.
     
     Args:
-        base_url: URL de base de l'API (défaut: https://api.romapi.com/api/v1)
+        base_url: URL de base de l'API (défaut: https://api.romapi.com/api/v1),
+            ou liste d'URLs de réplicas entre lesquels répartir les requêtes
         api_key: Clé API pour l'authentification (optionnel)
-        timeout: Timeout des requêtes en secondes (défaut: 30.0)
+        timeout: Timeout de chaque tentative en secondes, ou couple
+            (connexion, lecture) (défaut: 30.0)
         retries: Nombre de tentatives en cas d'échec (défaut: 3)
         user_agent: User-Agent personnalisé
         enable_cache: Activer le cache local (défaut: True)
         cache_timeout: Durée de vie du cache en secondes (défaut: 300)
+        cache_backend: Backend de cache partagé entre hôtes, par exemple
+            ``RedisCacheBackend`` (défaut: None, cache dans le processus)
+        enable_metrics: Collecter les métriques dans ``client.metrics`` (défaut: True)
+        transport: Transport HTTP : 'requests' (défaut), 'urllib3' (chemin rapide
+            sans requests) ou 'http2' (httpx), ou une instance de Transport
+        dns_cache_ttl: Durée de vie des résolutions DNS en cache, en secondes
+            (défaut: 60, None pour résoudre à chaque nouvelle connexion)
+        health_check_interval: Intervalle des sondes de santé des réplicas
+            éjectés, en secondes (défaut: 10, None pour les réessayer sans sonde)
+        timeout_budget: Durée maximale de chaque requête, retries et attentes
+            de backoff compris, en secondes (défaut: None, sans limite)
+        max_concurrency: Requêtes en vol au maximum ; au-delà, les requêtes
+            attendent leur tour selon leur priorité (défaut: None, sans file ;
+            avec ``rate_limit`` ou ``shared_quota`` seul, seul le débit est limité)
+        rate_limit: Débit maximum en requêtes par seconde (défaut: None)
+        shared_quota: Partager le quota de la clé API avec les autres clients
+            de la machine : True (fichier d'état par défaut), chemin du
+            fichier d'état, ou coordinateur (défaut: None)
+        prefetch: Précharger en tâche de fond les requêtes suivantes
+            probables : True (page suivante, sous-catégorie principale) ou
+            liste de prédicteurs (défaut: False)
+        canonicalize: Calculer les clés de cache sur une forme canonique des
+            paramètres (casse, espaces, ordre des listes, valeurs par
+            défaut ; casse conservée pour les suggestions) : True, False ou
+            ``QueryCanonicalizer`` configuré (défaut: True)
         
     Example:
         >>> client = ROMAPISearchClient(api_key="your-api-key")
@@ -63,49 +123,122 @@ class ROMAPISearchClient:
 
     def __init__(
         self,
-        base_url: str = "https://api.romapi.com/api/v1",
+        base_url: Union[str, Sequence[str]] = "https://api.romapi.com/api/v1",
         api_key: Optional[str] = None,
-        timeout: float = 30.0,
+        timeout: TimeoutValue = 30.0,
         retries: int = 3,
         user_agent: Optional[str] = None,
         enable_cache: bool = True,
         cache_timeout: int = 300,
+        cache_backend: Optional[CacheBackend] = None,
+        enable_metrics: bool = True,
+        transport: Union[str, Transport] = 'requests',
+        dns_cache_ttl: Optional[float] = 60.0,
+        health_check_interval: Optional[float] = 10.0,
+        timeout_budget: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        shared_quota: Union[None, bool, str, FileQuotaCoordinator] = None,
+        prefetch: Union[bool, Sequence['Predictor']] = False,
+        canonicalize: Union[bool, 'QueryCanonicalizer'] = True,
         **kwargs
     ):
-        self.base_url = base_url.rstrip('/')
+        base_urls = [base_url] if isinstance(base_url, str) else list(base_url)
+        if not base_urls:
+            raise ValidationError("Au moins une URL de base est requise")
+        self.base_urls = [url.rstrip('/') for url in base_urls]
+        # Première URL : clé du cache local et URL des requêtes sans réplicas
+        self.base_url = self.base_urls[0]
         self.api_key = api_key
         self.timeout = timeout
+        self.timeout_budget = timeout_budget
         self.retries = retries
         self.user_agent = user_agent or "romapi-search-sdk-python/1.0.0"
         self.enable_cache = enable_cache
         self.cache_timeout = cache_timeout
         
-        # Configuration de la session HTTP
-        self.session = requests.Session()
-        self.session.headers.update({
+        # En-têtes envoyés avec chaque requête
+        self.headers: Dict[str, str] = {
             'Accept': 'application/json',
             'User-Agent': self.user_agent,
-        })
+        }
         
         if self.api_key:
-            self.session.headers['Authorization'] = f'Bearer {self.api_key}'
-        
-        # Configuration des retries
-        retry_strategy = Retry(
-            total=self.retries,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST"]
+            self.headers['Authorization'] = f'Bearer {self.api_key}'
+        
+        # Cache DNS partagé par les connexions du transport
+        self.dns_cache = DNSCache(ttl=dns_cache_ttl) if dns_cache_ttl else None
+        
+        # Transport HTTP (requests, urllib3 ou http2) avec retries
+        self.transport: Transport = create_transport(
+            transport, retries=self.retries, resolver=self.dns_cache
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        
+        # Plusieurs réplicas : un transport (pool de connexions) par réplica
+        self.balancer: Optional[LoadBalancer] = None
+        if len(self.base_urls) > 1:
+            replicas = [Replica(self.base_url, self.transport)] + [
+                Replica(url, create_transport(transport, retries=self.retries, resolver=self.dns_cache))
+                for url in self.base_urls[1:]
+            ]
+            self.balancer = LoadBalancer(replicas, probe_interval=health_check_interval)
+            self.balancer.headers = self.headers
         
         # Cache local
-        self.cache = CacheUtils() if self.enable_cache else None
+        self.cache = CacheUtils(backend=cache_backend) if self.enable_cache else None
+        
+        # Forme canonique des paramètres pour les clés de cache
+        self.canonicalizer: Optional['QueryCanonicalizer'] = None
+        if canonicalize is True:
+            # Module chargé à la demande : il n'alourdit pas l'import du client
+            from .canonical import QueryCanonicalizer
+            self.canonicalizer = QueryCanonicalizer()
+        elif canonicalize:
+            self.canonicalizer = canonicalize
         
         # Informations de rate limiting
         self.rate_limit_info: Optional[Dict[str, Any]] = None
+        
+        # Quota partagé entre processus (jetons et fenêtre X-RateLimit communs)
+        self.quota: Optional[FileQuotaCoordinator] = None
+        if isinstance(shared_quota, FileQuotaCoordinator):
+            self.quota = shared_quota
+        elif shared_quota:
+            path = shared_quota if isinstance(shared_quota, str) else None
+            self.quota = FileQuotaCoordinator(path=path, api_key=self.api_key, rate=rate_limit)
+        
+        # Ordonnanceur par priorité (pool de connexions et limiteur de débit)
+        self.scheduler: Optional[RequestScheduler] = None
+        if max_concurrency or rate_limit or self.quota:
+            self.scheduler = RequestScheduler(
+                max_concurrency=max_concurrency,
+                rate_limit=rate_limit,
+                limiter=self.quota
+            )
+        
+        # Préchargement prédictif (page suivante, sous-catégorie) dans le cache
+        self.prefetcher: Optional['PredictivePrefetcher'] = None
+        if prefetch:
+            if not self.cache:
+                raise ValidationError("Prefetching requires the cache (enable_cache=True)")
+            # Module chargé à la demande : il n'alourdit pas l'import du client
+            from .prefetch import DEFAULT_PREDICTORS, PredictivePrefetcher
+            self.prefetcher = PredictivePrefetcher(
+                lambda endpoint, params: self._make_request('GET', endpoint, params=params),
+                lambda: self.rate_limit_info,
+                predictors=DEFAULT_PREDICTORS if prefetch is True else prefetch,
+                canonicalize=self.canonicalizer.canonicalize if self.canonicalizer else None
+            )
+        
+        # Hooks d'instrumentation (request, response, error)
+        self._hooks: Dict[str, List[Hook]] = {event: [] for event in HOOK_EVENTS}
+        
+        # Métriques opérationnelles (export Prometheus ou dictionnaire)
+        self.metrics: Optional[ClientMetrics] = None
+        if enable_metrics:
+            self.metrics = ClientMetrics(self)
+            self.add_hook('response', self.metrics.observe_response)
+            self.add_hook('error', self.metrics.observe_error)
 
     def search(
         self,
@@ -158,54 +291,97 @@ class ROMAPISearchClient:
             RateLimitError: Si la limite de taux est dépassée
             ServerError: En cas d'erreur serveur
         """
-        # Validation des paramètres
-        if limit > 100:
-            raise ValidationError("Limit cannot exceed 100")
-        if page < 1:
-            raise ValidationError("Page must be >= 1")
-        if query and len(query) > 200:
-            raise ValidationError("Query cannot exceed 200 characters")
-        
-        # Construction des paramètres
-        params = {}
-        if query:
-            params['q'] = query.strip()
-        if categories:
-            params['categories'] = ','.join(categories)
-        if resource_types:
-            params['resourceTypes'] = ','.join([rt.value for rt in resource_types])
-        if plans:
-            params['plans'] = ','.join(plans)
-        if min_price is not None:
-            params['minPrice'] = min_price
-        if max_price is not None:
-            params['maxPrice'] = max_price
-        if verified is not None:
-            params['verified'] = str(verified).lower()
-        if city:
-            params['city'] = city
-        if region:
-            params['region'] = region
-        if tags:
-            params['tags'] = ','.join(tags)
-        if sort:
-            params['sort'] = sort.value
-        if order:
-            params['order'] = order.value
-        if page:
-            params['page'] = page
-        if limit:
-            params['limit'] = limit
-        if facets:
-            params['facets'] = ','.join(facets)
-        if user_id:
-            params['userId'] = user_id
-        if session_id:
-            params['sessionId'] = session_id
+        params = self._search_params(
+            query, categories, resource_types, plans, min_price, max_price, verified, city,
+            region, tags, sort, order, page, limit, facets, user_id, session_id
+        )
         
         # Effectuer la requête
-        response_data = self._make_request('GET', '/search', params=params)
-        return SearchResults.from_dict(response_data)
+        return self._request_results(SearchResults, '/search', params=params)
+
+    def search_many(self, queries: Sequence[Dict[str, Any]], max_workers: int = 4) -> List[SearchResults]:
+        """
+        Effectue plusieurs recherches, en lisant le cache en un seul aller-retour
+        
+        Les entrées de toutes les recherches sont lues ensemble (``MGET`` avec
+        un backend Redis) ; seules les recherches absentes du cache sont
+        envoyées à l'API, en parallèle.
+        
+        Args:
+            queries: Arguments de ``search`` pour chaque recherche
+            max_workers: Nombre maximum de requêtes simultanées (défaut: 4)
+            
+        Returns:
+            List[SearchResults]: Résultats, dans l'ordre des recherches
+            
+        Raises:
+            ValidationError: Si les paramètres d'une recherche sont invalides
+            
+        Example:
+            >>> client.search_many([{'query': 'restaurant'}, {'query': 'hotel', 'city': 'Douala'}])
+        """
+        params_list = [self._search_params(**query) for query in queries]
+        prefetched: List[Optional[Tuple[Any, Optional[float], Dict[str, str]]]] = [None] * len(params_list)
+        if self.cache:
+            url = urljoin(self.base_url, 'search')
+            keys = [self._cache_key(url, '/search', params) for params in params_list]
+            prefetched = self.cache.lookup_many(keys)
+        
+        results: List[Optional[SearchResults]] = [None] * len(params_list)
+        misses = []
+        for index, params in enumerate(params_list):
+            if prefetched[index] is not None and prefetched[index][0]:
+                results[index] = self._request_results(
+                    SearchResults, '/search', params=params, prefetched=prefetched[index]
+                )
+            else:
+                misses.append(index)
+        
+        if misses:
+            deadline, priority = current_deadline(), current_priority()
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(misses))) as executor:
+                futures = {
+                    executor.submit(
+                        self._in_caller_scope, deadline, priority, self._request_results,
+                        SearchResults, '/search', params_list[index],
+                        # Absence déjà constatée : pas de seconde lecture du cache
+                        prefetched=prefetched[index]
+                    ): index
+                    for index in misses
+                }
+                for future, index in futures.items():
+                    results[index] = future.result()
+        return results
+
+    def watch(
+        self,
+        search_params: Optional[Dict[str, Any]] = None,
+        interval: float = 60.0,
+        **kwargs
+    ) -> Iterator['ChangeSet']:
+        """
+        Suit une recherche et produit ses changements à chaque interrogation
+        
+        Seules les différences sont produites (ressources ajoutées,
+        modifiées ou retirées) ; voir ``romapi_search.watch.SearchWatcher``
+        pour conserver l'état entre deux exécutions.
+        
+        Args:
+            search_params: Arguments de ``search`` (hors tri et pagination)
+            interval: Intervalle entre deux interrogations en secondes (défaut: 60)
+            **kwargs: Options de ``SearchWatcher`` (page_size, full_scan_every, state)
+            
+        Yields:
+            ChangeSet: Changements depuis l'interrogation précédente (la
+            première contient toutes les ressources)
+            
+        Example:
+            >>> for changes in client.watch({'query': 'fintech', 'verified': True}, interval=300):
+            ...     print(len(changes.added), len(changes.updated), len(changes.removed))
+        """
+        from .watch import SearchWatcher
+        
+        return SearchWatcher(self, search_params, **kwargs).watch(interval)
 
     def suggest(
         self,
@@ -346,8 +522,7 @@ class ROMAPISearchClient:
         
         # Utiliser la méthode search avec les paramètres géographiques
         params = self._build_search_params(**kwargs)
-        response_data = self._make_request('GET', '/search/nearby', params=params)
-        return SearchResults.from_dict(response_data)
+        return self._request_results(SearchResults, '/search/nearby', params=params)
 
     def search_by_category(
         self,
@@ -380,8 +555,7 @@ class ROMAPISearchClient:
         })
         
         endpoint = f'/search/categories/{category_id}/hierarchy'
-        response_data = self._make_request('GET', endpoint, params=params)
-        return CategorySearchResults.from_dict(response_data)
+        return self._request_results(CategorySearchResults, endpoint, params=params)
 
     def search_by_category_slug(
         self,
@@ -402,8 +576,7 @@ class ROMAPISearchClient:
         """
         params = self._build_search_params(query=query, **kwargs)
         endpoint = f'/search/categories/{slug}'
-        response_data = self._make_request('GET', endpoint, params=params)
-        return CategorySearchResults.from_dict(response_data)
+        return self._request_results(CategorySearchResults, endpoint, params=params)
 
     def search_multi_type(
         self,
@@ -411,6 +584,7 @@ class ROMAPISearchClient:
         include_types: Optional[List[ResourceType]] = None,
         group_by_type: bool = True,
         global_relevance_sort: bool = False,
+        federated: bool = False,
         **kwargs
     ) -> MultiTypeSearchResults:
         """
@@ -421,11 +595,18 @@ class ROMAPISearchClient:
             include_types: Types de ressources à inclure
             group_by_type: Grouper les résultats par type
             global_relevance_sort: Tri par pertinence globale
+            federated: Interroger chaque type en parallèle côté client
+                (/search/type/:resourceType) au lieu de /search/multi-type
             **kwargs: Autres paramètres de recherche
             
         Returns:
             MultiTypeSearchResults: Résultats groupés par type
         """
+        if federated:
+            return self._search_multi_type_federated(
+                query, include_types, global_relevance_sort, **kwargs
+            )
+        
         params = self._build_search_params(query=query, **kwargs)
         
         if include_types:
@@ -433,8 +614,203 @@ class ROMAPISearchClient:
         params['groupByType'] = str(group_by_type).lower()
         params['globalRelevanceSort'] = str(global_relevance_sort).lower()
         
-        response_data = self._make_request('GET', '/search/multi-type', params=params)
-        return MultiTypeSearchResults.from_dict(response_data)
+        return self._request_results(MultiTypeSearchResults, '/search/multi-type', params=params)
+
+    def search_stream(
+        self,
+        query: Optional[str] = None,
+        chunk_size: int = 65536,
+        **kwargs
+    ) -> Iterator[SearchHit]:
+        """
+        Recherche textuelle en mode streaming
+        
+        La réponse est analysée au fil de l'eau : chaque SearchHit est produit
+        dès qu'il est reçu, sans charger la réponse complète en mémoire.
+        Le cache local n'est pas utilisé.
+        
+        Args:
+            query: Requête de recherche textuelle
+            chunk_size: Taille des blocs lus sur le réseau (octets)
+            **kwargs: Autres paramètres de recherche (voir search)
+            
+        Yields:
+            SearchHit: Résultats dans l'ordre de la réponse
+        """
+        if kwargs.get('limit', 20) > 100:
+            raise ValidationError("Limit cannot exceed 100")
+        if kwargs.get('page', 1) < 1:
+            raise ValidationError("Page must be >= 1")
+        if query and len(query) > 200:
+            raise ValidationError("Query cannot exceed 200 characters")
+        
+        params = self._build_search_params(query=query.strip() if query else None, **kwargs)
+        for _, hit_data in self._stream_request(
+            'GET', '/search', [('hits',)], params=params, chunk_size=chunk_size
+        ):
+            yield SearchHit.from_dict(hit_data)
+
+    def search_multi_type_stream(
+        self,
+        query: Optional[str] = None,
+        include_types: Optional[List[ResourceType]] = None,
+        chunk_size: int = 65536,
+        **kwargs
+    ) -> Iterator[Tuple[ResourceType, SearchHit]]:
+        """
+        Recherche multi-types en mode streaming
+        
+        Args:
+            query: Requête de recherche
+            include_types: Types de ressources à inclure
+            chunk_size: Taille des blocs lus sur le réseau (octets)
+            **kwargs: Autres paramètres de recherche
+            
+        Yields:
+            Tuple[ResourceType, SearchHit]: Type de ressource et résultat,
+            dans l'ordre où ils arrivent
+        """
+        params = self._build_search_params(query=query, **kwargs)
+        if include_types:
+            params['includeTypes'] = ','.join([rt.value for rt in include_types])
+        params['groupByType'] = 'true'
+        params['globalRelevanceSort'] = 'false'
+        
+        for path, hit_data in self._stream_request(
+            'GET', '/search/multi-type', [('resultsByType', '*', 'hits')],
+            params=params, chunk_size=chunk_size
+        ):
+            yield ResourceType(path[1]), SearchHit.from_dict(hit_data)
+
+    def search_by_type(
+        self,
+        resource_type: ResourceType,
+        query: Optional[str] = None,
+        **kwargs
+    ) -> SearchResults:
+        """
+        Recherche dans un seul type de ressource (/search/type/:resourceType)
+        
+        Args:
+            resource_type: Type de ressource
+            query: Requête de recherche optionnelle
+            **kwargs: Autres paramètres de recherche
+            
+        Returns:
+            SearchResults: Résultats pour ce type
+        """
+        params = self._build_search_params(query=query, **kwargs)
+        endpoint = f'/search/type/{resource_type.value}'
+        return self._request_results(SearchResults, endpoint, params=params)
+
+    def search_multi_type_as_completed(
+        self,
+        query: Optional[str] = None,
+        include_types: Optional[List[ResourceType]] = None,
+        max_workers: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[Tuple[ResourceType, SearchResults]]:
+        """
+        Recherche fédérée : un appel par type en parallèle, résultats
+        produits dès que chaque type répond
+        
+        Un type lent ne retarde plus les autres.
+        
+        Args:
+            query: Requête de recherche
+            include_types: Types de ressources à inclure (défaut: tous)
+            max_workers: Nombre maximum d'appels simultanés (défaut: un par type)
+            **kwargs: Autres paramètres de recherche
+            
+        Yields:
+            Tuple[ResourceType, SearchResults]: Type et résultats, dans
+            l'ordre de complétion
+        """
+        types = include_types or list(ResourceType)
+        deadline, priority = current_deadline(), current_priority()
+        executor = ThreadPoolExecutor(max_workers=max_workers or len(types))
+        futures = {
+            executor.submit(
+                self._in_caller_scope, deadline, priority, self.search_by_type, resource_type, query, **kwargs
+            ): resource_type
+            for resource_type in types
+        }
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def search_multi_type_merged(
+        self,
+        query: Optional[str] = None,
+        include_types: Optional[List[ResourceType]] = None,
+        max_pages: int = 1,
+        max_workers: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[SearchHit]:
+        """
+        Recherche fédérée triée par pertinence globale
+        
+        Les premières pages de chaque type sont récupérées en parallèle, puis
+        fusionnées par un tas (k-way merge) sur SearchHit.score. Les pages
+        suivantes ne sont demandées que lorsque la fusion les atteint.
+        
+        Args:
+            query: Requête de recherche
+            include_types: Types de ressources à inclure (défaut: tous)
+            max_pages: Nombre maximum de pages lues par type
+            max_workers: Nombre maximum d'appels simultanés
+            **kwargs: Autres paramètres de recherche
+            
+        Yields:
+            SearchHit: Résultats par score décroissant tous types confondus
+        """
+        first_pages = dict(self.search_multi_type_as_completed(
+            query, include_types, max_workers=max_workers, **kwargs
+        ))
+        streams = [
+            self._iter_type_hits(resource_type, results, query, max_pages, **kwargs)
+            for resource_type, results in first_pages.items()
+        ]
+        yield from heapq.merge(*streams, key=lambda hit: -hit.score)
+
+    def export_stream(
+        self,
+        export_types: List[ResourceType],
+        query: Optional[str] = None,
+        max_results: int = 1000,
+        chunk_size: int = 65536,
+        **kwargs
+    ) -> Iterator[Tuple[ResourceType, Dict[str, Any]]]:
+        """
+        Exporte les résultats par type (/search/multi-type/export) en streaming
+        
+        Args:
+            export_types: Types de ressources à exporter
+            query: Requête de recherche optionnelle
+            max_results: Nombre maximum de résultats par type (max 5000)
+            chunk_size: Taille des blocs lus sur le réseau (octets)
+            **kwargs: Filtres (categories, verified, city, region)
+            
+        Yields:
+            Tuple[ResourceType, Dict]: Type de ressource et enregistrement exporté
+        """
+        if not export_types:
+            raise ValidationError("At least one export type is required")
+        
+        params = self._build_search_params(query=query, **kwargs)
+        params['exportTypes'] = ','.join([rt.value for rt in export_types])
+        params['format'] = 'json'
+        params['maxResults'] = max_results
+        
+        for path, record in self._stream_request(
+            'GET', '/search/multi-type/export', [('*', 'data')],
+            params=params, chunk_size=chunk_size
+        ):
+            yield ResourceType(path[0]), record
 
     def get_category_hierarchy(
         self,
@@ -480,8 +856,36 @@ class ROMAPISearchClient:
             raise ValidationError("API key required for analytics")
         
         params = {'period': period}
-        response_data = self._make_request('GET', '/search/analytics', params=params)
-        return SearchAnalytics.from_dict(response_data)
+        return self._request_results(SearchAnalytics, '/search/analytics', params=params)
+
+    def get_popular_terms(
+        self,
+        limit: int = 50,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> List[PopularTerm]:
+        """
+        Obtient les termes de recherche les plus utilisés
+        
+        Args:
+            limit: Nombre maximum de termes (max 100)
+            date_from: Début de la période (défaut: 30 derniers jours)
+            date_to: Fin de la période (défaut: maintenant)
+            
+        Returns:
+            List[PopularTerm]: Termes par nombre de recherches décroissant
+        """
+        if limit > 100:
+            raise ValidationError("Limit cannot exceed 100 for popular terms")
+        
+        params: Dict[str, Any] = {'limit': limit}
+        if date_from:
+            params['from'] = date_from.isoformat()
+        if date_to:
+            params['to'] = date_to.isoformat()
+        
+        response_data = self._make_request('GET', '/search/analytics/popular-terms', params=params)
+        return [PopularTerm.from_dict(item) for item in response_data]
 
     def search_with_retry(
         self,
@@ -505,18 +909,175 @@ class ROMAPISearchClient:
         for attempt in range(max_retries + 1):
             try:
                 return self.search(**search_params)
-            except (ServerError, requests.RequestException) as e:
+            except (ServerError, NetworkError, requests.RequestException) as e:
                 last_exception = e
                 
                 if attempt == max_retries:
                     break
                 
-                # Attendre avant de réessayer (backoff exponentiel)
+                # Attendre avant de réessayer (backoff exponentiel, dans la limite de l'échéance)
                 delay = backoff_factor * (2 ** attempt)
-                time.sleep(min(delay, 10))  # Max 10 secondes
+                deadline_sleep(min(delay, 10))  # Max 10 secondes
         
         raise last_exception
 
+    def _search_multi_type_federated(
+        self,
+        query: Optional[str],
+        include_types: Optional[List[ResourceType]],
+        global_relevance_sort: bool,
+        **kwargs
+    ) -> MultiTypeSearchResults:
+        """Assemble un MultiTypeSearchResults à partir d'appels par type"""
+        types = include_types or list(ResourceType)
+        results_by_type: Dict[str, TypedSearchResults] = {}
+        pagination_by_type = {}
+        # Les types sont interrogés en parallèle : le temps serveur est le plus long
+        took = 0
+        started = time.perf_counter()
+        type_metadata: List[RequestMetadata] = []
+        
+        for resource_type, results in self.search_multi_type_as_completed(
+            query, types, **kwargs
+        ):
+            if results.request_metadata:
+                type_metadata.append(results.request_metadata)
+            results_by_type[resource_type.value] = TypedSearchResults(
+                hits=results.hits,
+                total=results.total,
+                facets=results.facets
+            )
+            if results.pagination:
+                pagination_by_type[resource_type.value] = results.pagination
+            took = max(took, results.took)
+        
+        # Conserver l'ordre des types demandé
+        results_by_type = {
+            rt.value: results_by_type[rt.value] for rt in types if rt.value in results_by_type
+        }
+        
+        mixed_results = None
+        if global_relevance_sort:
+            mixed_results = list(heapq.merge(
+                *[sorted(typed.hits, key=lambda hit: -hit.score) for typed in results_by_type.values()],
+                key=lambda hit: -hit.score
+            ))
+        
+        # Appels parallèles : durées réseau maximales, coûts du SDK cumulés
+        request_metadata = RequestMetadata(
+            endpoint='/search/type',
+            total_time=time.perf_counter() - started,
+            network_time=max((m.network_time for m in type_metadata), default=0.0),
+            decode_time=sum(m.decode_time for m in type_metadata),
+            build_time=sum(m.build_time for m in type_metadata),
+            server_time=took / 1000,
+            bytes_received=sum(m.bytes_received for m in type_metadata),
+            from_cache=bool(type_metadata) and all(m.from_cache for m in type_metadata),
+            cache_age=max((m.cache_age for m in type_metadata if m.cache_age is not None), default=None),
+            retries=sum(m.retries for m in type_metadata)
+        )
+        
+        return MultiTypeSearchResults(
+            results_by_type=results_by_type,
+            total_across_types=sum(typed.total for typed in results_by_type.values()),
+            took=took,
+            mixed_results=mixed_results,
+            pagination_by_type=pagination_by_type or None,
+            request_metadata=request_metadata
+        )
+
+    def _iter_type_hits(
+        self,
+        resource_type: ResourceType,
+        first_page: SearchResults,
+        query: Optional[str],
+        max_pages: int,
+        **kwargs
+    ) -> Iterator[SearchHit]:
+        """Parcourt les résultats d'un type page par page, par score décroissant"""
+        results = first_page
+        page = kwargs.pop('page', 1) or 1
+        pages_read = 1
+        
+        while True:
+            yield from sorted(results.hits, key=lambda hit: -hit.score)
+            
+            if pages_read >= max_pages or not (results.pagination and results.pagination.has_next):
+                return
+            
+            page += 1
+            pages_read += 1
+            results = self.search_by_type(resource_type, query, page=page, **kwargs)
+
+    def _search_params(
+        self,
+        query: Optional[str] = None,
+        categories: Optional[List[str]] = None,
+        resource_types: Optional[List[ResourceType]] = None,
+        plans: Optional[List[str]] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        verified: Optional[bool] = None,
+        city: Optional[str] = None,
+        region: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        sort: Optional[SortField] = None,
+        order: Optional[SortOrder] = None,
+        page: int = 1,
+        limit: int = 20,
+        facets: Optional[List[str]] = None,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Valide les arguments de ``search`` et construit ses paramètres de requête"""
+        # Validation des paramètres
+        if limit > 100:
+            raise ValidationError("Limit cannot exceed 100")
+        if page < 1:
+            raise ValidationError("Page must be >= 1")
+        if query and len(query) > 200:
+            raise ValidationError("Query cannot exceed 200 characters")
+        
+        # Construction des paramètres
+        params = {}
+        if query:
+            params['q'] = query.strip()
+        if categories:
+            params['categories'] = ','.join(categories)
+        if resource_types:
+            params['resourceTypes'] = ','.join([rt.value for rt in resource_types])
+        if plans:
+            params['plans'] = ','.join(plans)
+        if min_price is not None:
+            params['minPrice'] = min_price
+        if max_price is not None:
+            params['maxPrice'] = max_price
+        if verified is not None:
+            params['verified'] = str(verified).lower()
+        if city:
+            params['city'] = city
+        if region:
+            params['region'] = region
+        if tags:
+            params['tags'] = ','.join(tags)
+        if sort:
+            params['sort'] = sort.value
+        if order:
+            params['order'] = order.value
+        if page:
+            params['page'] = page
+        if limit:
+            params['limit'] = limit
+        if facets:
+            params['facets'] = ','.join(facets)
+        if user_id:
+            params['userId'] = user_id
+        if session_id:
+            params['sessionId'] = session_id
+        
+        return params
+
     def _build_search_params(self, **kwargs) -> Dict[str, Any]:
         """Construit les paramètres de requête pour la recherche"""
         params = {}
@@ -586,56 +1147,327 @@ class ROMAPISearchClient:
         Raises:
             ROMAPIError: En cas d'erreur API
         """
+        return self._request_with_event(method, endpoint, params=params, data=data, **kwargs)[0]
+
+    def _request_results(
+        self,
+        result_class: Any,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        prefetched: Optional[Tuple[Any, Optional[float], Dict[str, str]]] = None
+    ) -> Any:
+        """Effectue une requête GET et construit le résultat avec ses métadonnées de requête"""
+        response_data, event = self._request_with_event('GET', endpoint, params=params, prefetched=prefetched)
+        
+        build_started = time.perf_counter()
+        results = result_class.from_dict(response_data)
+        build_time = time.perf_counter() - build_started
+        
+        took = getattr(results, 'took', None)
+        timing = event.timing
+        results.request_metadata = RequestMetadata(
+            endpoint=event.endpoint,
+            total_time=timing.total + build_time,
+            network_time=timing.network,
+            decode_time=timing.parse,
+            build_time=build_time,
+            server_time=took / 1000 if took is not None else None,
+            bytes_received=event.bytes_received,
+            from_cache=event.from_cache,
+            cache_age=event.cache_age,
+            retries=event.retries
+        )
+        policy = current_cache_policy()
+        if self.prefetcher is not None and (policy is None or not policy.bypass):
+            self.prefetcher.observe(endpoint, params or {}, results)
+        return results
+
+    def _request_with_event(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        prefetched: Optional[Tuple[Any, Optional[float], Dict[str, str]]] = None,
+        **kwargs
+    ) -> Tuple[Any, RequestEvent]:
+        """
+        Effectue une requête HTTP et renvoie la réponse avec son événement d'instrumentation
+        
+        ``prefetched`` est le triplet (données, âge, validateurs) déjà lu
+        dans le cache (voir ``CacheUtils.lookup_many``) ; None lit le cache.
+        L'entrée est lue une seule fois par requête.
+        """
         url = urljoin(self.base_url, endpoint.lstrip('/'))
+        event = RequestEvent(method=method, endpoint=endpoint, url=url, params=dict(params or {}))
+        timing = event.timing
+        started = time.perf_counter()
+        self._emit('request', event)
         
         # Vérifier le cache pour les requêtes GET
         cache_key = None
-        if method == 'GET' and self.cache:
-            cache_key = self.cache.generate_cache_key(url, params or {})
-            cached_result = self.cache.get(cache_key)
-            if cached_result:
-                return cached_result
+        conditional_headers: Dict[str, str] = {}
+        policy = current_cache_policy()
+        if policy is not None and policy.bypass:
+            # Cache contourné : ni lecture ni écriture
+            policy.misses += 1
+        elif method == 'GET' and self.cache:
+            cache_key = self._cache_key(url, endpoint, params)
+            cached_result, cache_age, validators = (
+                self.cache.lookup(cache_key) if prefetched is None else prefetched
+            )
+            hit = bool(cached_result) and (policy is None or policy.accepts(cache_age))
+            if self.canonicalizer is not None:
+                self.canonicalizer.observe(endpoint, params, hit, self.cache_timeout)
+            if hit:
+                if policy is not None:
+                    policy.hits += 1
+                event.cache = CACHE_HIT
+                event.cache_age = cache_age
+                timing.total = time.perf_counter() - started
+                self._emit('response', event)
+                return cached_result, event
+            if policy is not None:
+                policy.misses += 1
+            event.cache = CACHE_MISS
+            # Entrée expirée (ou trop ancienne) avec validateurs : revalidation conditionnelle
+            conditional_headers = validators
+        
+        if conditional_headers:
+            kwargs['headers'] = {**conditional_headers, **kwargs.get('headers', {})}
         
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=data,
-                timeout=self.timeout,
-                **kwargs
-            )
+            with timing_scope(timing), deadline_scope(self.timeout_budget):
+                scheduled = self._acquire_slot(timing)
+                try:
+                    replica = self._acquire_replica(event)
+                    response = self._send(
+                        replica,
+                        method,
+                        event.url,
+                        params=params,
+                        json=data,
+                        headers={**self.headers, **kwargs.pop('headers', {})},
+                        timeout=self.timeout,
+                        **kwargs
+                    )
+                finally:
+                    self._release_slot(scheduled)
+            # Le corps est lu entièrement par requests après les en-têtes
+            if timing.headers_received_at:
+                timing.download = time.perf_counter() - timing.headers_received_at
+            event.status_code = response.status_code
+            event.bytes_received = len(response.content)
+            event.retries = max(timing.attempts - 1, 0)
             
             # Mettre à jour les informations de rate limiting
             self._update_rate_limit_info(response)
             
+            # 304 Not Modified : réutiliser l'entrée en cache avec un nouveau TTL
+            if response.status_code == 304 and cache_key:
+                cached_result = self.cache.revalidate(cache_key, self.cache_timeout)
+                if cached_result is not None:
+                    event.cache = CACHE_REVALIDATED
+                    event.cache_age = 0.0
+                    timing.total = time.perf_counter() - started
+                    self._emit('response', event)
+                    return cached_result, event
+                raise ROMAPIError('HTTP 304 without cached entry', status_code=304)
+            
             # Vérifier le statut de la réponse
-            if response.status_code == 400:
-                error_data = response.json()
-                raise ValidationError(error_data.get('error', {}).get('message', 'Validation error'))
-            elif response.status_code == 404:
-                error_data = response.json()
-                raise NotFoundError(error_data.get('error', {}).get('message', 'Resource not found'))
-            elif response.status_code == 429:
-                error_data = response.json()
-                raise RateLimitError(error_data.get('error', {}).get('message', 'Rate limit exceeded'))
-            elif response.status_code >= 500:
-                error_data = response.json() if response.content else {}
-                raise ServerError(error_data.get('error', {}).get('message', 'Server error'))
-            elif not response.ok:
-                error_data = response.json() if response.content else {}
-                raise ROMAPIError(error_data.get('error', {}).get('message', f'HTTP {response.status_code}'))
+            self._raise_for_status(response)
             
+            parse_started = time.perf_counter()
             result = response.json()
+            timing.parse = time.perf_counter() - parse_started
             
             # Mettre en cache pour les requêtes GET
             if method == 'GET' and self.cache and cache_key:
-                self.cache.set(cache_key, result, self.cache_timeout)
+                self.cache.set(
+                    cache_key,
+                    result,
+                    self.cache_timeout,
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified')
+                )
             
-            return result
+            timing.total = time.perf_counter() - started
+            self._emit('response', event)
+            return result, event
             
+        except ROMAPIError as e:
+            self._emit_error(event, e, started)
+            raise
         except requests.RequestException as e:
-            raise ROMAPIError(f"Request failed: {str(e)}")
+            error = ROMAPIError(f"Request failed: {str(e)}")
+            self._emit_error(event, error, started)
+            raise error
+
+    def _cache_key(self, url: str, endpoint: str, params: Optional[Dict[str, Any]]) -> str:
+        """Clé de cache d'une requête GET (paramètres canoniques si activé)"""
+        if self.canonicalizer is not None:
+            params = self.canonicalizer.canonicalize(endpoint, params)
+        return self.cache.generate_cache_key(url, params or {})
+
+    def _stream_request(
+        self,
+        method: str,
+        endpoint: str,
+        patterns: Sequence[Tuple[str, ...]],
+        params: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 65536,
+        **kwargs
+    ) -> Iterator[Tuple[Tuple[Any, ...], Any]]:
+        """
+        Effectue une requête HTTP en streaming et analyse la réponse au fil de l'eau
+        
+        Le téléchargement et le décodage étant entrelacés, leur durée cumulée
+        est rapportée dans ``timing.download`` de l'événement ``response``.
+        
+        Args:
+            method: Méthode HTTP
+            endpoint: Endpoint de l'API
+            patterns: Chemins des tableaux JSON dont les éléments sont produits
+            params: Paramètres de requête
+            chunk_size: Taille des blocs lus sur le réseau (octets)
+            
+        Yields:
+            Tuple: Chemin du tableau et élément JSON décodé
+            
+        Raises:
+            ROMAPIError: En cas d'erreur API
+        """
+        url = urljoin(self.base_url, endpoint.lstrip('/'))
+        event = RequestEvent(method=method, endpoint=endpoint, url=url, params=dict(params or {}))
+        timing = event.timing
+        started = time.perf_counter()
+        self._emit('request', event)
+        
+        # La place dans l'ordonnanceur est gardée jusqu'à la fin de la lecture du corps
+        scheduled = False
+        try:
+            # L'échéance couvre l'obtention des en-têtes ; le corps est lu par le consommateur
+            with timing_scope(timing), deadline_scope(self.timeout_budget):
+                scheduled = self._acquire_slot(timing)
+                replica = self._acquire_replica(event)
+                response = self._send(
+                    replica,
+                    method,
+                    event.url,
+                    params=params,
+                    headers={**self.headers, **kwargs.pop('headers', {})},
+                    timeout=self.timeout,
+                    stream=True,
+                    **kwargs
+                )
+        except ROMAPIError as e:
+            self._release_slot(scheduled)
+            self._emit_error(event, e, started)
+            raise
+        
+        event.status_code = response.status_code
+        event.retries = max(timing.attempts - 1, 0)
+        
+        def counted_chunks() -> Iterator[bytes]:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                event.bytes_received += len(chunk)
+                yield chunk
+        
+        try:
+            self._update_rate_limit_info(response)
+            self._raise_for_status(response)
+            
+            yield from iter_json_arrays(
+                counted_chunks(),
+                patterns,
+                encoding=response.encoding or 'utf-8'
+            )
+            timing.download = time.perf_counter() - (timing.headers_received_at or started)
+            timing.total = time.perf_counter() - started
+            self._emit('response', event)
+        except ROMAPIError as e:
+            self._emit_error(event, e, started)
+            raise
+        except requests.RequestException as e:
+            error = ROMAPIError(f"Request failed: {str(e)}")
+            self._emit_error(event, error, started)
+            raise error
+        finally:
+            response.close()
+            self._release_slot(scheduled)
+
+    def _acquire_slot(self, timing: Any) -> bool:
+        """Attend son tour dans l'ordonnanceur (priorité du thread) ; renvoie True si une place est prise"""
+        if self.scheduler is None:
+            return False
+        timing.queue += self.scheduler.acquire()
+        return True
+
+    def _release_slot(self, scheduled: bool) -> None:
+        if scheduled:
+            self.scheduler.release()
+
+    def _acquire_replica(self, event: RequestEvent) -> Optional[Replica]:
+        """Choisit le réplica d'une requête et met à jour l'URL de l'événement"""
+        if self.balancer is None:
+            return None
+        replica = self.balancer.acquire()
+        event.url = urljoin(replica.base_url, event.endpoint.lstrip('/'))
+        return replica
+
+    def _send(self, replica: Optional[Replica], method: str, url: str, **kwargs) -> Any:
+        """
+        Envoie une requête via le transport du client ou du réplica choisi
+        
+        Les erreurs réseau, timeouts et réponses 5xx sont signalés au
+        répartiteur (éjection passive) ; la latence jusqu'à la réponse
+        alimente le choix des réplicas suivants. Une erreur réseau survenue
+        une fois l'échéance de l'appel atteinte devient ``TimeoutError``.
+        """
+        transport = self.transport if replica is None else replica.transport
+        deadline = current_deadline()
+        sent = time.perf_counter()
+        try:
+            try:
+                response = transport.request(method, url, **kwargs)
+            except NetworkError as e:
+                if deadline is not None and deadline.expired:
+                    raise deadline.error() from e
+                raise
+        except ROMAPIError as e:
+            if replica is not None:
+                self.balancer.release(replica, time.perf_counter() - sent, e)
+            raise
+        if replica is None:
+            return response
+        
+        error = ServerError(f"HTTP {response.status_code}") if response.status_code >= 500 else None
+        self.balancer.release(replica, time.perf_counter() - sent, error)
+        return response
+
+    @staticmethod
+    def _in_caller_scope(deadline: Optional[Deadline], priority: str, func: Any, *args, **kwargs) -> Any:
+        """Appelle ``func`` sous l'échéance et la priorité d'un autre thread"""
+        with deadline_scope(deadline), priority_scope(priority):
+            return func(*args, **kwargs)
+
+    def _raise_for_status(self, response: requests.Response) -> None:
+        """Convertit un statut HTTP d'erreur en exception ROMAPI"""
+        if response.status_code == 400:
+            error_data = response.json()
+            raise ValidationError(error_data.get('error', {}).get('message', 'Validation error'))
+        elif response.status_code == 404:
+            error_data = response.json()
+            raise NotFoundError(error_data.get('error', {}).get('message', 'Resource not found'))
+        elif response.status_code == 429:
+            error_data = response.json()
+            raise RateLimitError(error_data.get('error', {}).get('message', 'Rate limit exceeded'))
+        elif response.status_code >= 500:
+            error_data = response.json() if response.content else {}
+            raise ServerError(error_data.get('error', {}).get('message', 'Server error'))
+        elif not response.ok:
+            error_data = response.json() if response.content else {}
+            raise ROMAPIError(error_data.get('error', {}).get('message', f'HTTP {response.status_code}'))
 
     def _update_rate_limit_info(self, response: requests.Response) -> None:
         """Met à jour les informations de rate limiting"""
@@ -646,6 +1478,51 @@ class ROMAPISearchClient:
                 'remaining': int(headers.get('X-RateLimit-Remaining', 0)),
                 'reset_time': int(headers.get('X-RateLimit-Reset', 0))
             }
+            if self.quota is not None:
+                self.quota.observe(
+                    self.rate_limit_info['limit'],
+                    self.rate_limit_info['remaining'],
+                    self.rate_limit_info['reset_time'],
+                    throttled=response.status_code == 429
+                )
+
+    def add_hook(self, event: str, hook: Hook) -> None:
+        """
+        Enregistre un hook d'instrumentation
+        
+        Args:
+            event: Événement observé ('request', 'response' ou 'error')
+            hook: Fonction appelée avec le RequestEvent de chaque requête
+            
+        Raises:
+            ValidationError: Si l'événement est inconnu
+            
+        Example:
+            >>> client.add_hook('response', lambda e: print(e.endpoint, e.timing.total))
+        """
+        if event not in self._hooks:
+            raise ValidationError(f"Unknown hook event '{event}' (expected one of {', '.join(HOOK_EVENTS)})")
+        self._hooks[event].append(hook)
+
+    def remove_hook(self, event: str, hook: Hook) -> None:
+        """Retire un hook d'instrumentation enregistré"""
+        if hook in self._hooks.get(event, []):
+            self._hooks[event].remove(hook)
+
+    def _emit(self, name: str, event: RequestEvent) -> None:
+        """Appelle les hooks d'un événement (une erreur de hook n'interrompt pas la requête)"""
+        for hook in self._hooks[name]:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("Instrumentation hook %r failed", hook)
+
+    def _emit_error(self, event: RequestEvent, error: ROMAPIError, started: float) -> None:
+        event.error = error
+        if event.status_code is None:
+            event.status_code = error.status_code
+        event.timing.total = time.perf_counter() - started
+        self._emit('error', event)
 
     @property
     def rate_limits(self) -> Optional[Dict[str, Any]]:
@@ -657,11 +1534,160 @@ class ROMAPISearchClient:
         if self.cache:
             self.cache.clear()
 
+    @property
+    def session(self) -> Optional[requests.Session]:
+        """Session requests du transport 'requests' (None avec les autres transports)"""
+        return getattr(self.transport, 'session', None)
+
+    @session.setter
+    def session(self, session: requests.Session) -> None:
+        """Remplace la session HTTP (sélectionne le transport 'requests', partagé par les réplicas)"""
+        self.transport = RequestsTransport(retries=self.retries, session=session)
+        if self.balancer is not None:
+            for replica in self.balancer.replicas:
+                replica.transport = self.transport
+
+    def warmup(self, connections: int = 4, health_check: bool = False) -> Dict[str, Any]:
+        """
+        Préchauffe le client avant les premières requêtes
+        
+        Résout l'hôte de l'API (résultat conservé dans le cache DNS) et ouvre
+        ``connections`` connexions (TCP et TLS) gardées dans le pool, afin que
+        les premières requêtes réelles ne paient pas ces étapes. Le nombre de
+        connexions est borné par la taille du pool du transport (10 par défaut).
+        Avec plusieurs réplicas, chacun est préchauffé et sondé ; un réplica
+        dont la sonde échoue est éjecté.
+        
+        Args:
+            connections: Nombre de connexions à ouvrir (par réplica, défaut: 4)
+            health_check: Envoyer une requête de santé légère (``/health/live``)
+                pour vérifier la disponibilité de l'API
+            
+        Returns:
+            Dict: Connexions ouvertes, durées DNS/connexion/TLS cumulées (s),
+            durée totale et état de santé (None sans requête de santé, False
+            si un réplica ne répond pas correctement)
+            
+        Raises:
+            ValidationError: Si le nombre de connexions est invalide
+            NetworkError: Si l'hôte est injoignable
+            
+        Example:
+            >>> client = ROMAPISearchClient()
+            >>> client.warmup(connections=8, health_check=True)
+            {'connections': 8, 'dns': 0.012, 'connect': 0.021, 'tls': 0.034, ...}
+        """
+        if connections < 0:
+            raise ValidationError("Le nombre de connexions doit être positif")
+        
+        started = time.perf_counter()
+        timing = RequestTiming()
+        healthy: Optional[bool] = None
+        
+        replicas = self.balancer.replicas if self.balancer else [Replica(self.base_url, self.transport)]
+        opened = 0
+        
+        with timing_scope(timing):
+            for replica in replicas:
+                if self.dns_cache is not None:
+                    parts = urlsplit(replica.base_url)
+                    port = parts.port or (443 if parts.scheme == 'https' else 80)
+                    resolve_started = time.perf_counter()
+                    try:
+                        self.dns_cache.resolve(parts.hostname, port)
+                    except OSError as e:
+                        raise NetworkError(f"Warmup failed: {str(e)}")
+                    timing.dns += time.perf_counter() - resolve_started
+                
+                if connections:
+                    opened += replica.transport.warmup(replica.base_url, connections)
+                
+                if health_check:
+                    replica_healthy = self._health_check(replica)
+                    healthy = replica_healthy if healthy is None else healthy and replica_healthy
+        
+        return {
+            'connections': opened,
+            'dns': timing.dns,
+            'connect': timing.connect,
+            'tls': timing.tls,
+            'elapsed': time.perf_counter() - started,
+            'healthy': healthy,
+        }
+
+    def _health_check(self, replica: Replica) -> bool:
+        """Envoie une requête de santé (sonde du répartiteur avec plusieurs réplicas)"""
+        if self.balancer is not None:
+            return self.balancer.probe(replica)
+        try:
+            response = replica.transport.request(
+                'GET',
+                f"{replica.base_url}{HEALTH_ENDPOINT}",
+                headers=self.headers,
+                timeout=self.timeout
+            )
+            return response.ok
+        except (NetworkError, RateLimitError):
+            return False
+
+    def close(self) -> None:
+        """Ferme les connexions du transport (et arrête les sondes des réplicas)"""
+        if self.prefetcher is not None:
+            self.prefetcher.close()
+        if self.balancer is not None:
+            self.balancer.close()
+        else:
+            self.transport.close()
+
     def set_api_key(self, api_key: str) -> None:
         """Définit la clé API"""
         self.api_key = api_key
-        self.session.headers['Authorization'] = f'Bearer {api_key}'
+        self.headers['Authorization'] = f'Bearer {api_key}'
+
+    def deadline(self, timeout_budget: float) -> Any:
+        """
+        Borne la durée totale des requêtes du bloc (dans ce thread)
+        
+        Toutes les tentatives, attentes de backoff et ``Retry-After`` comprises
+        doivent tenir dans le budget ; les timeouts de connexion et de lecture
+        de chaque tentative sont réduits au temps restant.
+        
+        Args:
+            timeout_budget: Budget en secondes
+            
+        Returns:
+            Gestionnaire de contexte produisant l'échéance (``Deadline``)
+            
+        Raises:
+            TimeoutError: (dans le bloc) Si le budget est épuisé
+            
+        Example:
+            >>> with client.deadline(0.3):
+            ...     suggestions = client.suggest("rest")
+        """
+        return deadline_scope(timeout_budget)
+
+    def priority(self, priority: str) -> Any:
+        """
+        Définit la priorité des requêtes du bloc (dans ce thread)
+        
+        Avec un ordonnanceur (``max_concurrency`` ou ``rate_limit``), les
+        requêtes en attente sont servies par file équitable pondérée entre
+        classes : 'interactive' (poids 16), 'normal' (4, défaut) et
+        'background' (1).
+        
+        Args:
+            priority: Classe de priorité
+            
+        Returns:
+            Gestionnaire de contexte
+            
+        Example:
+            >>> with client.priority('background'):
+            ...     client.get_search_analytics()
+        """
+        return priority_scope(priority)
 
-    def set_timeout(self, timeout: float) -> None:
+    def set_timeout(self, timeout: TimeoutValue) -> None:
         """Définit le timeout des requêtes"""
         self.timeout = timeout
\ No newline at end of file
@@ -0,0 +1,296 @@
+"""
+Sérialisation binaire compacte des résultats
+
+Pour partager des résultats décodés entre processus ou via un cache, JSON
+impose de reconstruire les objets et pickle produit des blocs volumineux
+(noms de classes et de champs, énumérations et dates sérialisées en
+objets). Ce codec écrit les dataclasses de résultats sous forme de listes
+positionnelles :
+
+- champs dans l'ordre de la dataclass, sans noms ;
+- énumérations codées par leur rang (dictionnaire des valeurs) ;
+- dates UTC en microsecondes depuis l'epoch ;
+- métadonnées de requête (``request_metadata``) non conservées.
+
+Le corps est encodé en MessagePack (``pip install romapi-search-sdk[msgpack]``)
+ou, à défaut, en JSON compact. Un en-tête versionné indique le format, le
+type racine et une empreinte de son schéma : un bloc écrit par une version
+du SDK dont les types diffèrent est refusé au lieu d'être mal décodé.
+
+Example:
+    >>> data = encode(results)
+    >>> decode(data) == results
+    True
+"""
+
+import json
+import struct
+import zlib
+from dataclasses import fields, is_dataclass
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, get_args, get_origin
+
+from .types import (
+    Breadcrumb,
+    Category,
+    CategoryInfo,
+    CategorySearchResults,
+    MultiTypeSearchResults,
+    PaginationInfo,
+    SearchFacet,
+    SearchHit,
+    SearchResults,
+    SEOInfo,
+    Suggestion,
+    TypedSearchResults,
+)
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+CODEC_VERSION = 1
+
+FORMAT_MSGPACK = 1
+FORMAT_JSON = 2
+
+# Étiquettes des types racines (ajouter en fin de liste : les étiquettes sont persistées)
+ROOT_TYPES = (
+    SearchResults,
+    CategorySearchResults,
+    MultiTypeSearchResults,
+    TypedSearchResults,
+    SearchHit,
+    Suggestion,
+    Category,
+    CategoryInfo,
+    Breadcrumb,
+    SEOInfo,
+    SearchFacet,
+    PaginationInfo,
+)
+
+# Magie, version, format, type racine, drapeaux, empreinte du schéma
+_HEADER = struct.Struct('>2sBBBBI')
+_MAGIC = b'RC'
+_FLAG_LIST = 1
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+_Converter = Optional[Callable[[Any], Any]]
+
+
+class _Schema:
+    """Convertisseurs compilés d'une dataclass (seuls les champs à convertir sont parcourus)"""
+
+    def __init__(self, cls: type):
+        self.cls = cls
+        # Catégories : instances partagées, comme pour from_dict
+        self.factory = cls.shared if cls is Category else cls
+        parts = [cls.__name__]
+        names = []
+        self.encoders: List[Tuple[int, Callable[[Any], Any]]] = []
+        self.decoders: List[Tuple[int, Callable[[Any], Any]]] = []
+        self.transient: List[int] = []
+        for index, f in enumerate(fields(cls)):
+            encoder, decoder, signature = _converters(f.type)
+            names.append(f.name)
+            if not f.compare:
+                # Champs hors comparaison (métadonnées de requête) : non conservés
+                self.transient.append(index)
+            elif encoder is not None:
+                self.encoders.append((index, encoder))
+                self.decoders.append((index, decoder))
+            parts.append(f"{f.name}:{signature}")
+        self.size = len(names)
+        self.getter = attrgetter(*names) if len(names) > 1 else (lambda obj: (getattr(obj, names[0]),))
+        self.signature = '(' + ','.join(parts) + ')'
+
+    def encode(self, obj: Any) -> List[Any]:
+        values = list(self.getter(obj))
+        for index in self.transient:
+            values[index] = None
+        for index, encoder in self.encoders:
+            value = values[index]
+            if value is not None:
+                values[index] = encoder(value)
+        return values
+
+    def decode(self, values: List[Any]) -> Any:
+        if len(values) != self.size:
+            raise ValueError(f"{self.cls.__name__}: expected {self.size} fields, got {len(values)}")
+        if type(values) is not list:
+            values = list(values)
+        for index, decoder in self.decoders:
+            value = values[index]
+            if value is not None:
+                values[index] = decoder(value)
+        return self.factory(*values)
+
+
+_SCHEMAS: Dict[type, _Schema] = {}
+
+
+def _schema(cls: type) -> _Schema:
+    schema = _SCHEMAS.get(cls)
+    if schema is None:
+        schema = _SCHEMAS[cls] = _Schema(cls)
+    return schema
+
+
+def _encode_datetime(value: datetime) -> Union[int, str]:
+    if value.tzinfo is not None and value.utcoffset() == timedelta(0):
+        return (value - _EPOCH) // _MICROSECOND
+    # Dates locales ou avec décalage : forme ISO, restituée à l'identique
+    return value.isoformat()
+
+
+def _decode_datetime(value: Union[int, str]) -> datetime:
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _converters(annotation: Any) -> Tuple[_Converter, _Converter, str]:
+    """Convertisseurs (encodage, décodage) et signature d'une annotation de champ"""
+    origin = get_origin(annotation)
+    if origin is Union:
+        # Optional[X] : None est traité par l'appelant
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return _converters(args[0])
+        return None, None, 'any'
+
+    if origin is list:
+        item_encoder, item_decoder, signature = _converters(get_args(annotation)[0])
+        if item_encoder is None:
+            return None, None, f"[{signature}]"
+        return (
+            lambda items: [item_encoder(item) if item is not None else None for item in items],
+            lambda items: [item_decoder(item) if item is not None else None for item in items],
+            f"[{signature}]",
+        )
+
+    if origin is dict:
+        value_encoder, value_decoder, signature = _converters(get_args(annotation)[1])
+        if value_encoder is None:
+            return None, None, f"{{{signature}}}"
+        return (
+            lambda items: {key: value_encoder(value) for key, value in items.items()},
+            lambda items: {key: value_decoder(value) for key, value in items.items()},
+            f"{{{signature}}}",
+        )
+
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        members = list(annotation)
+        ranks = {member: rank for rank, member in enumerate(members)}
+        return ranks.__getitem__, members.__getitem__, f"{annotation.__name__}<{'|'.join(m.name for m in members)}>"
+
+    if annotation is datetime:
+        return _encode_datetime, _decode_datetime, 'datetime'
+
+    if is_dataclass(annotation):
+        schema = _schema(annotation)
+        return schema.encode, schema.decode, schema.signature
+
+    return None, None, annotation.__name__ if annotation in (str, int, float, bool) else 'any'
+
+
+def schema_fingerprint(cls: type) -> int:
+    """Empreinte (CRC32) du schéma d'un type racine : champs, types et énumérations"""
+    return zlib.crc32(_schema(cls).signature.encode('utf-8'))
+
+
+def encode(value: Any, format: Optional[int] = None) -> bytes:
+    """
+    Encoder un résultat (ou une liste de résultats du même type)
+
+    Args:
+        value: Instance d'un type de ``ROOT_TYPES`` ou liste de ces instances
+        format: FORMAT_MSGPACK ou FORMAT_JSON (défaut: MessagePack s'il est installé)
+
+    Returns:
+        bytes: Bloc versionné
+
+    Raises:
+        TypeError: Si le type n'est pas pris en charge
+        ImportError: Si MessagePack est demandé sans être installé
+    """
+    is_list = isinstance(value, list)
+    items = value if is_list else [value]
+    if not items:
+        raise TypeError("Cannot infer the type of an empty list")
+    cls = type(items[0])
+    if cls not in ROOT_TYPES:
+        raise TypeError(f"Unsupported type for binary encoding: {cls.__name__}")
+    if any(type(item) is not cls for item in items):
+        raise TypeError(f"All items must be {cls.__name__} instances")
+
+    schema = _schema(cls)
+    packed = [schema.encode(item) for item in items] if is_list else schema.encode(value)
+
+    if format is None:
+        format = FORMAT_MSGPACK if msgpack is not None else FORMAT_JSON
+    if format == FORMAT_MSGPACK:
+        body = _msgpack().packb(packed, use_bin_type=True)
+    elif format == FORMAT_JSON:
+        body = json.dumps(packed, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    else:
+        raise ValueError(f"Unknown codec format: {format}")
+
+    header = _HEADER.pack(
+        _MAGIC, CODEC_VERSION, format, ROOT_TYPES.index(cls) + 1,
+        _FLAG_LIST if is_list else 0, schema_fingerprint(cls)
+    )
+    return header + body
+
+
+def decode(data: bytes) -> Any:
+    """
+    Décoder un bloc produit par ``encode``
+
+    Args:
+        data: Bloc versionné
+
+    Returns:
+        Any: Résultat (ou liste de résultats) reconstruit
+
+    Raises:
+        ValueError: Si le bloc est invalide, d'une autre version ou d'un autre schéma
+        ImportError: Si le bloc est en MessagePack et que msgpack n'est pas installé
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Truncated codec header")
+    magic, version, format, tag, flags, fingerprint = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError("Not a romapi_search codec payload")
+    if version != CODEC_VERSION:
+        raise ValueError(f"Unsupported codec version {version} (expected {CODEC_VERSION})")
+    if not 1 <= tag <= len(ROOT_TYPES):
+        raise ValueError(f"Unknown codec type tag {tag}")
+    cls = ROOT_TYPES[tag - 1]
+    if fingerprint != schema_fingerprint(cls):
+        raise ValueError(f"{cls.__name__} schema changed since this payload was encoded")
+
+    body = memoryview(data)[_HEADER.size:]
+    if format == FORMAT_MSGPACK:
+        packed = _msgpack().unpackb(body, raw=False, strict_map_key=False)
+    elif format == FORMAT_JSON:
+        packed = json.loads(bytes(body))
+    else:
+        raise ValueError(f"Unknown codec format: {format}")
+
+    schema = _schema(cls)
+    if flags & _FLAG_LIST:
+        return [schema.decode(item) for item in packed]
+    return schema.decode(packed)
+
+
+def _msgpack() -> Any:
+    if msgpack is None:
+        raise ImportError("The msgpack format requires msgpack: pip install romapi-search-sdk[msgpack]")
+    return msgpack
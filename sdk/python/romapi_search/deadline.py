@@ -0,0 +1,140 @@
+"""
+Échéances de bout en bout des appels du client
+
+Un ``Deadline`` borne la durée totale d'un appel : toutes les tentatives,
+les attentes de backoff (y compris ``Retry-After``) et les attentes du
+limiteur de débit. Les timeouts de connexion et de lecture de chaque
+tentative sont réduits au temps restant ; une attente qui dépasserait
+l'échéance n'est pas effectuée et ``TimeoutError`` est levée aussitôt.
+
+L'échéance courante est propre au thread, comme ``timing_scope`` : les
+transports la consultent sans qu'elle soit passée en paramètre.
+
+Example:
+    >>> with client.deadline(0.3):
+    ...     client.suggest("rest")
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple, Union
+
+from .exceptions import TimeoutError
+
+# Timeout unique ou couple (connexion, lecture), en secondes
+TimeoutValue = Union[None, float, Tuple[Optional[float], Optional[float]]]
+
+_local = threading.local()
+
+
+def split_timeout(timeout: TimeoutValue) -> Tuple[Optional[float], Optional[float]]:
+    """Timeouts de connexion et de lecture d'un timeout unique ou d'un couple"""
+    if isinstance(timeout, tuple):
+        return timeout
+    return timeout, timeout
+
+
+class Deadline:
+    """
+    Échéance d'un appel
+
+    Args:
+        budget: Durée totale autorisée en secondes
+    """
+
+    def __init__(self, budget: float):
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget
+
+    def remaining(self) -> float:
+        """Temps restant en secondes (négatif une fois l'échéance passée)"""
+        return self.expires_at - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def error(self, delay: float = 0.0) -> TimeoutError:
+        if delay > 0:
+            return TimeoutError(
+                f"Deadline of {self.budget * 1000:.0f} ms would be exceeded by a {delay:.1f} s wait"
+            )
+        return TimeoutError(f"Deadline of {self.budget * 1000:.0f} ms exceeded")
+
+    def check(self, delay: float = 0.0) -> None:
+        """
+        Vérifier qu'il reste plus de ``delay`` secondes
+
+        Raises:
+            TimeoutError: Si l'échéance est atteinte (ou le serait après ``delay``)
+        """
+        if self.remaining() <= delay:
+            raise self.error(delay)
+
+    def sleep(self, delay: float) -> None:
+        """Attendre ``delay`` secondes si l'échéance le permet (sinon TimeoutError)"""
+        self.check(delay)
+        time.sleep(delay)
+
+    def timeouts(self, timeout: TimeoutValue) -> Tuple[float, float]:
+        """
+        Timeouts (connexion, lecture) d'une tentative, réduits au temps restant
+
+        Raises:
+            TimeoutError: Si l'échéance est atteinte
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise self.error()
+        connect, read = split_timeout(timeout)
+        return (
+            remaining if connect is None else min(connect, remaining),
+            remaining if read is None else min(read, remaining),
+        )
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Échéance de l'appel en cours dans ce thread (ou None)"""
+    return getattr(_local, 'deadline', None)
+
+
+def deadline_sleep(delay: float) -> None:
+    """
+    Attendre ``delay`` secondes en respectant l'échéance courante
+
+    Raises:
+        TimeoutError: Si l'attente dépasserait l'échéance
+    """
+    deadline = current_deadline()
+    if deadline is not None:
+        deadline.sleep(delay)
+    else:
+        time.sleep(delay)
+
+
+@contextmanager
+def deadline_scope(budget: Union[None, float, Deadline]) -> Iterator[Optional[Deadline]]:
+    """
+    Appliquer une échéance aux requêtes du bloc (dans ce thread)
+
+    Une échéance déjà active et plus proche est conservée : un appel ne peut
+    pas prolonger le budget de l'appel qui l'englobe.
+
+    Args:
+        budget: Durée en secondes, échéance existante (propagation vers un
+            autre thread) ou None (aucune nouvelle échéance)
+
+    Yields:
+        Deadline: Échéance effective (ou None)
+    """
+    previous = current_deadline()
+    deadline = Deadline(budget) if isinstance(budget, (int, float)) else budget
+    if deadline is None or (previous is not None and previous.expires_at <= deadline.expires_at):
+        yield previous
+        return
+    _local.deadline = deadline
+    try:
+        yield deadline
+    finally:
+        _local.deadline = previous
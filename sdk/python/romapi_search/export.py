@@ -0,0 +1,514 @@
+"""
+Export massif des résultats de recherche (NDJSON, CSV, Parquet)
+
+Les pages sont récupérées en parallèle dans une fenêtre bornée et écrites
+dans l'ordre, au fur et à mesure : la mémoire utilisée dépend de la taille
+de la fenêtre et non du nombre de résultats exportés. Un fichier de point
+de reprise permet de relancer un export interrompu là où il s'est arrêté.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from .cache import CachePolicy, cache_policy_scope
+from .exceptions import ValidationError
+from .scheduler import BACKGROUND, priority_scope
+from .types import ResourceType, SearchHit, SearchResults
+
+EXPORT_FORMATS = ('ndjson', 'csv', 'parquet')
+
+# Colonnes des résultats aplatis (ordre des colonnes CSV / Parquet)
+FLAT_FIELDS = [
+    'id', 'name', 'slug', 'description', 'resource_type', 'plan', 'verified',
+    'score', 'rating', 'distance', 'tags',
+    'category_id', 'category_name', 'category_slug',
+    'address_line1', 'address_line2', 'city', 'region', 'postal_code',
+    'country', 'latitude', 'longitude',
+    'phone', 'email', 'website',
+    'created_at', 'updated_at',
+]
+
+# Types Parquet des colonnes non textuelles
+_FLOAT_FIELDS = {'score', 'rating', 'distance', 'latitude', 'longitude'}
+_BOOL_FIELDS = {'verified'}
+
+
+def flatten_hit(hit: SearchHit) -> Dict[str, Any]:
+    """
+    Aplatir un SearchHit (catégorie, adresse et contact inclus)
+
+    Args:
+        hit: Résultat à aplatir
+
+    Returns:
+        Dict: Colonnes scalaires dans l'ordre de FLAT_FIELDS
+    """
+    address = hit.address
+    contact = hit.contact
+    return {
+        'id': hit.id,
+        'name': hit.name,
+        'slug': hit.slug,
+        'description': hit.description,
+        'resource_type': hit.resource_type.value,
+        'plan': hit.plan.value,
+        'verified': hit.verified,
+        'score': hit.score,
+        'rating': hit.rating,
+        'distance': hit.distance,
+        'tags': ','.join(hit.tags) if hit.tags else None,
+        'category_id': hit.category.id,
+        'category_name': hit.category.name,
+        'category_slug': hit.category.slug,
+        'address_line1': address.address_line1 if address else None,
+        'address_line2': address.address_line2 if address else None,
+        'city': address.city if address else None,
+        'region': address.region if address else None,
+        'postal_code': address.postal_code if address else None,
+        'country': address.country if address else None,
+        'latitude': address.latitude if address else None,
+        'longitude': address.longitude if address else None,
+        'phone': contact.phone if contact else None,
+        'email': contact.email if contact else None,
+        'website': contact.website if contact else None,
+        'created_at': hit.created_at.isoformat() if hit.created_at else None,
+        'updated_at': hit.updated_at.isoformat() if hit.updated_at else None,
+    }
+
+
+def flatten_record(resource_type: ResourceType, record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Aplatir un enregistrement de /search/multi-type/export comme ``flatten_hit``
+
+    Les enregistrements exportés sont des résultats partiels : la catégorie
+    peut n'être que son nom, et les champs absents valent None.
+
+    Args:
+        resource_type: Type de ressource de l'enregistrement
+        record: Enregistrement exporté (clés de l'API)
+
+    Returns:
+        Dict: Colonnes scalaires dans l'ordre de FLAT_FIELDS
+    """
+    category = record.get('category')
+    if not isinstance(category, dict):
+        category = {'name': category}
+    address = record.get('address') or {}
+    contact = record.get('contact') or {}
+    tags = record.get('tags')
+    return {
+        'id': record.get('id'),
+        'name': record.get('name'),
+        'slug': record.get('slug'),
+        'description': record.get('description'),
+        'resource_type': record.get('resourceType') or resource_type.value,
+        'plan': record.get('plan'),
+        'verified': record.get('verified'),
+        'score': record.get('score'),
+        'rating': record.get('rating'),
+        'distance': record.get('distance'),
+        'tags': ','.join(tags) if isinstance(tags, list) else tags or None,
+        'category_id': category.get('id'),
+        'category_name': category.get('name'),
+        'category_slug': category.get('slug'),
+        'address_line1': address.get('addressLine1'),
+        'address_line2': address.get('addressLine2'),
+        'city': address.get('city'),
+        'region': address.get('region'),
+        'postal_code': address.get('postalCode'),
+        'country': address.get('country'),
+        'latitude': address.get('latitude'),
+        'longitude': address.get('longitude'),
+        'phone': contact.get('phone'),
+        'email': contact.get('email'),
+        'website': contact.get('website'),
+        'created_at': record.get('createdAt'),
+        'updated_at': record.get('updatedAt'),
+    }
+
+
+class NDJSONWriter:
+    """Écriture d'un enregistrement JSON par ligne"""
+
+    supports_resume = True
+
+    def __init__(self, path: str, fieldnames: List[str], append: bool = False):
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8', newline='')
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        for row in rows:
+            self._file.write(json.dumps(row, ensure_ascii=False, default=str))
+            self._file.write('\n')
+
+    def flush(self, sync: bool = False) -> int:
+        """Vider les tampons (et les synchroniser sur disque) puis renvoyer la position courante"""
+        self._file.flush()
+        if sync:
+            os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class CSVWriter:
+    """Écriture CSV avec en-tête"""
+
+    supports_resume = True
+
+    def __init__(self, path: str, fieldnames: List[str], append: bool = False):
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=fieldnames, extrasaction='ignore')
+        if not append:
+            self._writer.writeheader()
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        self._writer.writerows(rows)
+
+    def flush(self, sync: bool = False) -> int:
+        self._file.flush()
+        if sync:
+            os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetWriter:
+    """
+    Écriture Parquet par groupes de lignes (nécessite pyarrow)
+
+    Un fichier Parquet ne peut pas être complété après fermeture :
+    la reprise d'un export Parquet repart du début.
+    """
+
+    supports_resume = False
+
+    def __init__(self, path: str, fieldnames: List[str], append: bool = False, row_group_size: int = 10000):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError(
+                "pyarrow is required for Parquet export: pip install romapi-search-sdk[parquet]"
+            ) from e
+
+        self._pa = pyarrow
+        self._fieldnames = fieldnames
+        self._row_group_size = row_group_size
+        self._buffer: List[Dict[str, Any]] = []
+        self._writer = None
+        self._path = path
+        self._parquet = pyarrow.parquet
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        self._buffer.extend(rows)
+        if len(self._buffer) >= self._row_group_size:
+            self._write_buffer()
+
+    def flush(self, sync: bool = False) -> int:
+        return 0
+
+    def close(self) -> None:
+        self._write_buffer()
+        if self._writer is not None:
+            self._writer.close()
+
+    def _write_buffer(self) -> None:
+        if not self._buffer:
+            return
+        if self._writer is None:
+            self._writer = self._parquet.ParquetWriter(self._path, self._schema())
+        columns = {
+            name: [self._coerce(name, row.get(name)) for row in self._buffer]
+            for name in self._fieldnames
+        }
+        self._writer.write_table(self._pa.table(columns, schema=self._writer.schema))
+        self._buffer = []
+
+    def _schema(self) -> Any:
+        pa = self._pa
+        fields = []
+        for name in self._fieldnames:
+            if name in _FLOAT_FIELDS:
+                fields.append(pa.field(name, pa.float64()))
+            elif name in _BOOL_FIELDS:
+                fields.append(pa.field(name, pa.bool_()))
+            else:
+                fields.append(pa.field(name, pa.string()))
+        return pa.schema(fields)
+
+    @staticmethod
+    def _coerce(name: str, value: Any) -> Any:
+        if value is None or name in _FLOAT_FIELDS or name in _BOOL_FIELDS:
+            return value
+        return str(value)
+
+
+_WRITERS = {
+    'ndjson': NDJSONWriter,
+    'csv': CSVWriter,
+    'parquet': ParquetWriter,
+}
+
+
+@dataclass
+class ExportSummary:
+    """Bilan d'un export"""
+    output_path: str
+    format: str
+    rows: int
+    pages: int
+    resumed_from_page: int
+    duration: float
+
+
+class BulkExporter:
+    """
+    Export massif des résultats de recherche
+
+    Les pages de ``search()`` sont récupérées en parallèle (``concurrency``
+    requêtes en vol, ``max_pending_pages`` pages en attente au maximum),
+    aplaties et écrites dans l'ordre. Toutes les ``checkpoint_interval`` pages,
+    un point de reprise est enregistré ; un export relancé avec les mêmes
+    paramètres reprend à la page qui suit ce point.
+
+    Args:
+        client: Client ROMAPISearchClient
+        output_path: Fichier de sortie
+        format: Format de sortie (ndjson, csv, parquet)
+        page_size: Nombre de résultats par page (max 100)
+        concurrency: Nombre de pages récupérées simultanément
+        max_pending_pages: Nombre maximum de pages en mémoire (défaut: 2 x concurrency)
+        checkpoint_path: Fichier de reprise (défaut: <output_path>.checkpoint)
+        checkpoint_interval: Nombre de pages écrites entre deux points de reprise
+        priority: Priorité des requêtes de l'export dans l'ordonnanceur du
+            client (défaut: 'background')
+
+    Example:
+        >>> exporter = BulkExporter(client, "catalogue.ndjson", concurrency=8)
+        >>> summary = exporter.export_search(verified=True)
+        >>> print(f"{summary.rows} lignes en {summary.duration:.1f}s")
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        output_path: str,
+        format: str = 'ndjson',
+        page_size: int = 100,
+        concurrency: int = 4,
+        max_pending_pages: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_interval: int = 10,
+        priority: str = BACKGROUND
+    ):
+        if format not in EXPORT_FORMATS:
+            raise ValidationError(f"Format must be one of: {', '.join(EXPORT_FORMATS)}")
+        if not (1 <= page_size <= 100):
+            raise ValidationError("Page size must be between 1 and 100")
+        if concurrency < 1:
+            raise ValidationError("Concurrency must be >= 1")
+
+        self.client = client
+        self.output_path = output_path
+        self.format = format
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self.max_pending_pages = max(max_pending_pages or 2 * concurrency, concurrency)
+        self.checkpoint_path = checkpoint_path or f"{output_path}.checkpoint"
+        self.checkpoint_interval = max(checkpoint_interval, 1)
+        self.priority = priority
+
+    def export_search(self, resume: bool = True, **search_params) -> ExportSummary:
+        """
+        Exporter tous les résultats d'une recherche
+
+        Args:
+            resume: Reprendre depuis le point de reprise s'il correspond
+            **search_params: Paramètres de ``client.search`` (hors page/limit)
+
+        Returns:
+            ExportSummary: Bilan de l'export
+        """
+        search_params.pop('page', None)
+        search_params.pop('limit', None)
+        start_time = time.time()
+        fingerprint = self._fingerprint(search_params)
+        writer_class = _WRITERS[self.format]
+
+        checkpoint = self._load_checkpoint(fingerprint) if resume and writer_class.supports_resume else None
+        if checkpoint:
+            # Supprimer une éventuelle page partiellement écrite
+            with open(self.output_path, 'r+b') as f:
+                f.truncate(checkpoint['offset'])
+            next_page = checkpoint['page'] + 1
+            rows = checkpoint['rows']
+            total_pages = checkpoint['total_pages']
+        else:
+            first = self._fetch_page(1, search_params)
+            next_page = 1
+            rows = 0
+            total_pages = self._total_pages(first)
+
+        resumed_from_page = next_page if checkpoint else 0
+        writer = writer_class(self.output_path, FLAT_FIELDS, append=bool(checkpoint))
+        pages_written = 0
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                pending: deque = deque()
+                page = next_page
+                if not checkpoint:
+                    pending.append(_completed(first))
+                    page = 2
+
+                while pending or page <= total_pages:
+                    while page <= total_pages and len(pending) < self.max_pending_pages:
+                        pending.append(executor.submit(self._fetch_page, page, search_params))
+                        page += 1
+
+                    results = pending.popleft().result()
+                    writer.write_rows(flatten_hit(hit) for hit in results.hits)
+                    rows += len(results.hits)
+                    pages_written += 1
+
+                    if writer_class.supports_resume and pages_written % self.checkpoint_interval == 0:
+                        self._save_checkpoint({
+                            'fingerprint': fingerprint,
+                            'page': next_page + pages_written - 1,
+                            'rows': rows,
+                            'total_pages': total_pages,
+                            'offset': writer.flush(sync=True),
+                        })
+        finally:
+            writer.close()
+
+        # Export complet : le point de reprise n'est plus utile
+        if os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+        return ExportSummary(
+            output_path=self.output_path,
+            format=self.format,
+            rows=rows,
+            pages=pages_written,
+            resumed_from_page=resumed_from_page,
+            duration=time.time() - start_time
+        )
+
+    def export_by_type(
+        self,
+        export_types: List[ResourceType],
+        query: Optional[str] = None,
+        max_results: int = 1000,
+        **kwargs
+    ) -> ExportSummary:
+        """
+        Exporter via l'endpoint serveur /search/multi-type/export
+
+        La réponse est analysée en streaming ; les enregistrements sont
+        aplatis (``flatten_record``) dans les colonnes de FLAT_FIELDS,
+        comme ceux de ``export_search``. Ce mode ne prend pas en charge la
+        reprise.
+
+        Args:
+            export_types: Types de ressources à exporter
+            query: Requête de recherche optionnelle
+            max_results: Nombre maximum de résultats par type (max 5000)
+            **kwargs: Filtres (categories, verified, city, region)
+
+        Returns:
+            ExportSummary: Bilan de l'export
+        """
+        start_time = time.time()
+        writer = None
+        rows = 0
+        batch: List[Dict[str, Any]] = []
+
+        try:
+            # La priorité s'applique à la requête émise à la première itération
+            with priority_scope(self.priority):
+                for resource_type, record in self.client.export_stream(
+                    export_types, query=query, max_results=max_results, **kwargs
+                ):
+                    if writer is None:
+                        writer = _WRITERS[self.format](self.output_path, FLAT_FIELDS)
+
+                    batch.append(flatten_record(resource_type, record))
+                    rows += 1
+                    if len(batch) >= self.page_size:
+                        writer.write_rows(batch)
+                        batch = []
+
+            if writer is not None and batch:
+                writer.write_rows(batch)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return ExportSummary(
+            output_path=self.output_path,
+            format=self.format,
+            rows=rows,
+            pages=1,
+            resumed_from_page=0,
+            duration=time.time() - start_time
+        )
+
+    def _fetch_page(self, page: int, search_params: Dict[str, Any]) -> SearchResults:
+        # Appelé dans les threads de l'export : la priorité y est appliquée à chaque page.
+        # Les pages ne passent pas par le cache du client (mémoire bornée par la fenêtre)
+        with priority_scope(self.priority), cache_policy_scope(CachePolicy(bypass=True)):
+            return self.client.search(page=page, limit=self.page_size, **search_params)
+
+    def _total_pages(self, first: SearchResults) -> int:
+        if first.pagination:
+            return first.pagination.total_pages
+        return -(-first.total // self.page_size)
+
+    def _fingerprint(self, search_params: Dict[str, Any]) -> str:
+        payload = json.dumps(
+            {'params': search_params, 'page_size': self.page_size, 'format': self.format},
+            sort_keys=True,
+            default=lambda value: getattr(value, 'value', str(value))
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _load_checkpoint(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        if not (os.path.exists(self.checkpoint_path) and os.path.exists(self.output_path)):
+            return None
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if checkpoint.get('fingerprint') != fingerprint:
+            return None
+        return checkpoint
+
+    def _save_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        # Écriture atomique pour ne jamais laisser un point de reprise tronqué
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+
+class _completed:
+    """Future déjà résolue (première page récupérée avant la fenêtre)"""
+
+    def __init__(self, value: Any):
+        self._value = value
+
+    def result(self) -> Any:
+        return self._value
+
@@ -0,0 +1,312 @@
+"""
+Instrumentation des requêtes HTTP du client
+
+Chaque appel du client produit un ``RequestEvent`` transmis aux hooks
+enregistrés avec ``ROMAPISearchClient.add_hook`` :
+
+- ``request`` : avant l'envoi (ou la lecture du cache) ;
+- ``response`` : après le décodage de la réponse (ou un succès du cache) ;
+- ``error`` : après un échec, avec l'exception levée.
+
+Les durées par phase (DNS, connexion TCP, TLS, premier octet, téléchargement,
+décodage JSON) sont mesurées par des connexions urllib3 instrumentées,
+montées sur la session via ``InstrumentedHTTPAdapter`` : aucun
+monkey-patching de ``requests`` n'est nécessaire.
+
+Example:
+    >>> def log_slow(event):
+    ...     if event.timing.total > 0.5:
+    ...         print(event.endpoint, event.timing.to_dict())
+    >>> client.add_hook('response', log_slow)
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.timeout import Timeout
+
+from .deadline import current_deadline
+from .resolver import resolve_host
+
+HOOK_EVENTS = ('request', 'response', 'error')
+
+# Issue de la lecture du cache local
+CACHE_HIT = 'hit'
+CACHE_MISS = 'miss'
+CACHE_REVALIDATED = 'revalidated'
+
+Hook = Callable[['RequestEvent'], None]
+
+
+@dataclass
+class RequestTiming:
+    """
+    Durées d'une requête par phase, en secondes
+
+    ``dns``, ``connect`` et ``tls`` valent 0 lorsqu'une connexion du pool est
+    réutilisée. ``ttfb`` mesure l'attente des en-têtes de la réponse après
+    l'envoi de la requête. Avec des retries, les phases réseau sont cumulées
+    sur toutes les tentatives ; ``total`` inclut en plus les attentes de
+    backoff, l'attente dans la file de l'ordonnanceur (``queue``) et le
+    temps passé dans le SDK.
+    """
+    queue: float = 0.0
+    dns: float = 0.0
+    connect: float = 0.0
+    tls: float = 0.0
+    ttfb: float = 0.0
+    download: float = 0.0
+    parse: float = 0.0
+    total: float = 0.0
+    attempts: int = 0
+    connection_reused: bool = True
+    # Instant (perf_counter) de réception des derniers en-têtes
+    headers_received_at: float = field(default=0.0, repr=False)
+
+    @property
+    def network(self) -> float:
+        """Temps réseau mesuré (DNS, connexion, TLS, premier octet, téléchargement)"""
+        return self.dns + self.connect + self.tls + self.ttfb + self.download
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'queue': self.queue,
+            'dns': self.dns,
+            'connect': self.connect,
+            'tls': self.tls,
+            'ttfb': self.ttfb,
+            'download': self.download,
+            'parse': self.parse,
+            'network': self.network,
+            'total': self.total,
+            'attempts': self.attempts,
+            'connection_reused': self.connection_reused,
+        }
+
+
+@dataclass
+class RequestEvent:
+    """Requête observée par les hooks d'instrumentation"""
+    method: str
+    endpoint: str
+    url: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    status_code: Optional[int] = None
+    cache: Optional[str] = None
+    cache_age: Optional[float] = None
+    retries: int = 0
+    bytes_received: int = 0
+    timing: RequestTiming = field(default_factory=RequestTiming)
+    error: Optional[BaseException] = None
+    started_at: float = field(default_factory=time.time)
+
+    @property
+    def from_cache(self) -> bool:
+        return self.cache in (CACHE_HIT, CACHE_REVALIDATED)
+
+
+# Mesures de la requête en cours dans le thread (les connexions y écrivent)
+
+_current = threading.local()
+
+
+def current_timing() -> Optional[RequestTiming]:
+    """Mesures de la requête en cours dans ce thread (None hors d'une requête instrumentée)"""
+    return getattr(_current, 'timing', None)
+
+
+@contextmanager
+def timing_scope(timing: RequestTiming) -> Iterator[RequestTiming]:
+    """Associer des mesures aux requêtes HTTP émises dans le bloc"""
+    previous = current_timing()
+    _current.timing = timing
+    try:
+        yield timing
+    finally:
+        _current.timing = previous
+
+
+class _TimedConnectionMixin:
+    """Mesure la résolution DNS, la connexion TCP, TLS et l'attente des en-têtes"""
+
+    # Cache DNS partagé par les connexions du pool (voir ``timed_pool_classes``)
+    resolver = None
+
+    def _new_conn(self):
+        timing = current_timing()
+        resolver = self.resolver
+        if timing is None and resolver is None:
+            return super()._new_conn()
+
+        started = time.perf_counter()
+        dns_host = self._dns_host
+        try:
+            # Résolution séparée (mesurée, éventuellement en cache) ; la connexion cible les adresses obtenues
+            if resolver is not None:
+                addresses = resolver.resolve_all(dns_host, self.port)
+            else:
+                addresses = resolve_host(dns_host, self.port)
+        except OSError:
+            addresses = [None]
+        resolved = time.perf_counter()
+        if timing is not None:
+            timing.dns += resolved - started
+
+        try:
+            # Comme socket.create_connection : adresse suivante si la connexion échoue
+            for index, address in enumerate(addresses):
+                if address is not None:
+                    self._dns_host = address
+                try:
+                    sock = super()._new_conn()
+                    break
+                except Exception:
+                    if index == len(addresses) - 1:
+                        # Adresses en cache peut-être obsolètes : la tentative suivante résoudra à nouveau
+                        if resolver is not None and address is not None:
+                            resolver.invalidate(dns_host)
+                        raise
+        finally:
+            self._dns_host = dns_host
+            if timing is not None:
+                timing.connect += time.perf_counter() - resolved
+        if timing is not None:
+            timing.connection_reused = False
+        return sock
+
+    def getresponse(self, *args, **kwargs):
+        timing = current_timing()
+        if timing is None:
+            return super().getresponse(*args, **kwargs)
+
+        started = time.perf_counter()
+        response = super().getresponse(*args, **kwargs)
+        timing.headers_received_at = time.perf_counter()
+        timing.ttfb += timing.headers_received_at - started
+        return response
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+
+    def connect(self):
+        timing = current_timing()
+        if timing is None:
+            return super().connect()
+
+        started = time.perf_counter()
+        before = timing.dns + timing.connect
+        super().connect()
+        # Le reste de connect() après _new_conn() est la poignée de main TLS
+        elapsed = time.perf_counter() - started
+        timing.tls += max(elapsed - (timing.dns + timing.connect - before), 0.0)
+
+
+class _CountingPoolMixin:
+    """
+    Compte les tentatives (urlopen est rappelé à chaque retry) et réduit
+    leurs timeouts au temps restant avant l'échéance de l'appel
+    """
+
+    def urlopen(self, *args, **kwargs):
+        timing = current_timing()
+        if timing is not None:
+            timing.attempts += 1
+        deadline = current_deadline()
+        if deadline is not None:
+            timeout = kwargs.get('timeout', self.timeout)
+            if isinstance(timeout, Timeout):
+                timeout = (_seconds(timeout.connect_timeout), _seconds(timeout.read_timeout))
+            else:
+                timeout = _seconds(timeout)
+            connect, read = deadline.timeouts(timeout)
+            kwargs['timeout'] = Timeout(connect=connect, read=read)
+        return super().urlopen(*args, **kwargs)
+
+
+def _seconds(value: Any) -> Optional[float]:
+    # Les valeurs par défaut d'urllib3 sont des sentinelles, pas des nombres
+    return value if isinstance(value, (int, float)) else None
+
+
+class TimedHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+def timed_pool_classes(resolver: Any = None) -> Dict[str, type]:
+    """
+    Classes de pool instrumentées par schéma (``PoolManager.pool_classes_by_scheme``)
+
+    Args:
+        resolver: Cache DNS utilisé par les connexions (voir ``DNSCache``)
+    """
+    if resolver is None:
+        return {'http': TimedHTTPConnectionPool, 'https': TimedHTTPSConnectionPool}
+    return {
+        'http': type('TimedHTTPConnectionPool', (TimedHTTPConnectionPool,), {
+            'ConnectionCls': type('TimedHTTPConnection', (TimedHTTPConnection,), {'resolver': resolver}),
+        }),
+        'https': type('TimedHTTPSConnectionPool', (TimedHTTPSConnectionPool,), {
+            'ConnectionCls': type('TimedHTTPSConnection', (TimedHTTPSConnection,), {'resolver': resolver}),
+        }),
+    }
+
+
+def warm_pool(pool: HTTPConnectionPool, connections: int) -> int:
+    """
+    Ouvrir des connexions à l'avance dans un pool urllib3
+
+    Args:
+        pool: Pool de connexions vers l'hôte
+        connections: Nombre de connexions souhaitées (borné par la taille du pool)
+
+    Returns:
+        int: Nombre de connexions ouvertes
+    """
+    checked_out = []
+    opened = 0
+    try:
+        for _ in range(connections):
+            try:
+                conn = pool._get_conn(timeout=0)
+            except Exception:
+                break
+            checked_out.append(conn)
+            if conn.sock is None:
+                conn.connect()
+                opened += 1
+    finally:
+        # Toutes les connexions sont rendues ensemble : sinon la même serait réutilisée
+        for conn in checked_out:
+            pool._put_conn(conn)
+    return opened
+
+
+class InstrumentedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter dont les connexions alimentent ``current_timing()``
+
+    Args:
+        resolver: Cache DNS utilisé par les connexions (optionnel)
+    """
+
+    def __init__(self, *args, resolver: Any = None, **kwargs):
+        self.resolver = resolver
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = timed_pool_classes(getattr(self, 'resolver', None))
@@ -0,0 +1,314 @@
+"""
+Générateur de charge : rejoue un journal de requêtes à travers le client
+
+Le journal est un fichier JSONL dont chaque ligne décrit un appel :
+
+    {"op": "search", "query": "restaurant douala", "verified": true, "limit": 20}
+    {"op": "suggest", "query": "rest", "limit": 8}
+    {"op": "nearby", "latitude": 4.05, "longitude": 9.77, "radius": 5}
+
+``op`` vaut ``search`` (défaut), ``suggest`` ou ``nearby`` ; les autres clés
+sont les paramètres de la méthode correspondante du client. Deux modes :
+
+- boucle ouverte (``qps``) : les requêtes partent à cadence fixe quelle que
+  soit la durée des précédentes ; la latence est mesurée depuis l'instant
+  prévu, ce qui inclut l'attente en cas de saturation ;
+- boucle fermée (``workers``) : N workers enchaînent les requêtes.
+"""
+
+import json
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import cycle
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from .exceptions import ValidationError
+from .types import ResourceType, SortField, SortOrder
+
+OPERATIONS = ('search', 'suggest', 'nearby')
+
+# Paramètres du journal à convertir en enums
+_ENUM_PARAMS = {
+    'sort': SortField,
+    'order': SortOrder,
+}
+
+
+@dataclass
+class QueryLogEntry:
+    """Appel rejoué par le générateur de charge"""
+    op: str
+    params: Dict[str, Any]
+
+
+def load_query_log(path: str) -> List[QueryLogEntry]:
+    """
+    Lire un journal de requêtes JSONL
+
+    Args:
+        path: Chemin du fichier JSONL
+
+    Returns:
+        List[QueryLogEntry]: Appels à rejouer
+
+    Raises:
+        ValidationError: Si une ligne est invalide
+    """
+    entries = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data = json.loads(line)
+            except ValueError as e:
+                raise ValidationError(f"Invalid JSON on line {line_number}: {e}")
+            entries.append(parse_query_log_entry(data, line_number))
+    if not entries:
+        raise ValidationError(f"Query log {path} is empty")
+    return entries
+
+
+def parse_query_log_entry(data: Dict[str, Any], line_number: int = 0) -> QueryLogEntry:
+    """Convertir une ligne du journal en appel du client"""
+    params = dict(data)
+    op = params.pop('op', 'search')
+    if op not in OPERATIONS:
+        raise ValidationError(f"Unknown operation '{op}' on line {line_number}")
+
+    if 'resource_types' in params:
+        params['resource_types'] = [ResourceType(value) for value in params['resource_types']]
+    for name, enum_class in _ENUM_PARAMS.items():
+        if name in params:
+            params[name] = enum_class(params[name])
+    return QueryLogEntry(op=op, params=params)
+
+
+@dataclass
+class LoadTestReport:
+    """Résultats d'un test de charge (latences en secondes)"""
+    requests: int
+    errors: int
+    duration: float
+    latencies: List[float] = field(repr=False, default_factory=list)
+    error_classes: Dict[str, int] = field(default_factory=dict)
+    requests_by_op: Dict[str, int] = field(default_factory=dict)
+    cache_hits: int = 0
+    cache_misses: int = 0
+    target_qps: Optional[float] = None
+    workers: Optional[int] = None
+
+    @property
+    def throughput(self) -> float:
+        """Requêtes terminées par seconde"""
+        return self.requests / self.duration if self.duration else 0.0
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
+
+    def percentile(self, p: float) -> float:
+        """Percentile de latence (p entre 0 et 100, méthode du rang le plus proche)"""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(math.ceil(p / 100 * len(ordered)) - 1, 0)
+        return ordered[min(rank, len(ordered) - 1)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        ordered = sorted(self.latencies)
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'duration': self.duration,
+            'throughput': self.throughput,
+            'target_qps': self.target_qps,
+            'workers': self.workers,
+            'latency': {
+                'min': ordered[0] if ordered else 0.0,
+                'p50': self.percentile(50),
+                'p90': self.percentile(90),
+                'p99': self.percentile(99),
+                'p999': self.percentile(99.9),
+                'max': ordered[-1] if ordered else 0.0,
+            },
+            'error_classes': dict(self.error_classes),
+            'requests_by_op': dict(self.requests_by_op),
+            'cache_hit_ratio': self.cache_hit_ratio,
+        }
+
+    def format(self) -> str:
+        """Rapport lisible"""
+        lines = [
+            f"Requêtes      : {self.requests} ({self.errors} erreurs) en {self.duration:.2f} s",
+            f"Débit         : {self.throughput:.1f} req/s"
+            + (f" (cible {self.target_qps:g})" if self.target_qps else ''),
+            "Latence       : " + "  ".join(
+                f"{name} {self.percentile(p) * 1000:.1f} ms"
+                for name, p in (('p50', 50), ('p90', 90), ('p99', 99), ('p999', 99.9))
+            ),
+            f"Cache         : {self.cache_hit_ratio * 100:.1f}% de succès",
+        ]
+        if self.requests_by_op:
+            lines.append("Opérations    : " + ", ".join(
+                f"{op}={count}" for op, count in sorted(self.requests_by_op.items())
+            ))
+        if self.error_classes:
+            lines.append("Erreurs       : " + ", ".join(
+                f"{name}={count}" for name, count in sorted(self.error_classes.items())
+            ))
+        return "\n".join(lines)
+
+
+class LoadGenerator:
+    """
+    Rejoue un journal de requêtes à travers un ROMAPISearchClient
+
+    Args:
+        client: Client utilisé pour les appels (partagé entre les threads)
+        entries: Appels à rejouer (le journal est parcouru en boucle)
+
+    Example:
+        >>> generator = LoadGenerator(client, load_query_log("queries.jsonl"))
+        >>> report = generator.run(qps=50, duration=60)
+        >>> print(report.format())
+    """
+
+    def __init__(self, client: Any, entries: Iterable[QueryLogEntry]):
+        self.client = client
+        self.entries = list(entries)
+        if not self.entries:
+            raise ValidationError("At least one query log entry is required")
+        self._lock = threading.Lock()
+
+    def run(
+        self,
+        qps: Optional[float] = None,
+        workers: Optional[int] = None,
+        duration: Optional[float] = None,
+        max_requests: Optional[int] = None,
+        max_concurrency: int = 64
+    ) -> LoadTestReport:
+        """
+        Exécuter le test de charge
+
+        Args:
+            qps: Cadence cible en boucle ouverte
+            workers: Nombre de workers en boucle fermée (si qps n'est pas fourni)
+            duration: Durée maximale en secondes
+            max_requests: Nombre maximum de requêtes (défaut: une passe du journal)
+            max_concurrency: Requêtes simultanées maximum en boucle ouverte
+
+        Returns:
+            LoadTestReport: Latences, débit, erreurs et ratio de cache
+        """
+        if qps is None and workers is None:
+            raise ValidationError("Either qps or workers is required")
+        if qps is not None and qps <= 0:
+            raise ValidationError("qps must be > 0")
+        if workers is not None and workers < 1:
+            raise ValidationError("workers must be >= 1")
+        if duration is None and max_requests is None:
+            max_requests = len(self.entries)
+
+        report = LoadTestReport(requests=0, errors=0, duration=0.0, target_qps=qps, workers=workers)
+        cache = getattr(self.client, 'cache', None)
+        cache_hits = cache.hits if cache else 0
+        cache_misses = cache.misses if cache else 0
+
+        start = time.perf_counter()
+        deadline = start + duration if duration is not None else None
+        if qps is not None:
+            self._run_open_loop(report, qps, deadline, max_requests, max_concurrency)
+        else:
+            self._run_closed_loop(report, workers, deadline, max_requests)
+        report.duration = time.perf_counter() - start
+
+        if cache:
+            report.cache_hits = cache.hits - cache_hits
+            report.cache_misses = cache.misses - cache_misses
+        return report
+
+    def _run_open_loop(
+        self,
+        report: LoadTestReport,
+        qps: float,
+        deadline: Optional[float],
+        max_requests: Optional[int],
+        max_concurrency: int
+    ) -> None:
+        interval = 1.0 / qps
+        entries = cycle(self.entries)
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            sent = 0
+            while max_requests is None or sent < max_requests:
+                scheduled = start + sent * interval
+                if deadline is not None and scheduled >= deadline:
+                    break
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                executor.submit(self._execute, next(entries), scheduled, report)
+                sent += 1
+
+    def _run_closed_loop(
+        self,
+        report: LoadTestReport,
+        workers: int,
+        deadline: Optional[float],
+        max_requests: Optional[int]
+    ) -> None:
+        entries = self._limited(cycle(self.entries), max_requests)
+
+        def worker() -> None:
+            while deadline is None or time.perf_counter() < deadline:
+                with self._lock:
+                    entry = next(entries, None)
+                if entry is None:
+                    return
+                self._execute(entry, time.perf_counter(), report)
+
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    @staticmethod
+    def _limited(entries: Iterator[QueryLogEntry], limit: Optional[int]) -> Iterator[QueryLogEntry]:
+        count = 0
+        for entry in entries:
+            if limit is not None and count >= limit:
+                return
+            count += 1
+            yield entry
+
+    def _execute(self, entry: QueryLogEntry, started: float, report: LoadTestReport) -> None:
+        error_class = None
+        try:
+            self._operation(entry.op)(**entry.params)
+        except Exception as e:
+            error_class = type(e).__name__
+        latency = time.perf_counter() - started
+
+        with self._lock:
+            report.requests += 1
+            report.latencies.append(latency)
+            report.requests_by_op[entry.op] = report.requests_by_op.get(entry.op, 0) + 1
+            if error_class:
+                report.errors += 1
+                report.error_classes[error_class] = report.error_classes.get(error_class, 0) + 1
+
+    def _operation(self, op: str) -> Callable[..., Any]:
+        if op == 'suggest':
+            return self.client.suggest
+        if op == 'nearby':
+            return self.client.search_nearby
+        return self.client.search
@@ -0,0 +1,368 @@
+"""
+Registre de métriques du client (compteurs, jauges, histogrammes)
+
+Les métriques sont alimentées par les hooks d'instrumentation du client et
+exportées au format texte Prometheus ou sous forme de dictionnaire.
+Chaque métrique possède son propre verrou, tenu le temps de quelques
+additions : l'index du bucket et les étiquettes sont calculés en dehors.
+
+Example:
+    >>> client = ROMAPISearchClient()
+    >>> client.search(query="restaurant")
+    >>> print(client.metrics.to_prometheus())
+    >>> client.metrics.snapshot()['romapi_requests_total']
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .exceptions import ValidationError
+from .instrumentation import CACHE_HIT, CACHE_MISS, CACHE_REVALIDATED, RequestEvent
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+
+
+class _Metric:
+    type_name = ''
+
+    def __init__(self, name: str, help: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _labels(self, labels: Dict[str, Any]) -> LabelValues:
+        if len(labels) != len(self.label_names):
+            raise ValidationError(f"Metric {self.name} expects labels {self.label_names}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def samples(self) -> Iterator[Tuple[str, Dict[str, str], float]]:
+        """Échantillons (suffixe, étiquettes, valeur) au format Prometheus"""
+        raise NotImplementedError
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Compteur monotone par combinaison d'étiquettes"""
+    type_name = 'counter'
+
+    def __init__(self, name: str, help: str, label_names: Sequence[str] = ()):
+        super().__init__(name, help, label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set_total(self, value: float, **labels: Any) -> None:
+        """Fixer le total (compteurs recopiés depuis une source déjà monotone)"""
+        key = self._labels(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._labels(labels), 0.0)
+
+    def samples(self) -> Iterator[Tuple[str, Dict[str, str], float]]:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield '', dict(zip(self.label_names, key)), value
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        return [{'labels': labels, 'value': value} for _, labels, value in self.samples()]
+
+
+class Gauge(Counter):
+    """Valeur instantanée par combinaison d'étiquettes"""
+    type_name = 'gauge'
+
+    def set(self, value: float, **labels: Any) -> None:
+        self.set_total(value, **labels)
+
+
+class Histogram(_Metric):
+    """Histogramme à buckets fixes par combinaison d'étiquettes"""
+    type_name = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    ):
+        super().__init__(name, help, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Par série : [compteurs par bucket (+Inf en dernier), somme, nombre]
+        self._series: Dict[LabelValues, List[Any]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._labels(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def _copy(self) -> List[Tuple[LabelValues, List[int], float, int]]:
+        with self._lock:
+            return [(key, list(s[0]), s[1], s[2]) for key, s in self._series.items()]
+
+    def samples(self) -> Iterator[Tuple[str, Dict[str, str], float]]:
+        for key, counts, total, count in self._copy():
+            labels = dict(zip(self.label_names, key))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                yield '_bucket', {**labels, 'le': _format_value(bound)}, cumulative
+            yield '_sum', labels, total
+            yield '_count', labels, count
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        result = []
+        for key, counts, total, count in self._copy():
+            cumulative = 0
+            buckets = {}
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                buckets[_format_value(bound)] = cumulative
+            result.append({
+                'labels': dict(zip(self.label_names, key)),
+                'count': count,
+                'sum': total,
+                'buckets': buckets,
+            })
+        return result
+
+
+def _format_value(value: float) -> str:
+    return '+Inf' if value == float('inf') else repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+class MetricsRegistry:
+    """
+    Ensemble de métriques exportables
+
+    Les collecteurs enregistrés avec ``add_collector`` sont appelés avant
+    chaque export pour mettre à jour les métriques lues à la demande.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.label_names != metric.label_names:
+                    raise ValidationError(f"Metric {metric.name} already registered with another definition")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labels))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labels, buckets))
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        self._collectors.append(collector)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def _collect(self) -> List[_Metric]:
+        for collector in self._collectors:
+            collector()
+        return list(self._metrics.values())
+
+    def to_prometheus(self) -> str:
+        """
+        Exporter au format texte Prometheus (version 0.0.4)
+
+        Returns:
+            str: Exposition des métriques (HELP, TYPE et échantillons)
+        """
+        lines = []
+        for metric in self._collect():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            for suffix, labels, value in metric.samples():
+                label_text = ','.join(f'{k}="{_escape_label(v)}"' for k, v in labels.items())
+                name = metric.name + suffix
+                lines.append(f"{name}{{{label_text}}} {value:g}" if label_text else f"{name} {value:g}")
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Photographie des métriques sous forme de dictionnaire
+
+        Returns:
+            Dict: Nom de métrique -> liste de séries (étiquettes et valeurs)
+        """
+        return {metric.name: metric.snapshot() for metric in self._collect()}
+
+
+# Les identifiants de catégorie sont remplacés pour borner la cardinalité
+_ENDPOINT_TEMPLATES = [
+    (re.compile(r'^/search/categories/(?!hierarchy$)[^/]+/hierarchy$'), '/search/categories/{id}/hierarchy'),
+    (re.compile(r'^/search/categories/(?!hierarchy$)[^/]+$'), '/search/categories/{slug}'),
+]
+
+
+def endpoint_label(endpoint: str) -> str:
+    """Étiquette d'endpoint à cardinalité bornée"""
+    for pattern, template in _ENDPOINT_TEMPLATES:
+        if pattern.match(endpoint):
+            return template
+    return endpoint
+
+
+class ClientMetrics(MetricsRegistry):
+    """
+    Métriques opérationnelles d'un ROMAPISearchClient
+
+    - ``romapi_requests_total{endpoint,status}`` : requêtes terminées
+      (``status="cache"`` pour les réponses servies par le cache local) ;
+    - ``romapi_request_duration_seconds{endpoint}`` : latence des requêtes
+      réseau (hors succès du cache) ;
+    - ``romapi_errors_total{endpoint,error}`` : erreurs par classe d'exception ;
+    - ``romapi_cache_hits_total``, ``romapi_cache_misses_total``,
+      ``romapi_cache_revalidations_total``, ``romapi_cache_evictions_total`` ;
+    - ``romapi_cache_raw_hits_total`` : succès estimés du cache sans
+      canonicalisation des requêtes (taux de succès avant / après) ;
+    - ``romapi_retries_total{endpoint}`` : tentatives supplémentaires ;
+    - ``romapi_rate_limit_remaining`` / ``romapi_rate_limit_limit`` ;
+    - ``romapi_replica_in_flight{replica}``, ``romapi_replica_latency_seconds{replica}``,
+      ``romapi_replica_ejected{replica}`` : état des réplicas (plusieurs URLs de base) ;
+    - ``romapi_scheduler_in_flight``, ``romapi_scheduler_queued{priority}``,
+      ``romapi_scheduler_wait_seconds_total{priority}`` : ordonnanceur par priorité ;
+    - ``romapi_prefetch_total{outcome}`` : préchargements prédictifs (lancés,
+      préchargés, utilisés, jamais utilisés...).
+
+    Args:
+        client: Client observé (cache et informations de rate limiting)
+        buckets: Bornes de l'histogramme de latence en secondes
+    """
+
+    def __init__(self, client: Any = None, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__()
+        self.client = client
+        self.requests = self.counter('romapi_requests_total', "Requêtes terminées", ('endpoint', 'status'))
+        self.latency = self.histogram(
+            'romapi_request_duration_seconds', "Latence des requêtes réseau", ('endpoint',), buckets
+        )
+        self.errors = self.counter('romapi_errors_total', "Erreurs par classe d'exception", ('endpoint', 'error'))
+        self.cache_hits = self.counter('romapi_cache_hits_total', "Réponses servies par le cache local")
+        self.cache_misses = self.counter('romapi_cache_misses_total', "Lectures du cache local sans résultat")
+        self.cache_revalidations = self.counter(
+            'romapi_cache_revalidations_total', "Entrées du cache revalidées par une réponse 304"
+        )
+        self.cache_evictions = self.counter('romapi_cache_evictions_total', "Entrées expirées retirées du cache")
+        self.cache_raw_hits = self.counter(
+            'romapi_cache_raw_hits_total', "Succès estimés du cache sans canonicalisation des requêtes"
+        )
+        self.retries = self.counter('romapi_retries_total', "Tentatives supplémentaires", ('endpoint',))
+        self.rate_limit_remaining = self.gauge('romapi_rate_limit_remaining', "Requêtes restantes (X-RateLimit)")
+        self.rate_limit_limit = self.gauge('romapi_rate_limit_limit', "Limite de requêtes (X-RateLimit)")
+        self.replica_in_flight = self.gauge('romapi_replica_in_flight', "Requêtes en cours par réplica", ('replica',))
+        self.replica_latency = self.gauge(
+            'romapi_replica_latency_seconds', "Latence moyenne observée par réplica", ('replica',)
+        )
+        self.replica_ejected = self.gauge('romapi_replica_ejected', "Réplica éjecté (1) ou disponible (0)", ('replica',))
+        self.scheduler_in_flight = self.gauge('romapi_scheduler_in_flight', "Requêtes en vol (ordonnanceur)")
+        self.scheduler_queued = self.gauge(
+            'romapi_scheduler_queued', "Requêtes en attente par priorité", ('priority',)
+        )
+        self.scheduler_wait = self.counter(
+            'romapi_scheduler_wait_seconds_total', "Attente cumulée dans l'ordonnanceur", ('priority',)
+        )
+        self.prefetch = self.counter('romapi_prefetch_total', "Préchargements prédictifs par issue", ('outcome',))
+        self.add_collector(self._collect_client)
+
+    def observe_response(self, event: RequestEvent) -> None:
+        """Hook ``response`` du client"""
+        endpoint = endpoint_label(event.endpoint)
+        if event.cache == CACHE_HIT:
+            self.requests.inc(endpoint=endpoint, status='cache')
+            self.cache_hits.inc()
+            return
+
+        self.requests.inc(endpoint=endpoint, status=event.status_code)
+        self.latency.observe(event.timing.total, endpoint=endpoint)
+        self._observe_common(event, endpoint)
+        if event.cache == CACHE_REVALIDATED:
+            self.cache_revalidations.inc()
+
+    def observe_error(self, event: RequestEvent) -> None:
+        """Hook ``error`` du client"""
+        endpoint = endpoint_label(event.endpoint)
+        self.requests.inc(endpoint=endpoint, status=event.status_code or 'error')
+        self.latency.observe(event.timing.total, endpoint=endpoint)
+        self.errors.inc(endpoint=endpoint, error=type(event.error).__name__)
+        self._observe_common(event, endpoint)
+
+    def _observe_common(self, event: RequestEvent, endpoint: str) -> None:
+        if event.cache == CACHE_MISS or event.cache == CACHE_REVALIDATED:
+            self.cache_misses.inc()
+        if event.retries:
+            self.retries.inc(event.retries, endpoint=endpoint)
+
+    def _collect_client(self) -> None:
+        client = self.client
+        if client is None:
+            return
+        cache = getattr(client, 'cache', None)
+        if cache is not None:
+            self.cache_evictions.set_total(cache.evictions)
+        canonicalizer = getattr(client, 'canonicalizer', None)
+        if cache is not None and canonicalizer is not None:
+            self.cache_raw_hits.set_total(canonicalizer.stats['raw_hits'])
+        rate_limit_info = getattr(client, 'rate_limit_info', None)
+        if rate_limit_info:
+            self.rate_limit_remaining.set(rate_limit_info['remaining'])
+            self.rate_limit_limit.set(rate_limit_info['limit'])
+        balancer = getattr(client, 'balancer', None)
+        if balancer is not None:
+            for replica in balancer.snapshot():
+                self.replica_in_flight.set(replica['in_flight'], replica=replica['base_url'])
+                self.replica_latency.set(replica['latency'] or 0.0, replica=replica['base_url'])
+                self.replica_ejected.set(int(replica['ejected']), replica=replica['base_url'])
+        scheduler = getattr(client, 'scheduler', None)
+        if scheduler is not None:
+            state = scheduler.snapshot()
+            self.scheduler_in_flight.set(state['in_flight'])
+            for priority, queued in state['queued'].items():
+                self.scheduler_queued.set(queued, priority=priority)
+                self.scheduler_wait.set_total(state['wait_time'][priority], priority=priority)
+        prefetcher = getattr(client, 'prefetcher', None)
+        if prefetcher is not None:
+            for outcome, total in dict(prefetcher.stats).items():
+                self.prefetch.set_total(total, outcome=outcome)
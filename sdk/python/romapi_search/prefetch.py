@@ -0,0 +1,236 @@
+"""
+Préchargement prédictif des requêtes suivantes probables
+
+Après la page 1 d'une recherche, les utilisateurs ouvrent très souvent la
+page 2 ; après une catégorie, sa sous-catégorie la plus fournie. Lorsqu'il
+est activé (``ROMAPISearchClient(prefetch=True)``), le
+``PredictivePrefetcher`` applique des prédicteurs à chaque résultat servi
+et charge en tâche de fond, en priorité BACKGROUND, les requêtes prédites
+dans le cache : si l'utilisateur les demande, elles sont servies depuis la
+mémoire.
+
+Un prédicteur est une fonction ``(endpoint, params, results)`` qui renvoie
+des ``Prediction``. Les préchargements sont suspendus lorsque la marge du
+quota (en-têtes ``X-RateLimit-*``) est faible, et leur précision est suivie
+dans ``stats`` (préchargés puis utilisés, ou jamais utilisés).
+
+Example:
+    >>> client = ROMAPISearchClient(prefetch=True)
+    >>> client.search(query="restaurant")          # précharge la page 2
+    >>> client.search(query="restaurant", page=2)  # servie par le cache
+    >>> client.prefetcher.accuracy
+    1.0
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .cache import CachePolicy, cache_policy_scope
+from .exceptions import ROMAPIError
+from .scheduler import BACKGROUND, current_priority, priority_scope
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Prediction:
+    """Requête GET prédite (endpoint et paramètres de requête)"""
+    endpoint: str
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+Predictor = Callable[[str, Dict[str, Any], Any], Iterable[Prediction]]
+
+
+def next_page(endpoint: str, params: Dict[str, Any], results: Any) -> List[Prediction]:
+    """Page suivante d'un résultat paginé"""
+    pagination = getattr(results, 'pagination', None)
+    if pagination is None or not pagination.has_next:
+        return []
+    return [Prediction(endpoint, {**params, 'page': pagination.page + 1})]
+
+
+def top_subcategory(endpoint: str, params: Dict[str, Any], results: Any) -> List[Prediction]:
+    """Première page de la sous-catégorie comptant le plus de ressources"""
+    subcategories = getattr(results, 'subcategories', None)
+    if not subcategories:
+        return []
+    top = max(subcategories, key=lambda category: category.resource_count)
+    follow_up = {key: value for key, value in params.items() if key != 'page'}
+    # Même forme d'URL que la requête d'origine (par ID avec hiérarchie, ou par slug)
+    if endpoint.endswith('/hierarchy'):
+        return [Prediction(f'/search/categories/{top.id}/hierarchy', follow_up)]
+    return [Prediction(f'/search/categories/{top.slug}', follow_up)]
+
+
+DEFAULT_PREDICTORS: Tuple[Predictor, ...] = (next_page, top_subcategory)
+
+
+def _request_key(endpoint: str, params: Dict[str, Any]) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    return endpoint, tuple(sorted((key, str(value)) for key, value in params.items()))
+
+
+class PredictivePrefetcher:
+    """
+    Précharge en tâche de fond les requêtes suivantes probables
+
+    Args:
+        fetch: Fonction ``(endpoint, params)`` effectuant une requête GET
+            avec mise en cache
+        rate_limits: Fonction renvoyant les dernières informations de rate
+            limiting (``client.rate_limit_info``)
+        predictors: Prédicteurs appliqués à chaque résultat (défaut: page
+            suivante et sous-catégorie principale)
+        max_workers: Préchargements simultanés au maximum (défaut: 2)
+        headroom: Part de la limite du quota en dessous de laquelle les
+            préchargements sont suspendus (défaut: 0.2)
+        max_pending: Préchargements suivis au maximum en attente d'utilisation
+            (défaut: 1000)
+        canonicalize: Fonction ``(endpoint, params)`` renvoyant la forme
+            canonique des paramètres utilisée par le cache, pour reconnaître
+            une requête préchargée sous une autre forme (optionnel)
+
+    Attributes:
+        stats: Compteurs : ``scheduled`` (prédictions lancées), ``prefetched``
+            (chargées depuis l'API), ``cached`` (déjà en cache), ``used``
+            (demandées ensuite et servies par le cache), ``late`` (demandées
+            avant la fin du préchargement), ``expired`` (jamais demandées),
+            ``skipped`` (marge du quota insuffisante), ``errors``
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str, Dict[str, Any]], Any],
+        rate_limits: Callable[[], Optional[Dict[str, Any]]],
+        predictors: Sequence[Predictor] = DEFAULT_PREDICTORS,
+        max_workers: int = 2,
+        headroom: float = 0.2,
+        max_pending: int = 1000,
+        canonicalize: Optional[Callable[[str, Dict[str, Any]], Dict[str, Any]]] = None
+    ):
+        self.fetch = fetch
+        self.rate_limits = rate_limits
+        self.predictors = list(predictors)
+        self.headroom = headroom
+        self.max_pending = max_pending
+        self.canonicalize = canonicalize
+        self.stats: Dict[str, int] = {
+            'scheduled': 0, 'prefetched': 0, 'cached': 0, 'used': 0,
+            'late': 0, 'expired': 0, 'skipped': 0, 'errors': 0,
+        }
+        self._pending: 'OrderedDict[Tuple, float]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='romapi-prefetch')
+        self._closed = False
+
+    @property
+    def accuracy(self) -> float:
+        """Part des préchargements utilisés ensuite"""
+        prefetched = self.stats['prefetched']
+        return self.stats['used'] / prefetched if prefetched else 0.0
+
+    def observe(self, endpoint: str, params: Dict[str, Any], results: Any) -> None:
+        """
+        Résultat servi au code appelant : compter un préchargement utilisé
+        puis précharger les requêtes suivantes prédites
+
+        Les requêtes de priorité BACKGROUND (exports, préchauffage) ne
+        déclenchent pas de prédiction.
+
+        Args:
+            endpoint: Endpoint de la requête
+            params: Paramètres de requête
+            results: Résultat construit (avec ``request_metadata``)
+        """
+        key = self._key(endpoint, params)
+        with self._lock:
+            prefetched = self._pending.pop(key, None)
+            if prefetched is not None:
+                metadata = getattr(results, 'request_metadata', None)
+                self.stats['used' if metadata is not None and metadata.from_cache else 'late'] += 1
+
+        if current_priority() == BACKGROUND:
+            return
+        for predictor in self.predictors:
+            try:
+                predictions = list(predictor(endpoint, params, results) or ())
+            except Exception:
+                logger.exception("Prefetch predictor %r failed", predictor)
+                continue
+            for prediction in predictions:
+                self.schedule(prediction)
+
+    def schedule(self, prediction: Prediction) -> bool:
+        """
+        Lancer le préchargement d'une requête
+
+        Returns:
+            bool: True si le préchargement a été lancé
+        """
+        key = self._key(prediction.endpoint, prediction.params)
+        with self._lock:
+            if self._closed or key in self._pending:
+                return False
+            if not self._has_headroom():
+                self.stats['skipped'] += 1
+                return False
+            self._pending[key] = time.monotonic()
+            self.stats['scheduled'] += 1
+            while len(self._pending) > self.max_pending:
+                self._pending.popitem(last=False)
+                self.stats['expired'] += 1
+        self._executor.submit(self._prefetch, prediction, key)
+        return True
+
+    def _key(self, endpoint: str, params: Dict[str, Any]) -> Tuple:
+        if self.canonicalize is not None:
+            params = self.canonicalize(endpoint, params)
+        return _request_key(endpoint, params)
+
+    def _has_headroom(self) -> bool:
+        info = self.rate_limits()
+        if not info or not info.get('limit'):
+            return True
+        # Fenêtre réinitialisée depuis la dernière réponse : marge inconnue mais reconstituée
+        if info.get('reset_time') and time.time() >= info['reset_time']:
+            return True
+        return info['remaining'] > self.headroom * info['limit']
+
+    def _prefetch(self, prediction: Prediction, key: Tuple) -> None:
+        policy = CachePolicy()
+        try:
+            with priority_scope(BACKGROUND), cache_policy_scope(policy):
+                self.fetch(prediction.endpoint, prediction.params)
+        except ROMAPIError as e:
+            logger.debug("Prefetch of %s failed: %s", prediction.endpoint, e)
+            with self._lock:
+                self._pending.pop(key, None)
+                self.stats['errors'] += 1
+            return
+
+        with self._lock:
+            if policy.misses:
+                self.stats['prefetched'] += 1
+            else:
+                # Déjà en cache : rien n'a été préchargé
+                self._pending.pop(key, None)
+                self.stats['cached'] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Compteurs, précision et préchargements en attente d'utilisation"""
+        with self._lock:
+            return {**self.stats, 'pending': len(self._pending), 'accuracy': self.accuracy}
+
+    def close(self) -> None:
+        """Abandonner les préchargements en attente"""
+        with self._lock:
+            self._closed = True
+            unused = len(self._pending)
+            self._pending.clear()
+            self.stats['expired'] += unused
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,182 @@
+"""
+Quota de requêtes partagé entre processus
+
+Chaque processus d'une flotte construit son propre client et ne voit que
+ses propres en-têtes ``X-RateLimit-*`` : sans coordination, la flotte
+dépasse le quota de la clé API et alterne entre rafales et réponses 429.
+
+``FileQuotaCoordinator`` partage, entre tous les clients d'une machine
+utilisant la même clé, un petit état stocké dans un fichier verrouillé
+(``flock``) :
+
+- un seau à jetons commun (débit ``rate`` et rafale ``burst``, optionnels) ;
+- la dernière fenêtre observée auprès du serveur (limite, requêtes
+  restantes, instant de réinitialisation), décomptée à chaque requête
+  émise par n'importe quel processus ;
+- la comptabilité du quota (requêtes émises, réponses 429 reçues).
+
+Lorsque la fenêtre est épuisée, les requêtes attendent sa réinitialisation
+au lieu de recevoir des 429. Le coordinateur s'utilise comme limiteur de
+débit de l'ordonnanceur du client (``RequestScheduler``).
+
+Example:
+    >>> client = ROMAPISearchClient(api_key="key", shared_quota=True, rate_limit=20)
+    >>> client.quota.snapshot()
+    {'limit': 100, 'remaining': 37, 'reset': 1700000060.0, 'consumed': 2463, ...}
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from .exceptions import ValidationError
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def default_quota_path(api_key: Optional[str]) -> str:
+    """Fichier d'état partagé par les clients d'une même clé API (répertoire temporaire)"""
+    digest = hashlib.sha256((api_key or 'anonymous').encode('utf-8')).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f"romapi-quota-{digest}.json")
+
+
+class FileQuotaCoordinator:
+    """
+    Jetons et fenêtre de quota partagés via un fichier verrouillé
+
+    Args:
+        path: Fichier d'état (défaut: dérivé de la clé API)
+        api_key: Clé API dont le quota est partagé
+        rate: Débit commun en requêtes par seconde (défaut: aucun, seule la
+            fenêtre observée limite)
+        burst: Rafale commune autorisée (défaut: ``rate``)
+        headroom: Requêtes de la fenêtre laissées en réserve (défaut: 0)
+
+    Raises:
+        ValidationError: Si un paramètre est invalide
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        api_key: Optional[str] = None,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        headroom: int = 0
+    ):
+        if rate is not None and rate <= 0:
+            raise ValidationError("Rate must be > 0")
+        if headroom < 0:
+            raise ValidationError("Headroom must be >= 0")
+        self.path = path or default_quota_path(api_key)
+        self.rate = rate
+        self.burst = burst or (max(rate, 1.0) if rate else None)
+        self.headroom = headroom
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[Dict[str, Any]]:
+        # Verrou exclusif le temps de lire, modifier et réécrire l'état
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        with os.fdopen(fd, 'r+') as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            else:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                content = f.read()
+                try:
+                    state = json.loads(content) if content else {}
+                except ValueError:
+                    state = {}
+                yield state
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def take(self) -> float:
+        """
+        Réserver une requête dans le quota commun
+
+        Returns:
+            float: 0 si la requête peut partir, sinon délai avant de réessayer
+        """
+        now = time.time()
+        with self._locked_state() as state:
+            # Fenêtre du serveur épuisée : attendre sa réinitialisation
+            reset = state.get('reset')
+            if reset is not None and now >= reset:
+                state['remaining'] = state.get('limit')
+                state['reset'] = None
+                reset = None
+            remaining = state.get('remaining')
+            if remaining is not None and reset is not None and remaining <= self.headroom:
+                return max(reset - now, 0.01)
+
+            if self.rate:
+                tokens = state.get('tokens', self.burst)
+                tokens = min(self.burst, tokens + (now - state.get('updated', now)) * self.rate)
+                state['updated'] = now
+                if tokens < 1:
+                    state['tokens'] = tokens
+                    return (1 - tokens) / self.rate
+                state['tokens'] = tokens - 1
+
+            if remaining is not None:
+                state['remaining'] = remaining - 1
+            state['consumed'] = state.get('consumed', 0) + 1
+            return 0.0
+
+    def observe(self, limit: int, remaining: int, reset: float, throttled: bool = False) -> None:
+        """
+        Partager une observation des en-têtes ``X-RateLimit-*``
+
+        Le décompte local n'est pas relevé par une observation antérieure à
+        des requêtes déjà émises par d'autres processus : dans une même
+        fenêtre, la plus petite valeur restante est conservée.
+
+        Args:
+            limit: Limite de la fenêtre
+            remaining: Requêtes restantes annoncées par le serveur
+            reset: Instant de réinitialisation de la fenêtre (epoch, secondes)
+            throttled: Réponse 429
+        """
+        with self._locked_state() as state:
+            if state.get('reset') == reset and state.get('remaining') is not None:
+                remaining = min(remaining, state['remaining'])
+            state['limit'] = limit
+            state['remaining'] = remaining
+            state['reset'] = reset
+            if throttled:
+                state['throttled'] = state.get('throttled', 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """État partagé : fenêtre observée, jetons et comptabilité du quota"""
+        with self._locked_state() as state:
+            return {
+                'limit': state.get('limit'),
+                'remaining': state.get('remaining'),
+                'reset': state.get('reset'),
+                'tokens': state.get('tokens'),
+                'consumed': state.get('consumed', 0),
+                'throttled': state.get('throttled', 0),
+            }
+
+    def reset_state(self) -> None:
+        """Effacer l'état partagé (fenêtre, jetons et compteurs)"""
+        with self._locked_state() as state:
+            state.clear()
@@ -0,0 +1,83 @@
+"""
+Cache de résolution DNS pour les connexions du client
+
+Sans cache, chaque nouvelle connexion du pool refait une résolution DNS.
+``DNSCache`` conserve les adresses obtenues pendant un TTL. Les connexions
+essaient ces adresses dans l'ordre, comme ``socket.create_connection`` ; une
+entrée est invalidée dès que toutes ses adresses échouent, pour que la
+tentative suivante résolve à nouveau l'hôte.
+
+Example:
+    >>> cache = DNSCache(ttl=60)
+    >>> cache.resolve("api.romapi.com", 443)
+    '203.0.113.10'
+"""
+
+import socket
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+def resolve_host(host: str, port: int) -> List[str]:
+    """Adresses d'un hôte dans l'ordre renvoyé par getaddrinfo (sans doublons)"""
+    addresses: List[str] = []
+    for *_, sockaddr in socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM):
+        if sockaddr[0] not in addresses:
+            addresses.append(sockaddr[0])
+    return addresses
+
+
+class DNSCache:
+    """
+    Cache des résolutions DNS avec TTL
+
+    Args:
+        ttl: Durée de vie d'une résolution en secondes
+    """
+
+    def __init__(self, ttl: float = 60.0):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, int], Tuple[List[str], float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, host: str, port: int) -> str:
+        """
+        Adresse à utiliser pour un hôte (résolue au besoin)
+
+        Raises:
+            OSError: Si la résolution échoue
+        """
+        return self.resolve_all(host, port)[0]
+
+    def resolve_all(self, host: str, port: int) -> List[str]:
+        """Toutes les adresses d'un hôte (résolues au besoin)"""
+        key = (host, port)
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > now:
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        addresses = resolve_host(host, port)
+        if not addresses:
+            raise OSError(f"No address found for {host}")
+        with self._lock:
+            self._entries[key] = (addresses, now + self.ttl)
+        return addresses
+
+    def invalidate(self, host: Optional[str] = None) -> None:
+        """Oublier les résolutions d'un hôte (ou toutes)"""
+        with self._lock:
+            if host is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == host]:
+                    del self._entries[key]
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,248 @@
+"""
+Ordonnancement des requêtes d'un client partagé
+
+Lorsqu'un même client sert à la fois le trafic interactif (suggestions,
+recherche) et des traitements de fond (exports, analytics), le
+``RequestScheduler`` borne le nombre de requêtes en vol (taille du pool de
+connexions) et, optionnellement, leur débit (seau à jetons). Les requêtes
+en attente sont servies par file équitable pondérée (« weighted fair
+queuing ») entre classes de priorité : avec les poids par défaut, une
+requête interactive passe devant les requêtes de fond déjà en attente,
+sans que celles-ci soient affamées.
+
+La priorité d'un appel est propre au thread, comme l'échéance :
+
+Example:
+    >>> client = ROMAPISearchClient(max_concurrency=8, rate_limit=20)
+    >>> with client.priority(BACKGROUND):
+    ...     client.get_search_analytics()
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from .deadline import current_deadline
+from .exceptions import ValidationError
+
+INTERACTIVE = 'interactive'
+NORMAL = 'normal'
+BACKGROUND = 'background'
+
+# Part du service obtenue par chaque classe lorsque toutes attendent
+DEFAULT_WEIGHTS = {INTERACTIVE: 16.0, NORMAL: 4.0, BACKGROUND: 1.0}
+
+_local = threading.local()
+
+
+def current_priority() -> str:
+    """Priorité des requêtes du thread courant (défaut: NORMAL)"""
+    return getattr(_local, 'priority', NORMAL)
+
+
+@contextmanager
+def priority_scope(priority: Optional[str]) -> Iterator[str]:
+    """
+    Appliquer une priorité aux requêtes du bloc (dans ce thread)
+
+    Args:
+        priority: Classe de priorité (None conserve la priorité courante)
+    """
+    previous = current_priority()
+    if priority is None:
+        yield previous
+        return
+    _local.priority = priority
+    try:
+        yield priority
+    finally:
+        _local.priority = previous
+
+
+class TokenBucket:
+    """
+    Seau à jetons (limitation de débit côté client)
+
+    Args:
+        rate: Jetons ajoutés par seconde
+        burst: Capacité du seau (défaut: ``rate``, au moins 1)
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValidationError("Rate must be > 0")
+        self.rate = rate
+        self.burst = burst or max(rate, 1.0)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """
+        Prendre un jeton s'il y en a un
+
+        Returns:
+            float: 0 si un jeton a été pris, sinon délai avant le prochain jeton
+        """
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class _Ticket:
+    __slots__ = ('priority', 'start', 'finish', 'enqueued_at', 'cancelled')
+
+    def __init__(self, priority: str, start: float, finish: float):
+        self.priority = priority
+        self.start = start
+        self.finish = finish
+        self.enqueued_at = time.perf_counter()
+        self.cancelled = False
+
+
+class RequestScheduler:
+    """
+    File d'attente pondérée devant le pool de connexions et le limiteur de débit
+
+    Args:
+        max_concurrency: Requêtes en vol au maximum (défaut: 10, taille du
+            pool ; None pour ne limiter que le débit)
+        rate_limit: Requêtes par seconde au maximum (défaut: aucune limite)
+        burst: Rafale autorisée par le limiteur de débit (défaut: ``rate_limit``)
+        weights: Poids des classes de priorité (défaut: DEFAULT_WEIGHTS)
+        limiter: Limiteur de débit exposant ``take()`` (par exemple un quota
+            partagé entre processus) ; remplace ``rate_limit``
+
+    Raises:
+        ValidationError: Si un paramètre est invalide
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = 10,
+        rate_limit: Optional[float] = None,
+        burst: Optional[float] = None,
+        weights: Optional[Dict[str, float]] = None,
+        limiter: Any = None
+    ):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValidationError("Max concurrency must be >= 1")
+        self.max_concurrency = max_concurrency
+        if limiter is None and rate_limit:
+            limiter = TokenBucket(rate_limit, burst)
+        self.limiter = limiter
+        self.weights = dict(weights or DEFAULT_WEIGHTS)
+        if any(weight <= 0 for weight in self.weights.values()):
+            raise ValidationError("Priority weights must be > 0")
+        self.in_flight = 0
+        self.dispatched: Dict[str, int] = {priority: 0 for priority in self.weights}
+        self.wait_time: Dict[str, float] = {priority: 0.0 for priority in self.weights}
+        self._queue: List[Any] = []
+        self._queued: Dict[str, int] = {priority: 0 for priority in self.weights}
+        self._last_finish: Dict[str, float] = {}
+        self._virtual_time = 0.0
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    def acquire(self, priority: Optional[str] = None) -> float:
+        """
+        Attendre son tour (place dans le pool et jeton de débit)
+
+        Args:
+            priority: Classe de priorité (défaut: priorité du thread)
+
+        Returns:
+            float: Temps d'attente en secondes
+
+        Raises:
+            ValidationError: Si la classe de priorité est inconnue
+            TimeoutError: Si l'échéance de l'appel est atteinte pendant l'attente
+        """
+        priority = priority or current_priority()
+        weight = self.weights.get(priority)
+        if weight is None:
+            raise ValidationError(f"Unknown priority '{priority}' (expected one of {', '.join(self.weights)})")
+        deadline = current_deadline()
+
+        with self._condition:
+            # Étiquettes de la file équitable : un poids élevé avance moins le temps virtuel de sa classe
+            start = max(self._virtual_time, self._last_finish.get(priority, 0.0))
+            ticket = _Ticket(priority, start, start + 1.0 / weight)
+            self._last_finish[priority] = ticket.finish
+            heapq.heappush(self._queue, (ticket.finish, next(self._sequence), ticket))
+            self._queued[priority] += 1
+
+            try:
+                while True:
+                    delay = None
+                    if self._head() is ticket and (
+                        self.max_concurrency is None or self.in_flight < self.max_concurrency
+                    ):
+                        delay = self.limiter.take() if self.limiter is not None else 0.0
+                        if delay == 0.0:
+                            return self._dispatch(ticket)
+                    if deadline is not None:
+                        remaining = deadline.remaining()
+                        if remaining <= 0:
+                            raise deadline.error()
+                        delay = remaining if delay is None else min(delay, remaining)
+                    self._condition.wait(delay)
+            except BaseException:
+                ticket.cancelled = True
+                self._queued[priority] -= 1
+                self._condition.notify_all()
+                raise
+
+    def _head(self) -> Optional[_Ticket]:
+        while self._queue and self._queue[0][2].cancelled:
+            heapq.heappop(self._queue)
+        return self._queue[0][2] if self._queue else None
+
+    def _dispatch(self, ticket: _Ticket) -> float:
+        heapq.heappop(self._queue)
+        self._queued[ticket.priority] -= 1
+        self._virtual_time = ticket.start
+        self.in_flight += 1
+        waited = time.perf_counter() - ticket.enqueued_at
+        self.dispatched[ticket.priority] += 1
+        self.wait_time[ticket.priority] += waited
+        # La requête suivante peut peut-être partir aussi (place ou jeton disponible)
+        self._condition.notify_all()
+        return waited
+
+    def release(self) -> None:
+        """Libérer la place d'une requête terminée"""
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self, priority: Optional[str] = None) -> Iterator[float]:
+        """Place dans le pool pour la durée du bloc (produit le temps d'attente)"""
+        waited = self.acquire(priority)
+        try:
+            yield waited
+        finally:
+            self.release()
+
+    def queued(self) -> Dict[str, int]:
+        """Requêtes en attente par classe de priorité"""
+        with self._condition:
+            return dict(self._queued)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """État de l'ordonnanceur (en vol, en attente, servies et attente cumulée par classe)"""
+        with self._condition:
+            return {
+                'in_flight': self.in_flight,
+                'max_concurrency': self.max_concurrency,
+                'queued': dict(self._queued),
+                'dispatched': dict(self.dispatched),
+                'wait_time': dict(self.wait_time),
+            }
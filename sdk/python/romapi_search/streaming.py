@@ -0,0 +1,338 @@
+"""
+Analyse JSON incrémentale pour les réponses volumineuses du SDK ROMAPI Search
+
+Le parseur ne construit jamais l'arbre complet de la réponse : il parcourt
+le flux caractère par caractère, ignore les valeurs hors des tableaux ciblés
+et ne décode que les éléments de ces tableaux, un par un. La mémoire utilisée
+est donc bornée par la taille d'un élément (un hit) et non par la réponse.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+PathKey = Union[str, int]
+Path = Tuple[PathKey, ...]
+
+# Joker acceptant n'importe quelle clé ou index dans un motif de chemin
+WILDCARD = '*'
+
+_WHITESPACE = ' \t\n\r'
+_OBJECT = 'o'
+_ARRAY = 'a'
+
+_STRUCTURAL = re.compile(r'["{}\[\]]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r'[,\]\s]')
+
+
+class JSONStreamError(ValueError):
+    """Erreur de syntaxe rencontrée pendant l'analyse incrémentale"""
+
+
+class JSONArrayStreamParser:
+    """
+    Parseur JSON incrémental qui extrait les éléments de tableaux ciblés
+
+    Les tableaux sont désignés par des motifs de chemin (tuples de clés),
+    le joker ``'*'`` acceptant n'importe quelle clé. Chaque élément est
+    renvoyé dès que sa fin est lue, avec le chemin réel du tableau.
+
+    Args:
+        patterns: Motifs de chemin des tableaux à extraire
+
+    Example:
+        >>> parser = JSONArrayStreamParser([('resultsByType', '*', 'hits')])
+        >>> for path, item in parser.feed('{"resultsByType": {"API": {"hits": [{"id": 1}]}}}'):
+        ...     print(path, item)
+        ('resultsByType', 'API', 'hits') {'id': 1}
+    """
+
+    def __init__(self, patterns: Sequence[Sequence[PathKey]]):
+        self._patterns = [tuple(pattern) for pattern in patterns]
+        # Pile des conteneurs ouverts : [type, clé/index courant, attente]
+        self._stack: List[List[Any]] = []
+        self._path: List[PathKey] = []
+        self._done = False
+
+        # Chaîne ou littéral en cours hors capture
+        self._in_string = False
+        self._escape = False
+        self._key_buffer: Optional[List[str]] = None
+        self._in_literal = False
+
+        # Capture de l'élément courant d'un tableau ciblé
+        self._capture: Optional[List[str]] = None
+        self._capture_path: Path = ()
+        self._capture_depth = 0
+        self._capture_in_string = False
+        self._capture_escape = False
+        self._capture_scalar = False
+
+    def feed(self, text: str) -> Iterator[Tuple[Path, Any]]:
+        """
+        Analyser un nouveau fragment de texte
+
+        Args:
+            text: Fragment JSON (peut couper n'importe quel jeton)
+
+        Yields:
+            Tuple[Path, Any]: Chemin du tableau et élément décodé
+        """
+        i = 0
+        n = len(text)
+        while i < n:
+            if self._capture is not None:
+                i, item = self._consume_capture(text, i)
+                if item is not None:
+                    yield item
+                continue
+
+            char = text[i]
+
+            if self._in_string:
+                i = self._consume_string(text, i)
+                continue
+
+            if self._in_literal:
+                if char in ',]}' or char in _WHITESPACE:
+                    self._in_literal = False
+                    self._value_done()
+                    continue
+                i += 1
+                continue
+
+            i += 1
+            if char in _WHITESPACE:
+                continue
+            if self._done:
+                raise JSONStreamError(f"Unexpected trailing data: {char!r}")
+
+            frame = self._stack[-1] if self._stack else None
+
+            if frame is not None and frame[0] == _OBJECT and frame[2] == 'key':
+                if char == '"':
+                    self._in_string = True
+                    self._key_buffer = []
+                elif char == '}' and frame[1] is None:
+                    self._close_container()
+                else:
+                    raise JSONStreamError(f"Expected object key, got {char!r}")
+                continue
+
+            if frame is not None and frame[2] == 'colon':
+                if char != ':':
+                    raise JSONStreamError(f"Expected ':', got {char!r}")
+                frame[2] = 'value'
+                continue
+
+            if frame is not None and frame[2] == 'comma':
+                if char == ',':
+                    if frame[0] == _OBJECT:
+                        frame[2] = 'key'
+                    else:
+                        frame[1] += 1
+                        self._path[-1] = frame[1]
+                        frame[2] = 'value'
+                elif (char == '}' and frame[0] == _OBJECT) or (char == ']' and frame[0] == _ARRAY):
+                    self._close_container()
+                else:
+                    raise JSONStreamError(f"Expected ',' or closing bracket, got {char!r}")
+                continue
+
+            # Début d'une valeur
+            if frame is not None and frame[0] == _ARRAY and char == ']' and frame[1] == 0:
+                self._close_container()
+                continue
+
+            if frame is not None and frame[0] == _ARRAY and self._matches(tuple(self._path[:-1])):
+                self._start_capture(char)
+                continue
+
+            if char == '{':
+                self._stack.append([_OBJECT, None, 'key'])
+                self._path.append(None)
+            elif char == '[':
+                self._stack.append([_ARRAY, 0, 'value'])
+                self._path.append(0)
+            elif char == '"':
+                self._in_string = True
+                self._key_buffer = None
+            else:
+                self._in_literal = True
+
+        return
+
+    def close(self) -> None:
+        """
+        Signaler la fin du flux
+
+        Raises:
+            JSONStreamError: Si le document est incomplet
+        """
+        if self._in_literal and not self._stack:
+            self._in_literal = False
+            self._done = True
+        if self._stack or self._in_string or self._capture is not None:
+            raise JSONStreamError("Unexpected end of JSON stream")
+
+    def _matches(self, path: Path) -> bool:
+        for pattern in self._patterns:
+            if len(pattern) == len(path) and all(
+                expected == WILDCARD or expected == actual
+                for expected, actual in zip(pattern, path)
+            ):
+                return True
+        return False
+
+    def _consume_string(self, text: str, i: int) -> int:
+        """Avancer dans une chaîne hors capture (clé ou valeur ignorée)"""
+        n = len(text)
+        while i < n:
+            char = text[i]
+            i += 1
+            if self._escape:
+                self._escape = False
+                if self._key_buffer is not None:
+                    self._key_buffer.append('\\' + char)
+            elif char == '\\':
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+                if self._key_buffer is not None:
+                    key = json.loads('"' + ''.join(self._key_buffer) + '"')
+                    self._key_buffer = None
+                    frame = self._stack[-1]
+                    frame[1] = key
+                    frame[2] = 'colon'
+                    self._path[-1] = key
+                else:
+                    self._value_done()
+                return i
+            else:
+                if self._key_buffer is not None:
+                    # Les clés sont courtes : copie caractère par caractère
+                    end = text.find('"', i - 1)
+                    backslash = text.find('\\', i - 1)
+                    stop = min(p for p in (end, backslash, n) if p >= 0)
+                    self._key_buffer.append(text[i - 1:stop])
+                    i = stop
+                else:
+                    # Sauter directement jusqu'au prochain guillemet ou échappement
+                    end = text.find('"', i)
+                    backslash = text.find('\\', i)
+                    stop = min(p for p in (end, backslash, n) if p >= 0)
+                    i = stop
+        return i
+
+    def _start_capture(self, char: str) -> None:
+        self._capture = [char]
+        self._capture_path = tuple(self._path[:-1])
+        self._capture_in_string = char == '"'
+        self._capture_escape = False
+        self._capture_scalar = char not in '{["'
+        self._capture_depth = 1 if char in '{[' else 0
+
+    def _consume_capture(self, text: str, i: int) -> Tuple[int, Optional[Tuple[Path, Any]]]:
+        """Accumuler l'élément capturé jusqu'à sa fin"""
+        n = len(text)
+        start = i
+        while i < n:
+            if self._capture_escape:
+                self._capture_escape = False
+                i += 1
+                continue
+
+            if self._capture_scalar:
+                match = _SCALAR_END.search(text, i)
+                if match is None:
+                    i = n
+                    break
+                return match.start(), self._finish_capture(text[start:match.start()])
+
+            if self._capture_in_string:
+                match = _STRING_SPECIAL.search(text, i)
+                if match is None:
+                    i = n
+                    break
+                i = match.end()
+                if match.group() == '\\':
+                    self._capture_escape = True
+                else:
+                    self._capture_in_string = False
+                    if self._capture_depth == 0:
+                        return i, self._finish_capture(text[start:i])
+                continue
+
+            match = _STRUCTURAL.search(text, i)
+            if match is None:
+                i = n
+                break
+            i = match.end()
+            char = match.group()
+            if char == '"':
+                self._capture_in_string = True
+            elif char in '{[':
+                self._capture_depth += 1
+            else:
+                self._capture_depth -= 1
+                if self._capture_depth == 0:
+                    return i, self._finish_capture(text[start:i])
+
+        self._capture.append(text[start:i])
+        return i, None
+
+    def _finish_capture(self, tail: str) -> Tuple[Path, Any]:
+        self._capture.append(tail)
+        # Le premier caractère a été ajouté au démarrage de la capture
+        raw = ''.join(self._capture)
+        self._capture = None
+        try:
+            item = json.loads(raw)
+        except ValueError as e:
+            raise JSONStreamError(f"Invalid array element: {e}") from e
+        self._value_done()
+        return self._capture_path, item
+
+    def _value_done(self) -> None:
+        if not self._stack:
+            self._done = True
+            return
+        self._stack[-1][2] = 'comma'
+
+    def _close_container(self) -> None:
+        self._stack.pop()
+        self._path.pop()
+        self._value_done()
+
+
+def iter_json_arrays(
+    chunks: Iterable[Union[bytes, str]],
+    patterns: Sequence[Sequence[PathKey]],
+    encoding: str = 'utf-8'
+) -> Iterator[Tuple[Path, Any]]:
+    """
+    Extraire les éléments de tableaux ciblés d'un flux JSON fragmenté
+
+    Args:
+        chunks: Fragments de la réponse (octets ou texte)
+        patterns: Motifs de chemin des tableaux à extraire
+        encoding: Encodage des fragments binaires
+
+    Yields:
+        Tuple[Path, Any]: Chemin du tableau et élément décodé
+    """
+    parser = JSONArrayStreamParser(patterns)
+    decoder = codecs.getincrementaldecoder(encoding)()
+
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        if chunk:
+            yield from parser.feed(chunk)
+
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield from parser.feed(tail)
+    parser.close()
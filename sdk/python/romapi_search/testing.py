@@ -0,0 +1,681 @@
+"""
+Faux serveur de l'API de recherche pour les tests de performance
+
+``FakeSearchServer`` démarre un serveur HTTP local (dans un thread) qui
+implémente les endpoints utilisés par le SDK à partir d'un catalogue
+synthétique déterministe ou de réponses fournies. Un ``FaultProfile``
+permet d'injecter les pathologies observées en production :
+
+- latence (fixe, uniforme, log-normale) avant le premier octet ;
+- limitation de débit : en-têtes X-RateLimit-* et réponses 429 avec Retry-After ;
+- rafales d'erreurs 5xx ;
+- corps de réponse lents (débit limité) ;
+- réinitialisations de connexion (RST).
+
+``FakeRedis`` remplace un serveur Redis pour tester ``RedisCacheBackend``.
+
+Example:
+    >>> from romapi_search.testing import FakeSearchServer, FaultProfile, LogNormalLatency
+    >>> profile = FaultProfile(latency=LogNormalLatency(median=0.02, sigma=0.5), error_rate=0.01)
+    >>> with FakeSearchServer(profile=profile) as server:
+    ...     client = ROMAPISearchClient(base_url=server.base_url)
+    ...     client.search(query="restaurant")
+"""
+
+import fnmatch
+import json
+import math
+import random
+import socket
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .utils import CAMEROON_CITIES, COMMON_SEARCH_TERMS
+
+# Réponse fixe ou fonction (paramètres de requête, segments du chemin) -> réponse
+Fixture = Union[Any, Callable[[Dict[str, str], Tuple[str, ...]], Any]]
+
+
+class FixedLatency:
+    """Latence constante"""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    def sample(self, rng: random.Random) -> float:
+        return self.seconds
+
+
+class UniformLatency:
+    """Latence uniforme entre deux bornes"""
+
+    def __init__(self, low: float, high: float):
+        self.low = low
+        self.high = high
+
+    def sample(self, rng: random.Random) -> float:
+        return rng.uniform(self.low, self.high)
+
+
+class LogNormalLatency:
+    """
+    Latence log-normale (queue longue, proche des latences réelles)
+
+    Args:
+        median: Latence médiane en secondes
+        sigma: Écart-type du logarithme (0.5 : p99 ~ 3,2 x la médiane)
+        cap: Latence maximale en secondes
+    """
+
+    def __init__(self, median: float, sigma: float = 0.5, cap: Optional[float] = None):
+        self.median = median
+        self.sigma = sigma
+        self.cap = cap
+
+    def sample(self, rng: random.Random) -> float:
+        value = rng.lognormvariate(math.log(self.median), self.sigma)
+        return min(value, self.cap) if self.cap is not None else value
+
+
+@dataclass
+class FaultProfile:
+    """
+    Pathologies injectées par le faux serveur
+
+    Args:
+        latency: Distribution de latence avant la réponse
+        rate_limit: Requêtes autorisées par fenêtre (None: pas de limite)
+        rate_limit_window: Durée de la fenêtre de limitation en secondes
+        error_rate: Probabilité qu'une requête déclenche une rafale d'erreurs
+        error_burst: Nombre de réponses en erreur consécutives par rafale
+        error_status: Code HTTP des erreurs injectées
+        slow_body_bytes_per_second: Débit d'envoi du corps (None: immédiat)
+        reset_rate: Probabilité de réinitialiser la connexion sans répondre
+        seed: Graine du générateur aléatoire (reproductibilité)
+    """
+    latency: Optional[Any] = None
+    rate_limit: Optional[int] = None
+    rate_limit_window: float = 60.0
+    error_rate: float = 0.0
+    error_burst: int = 1
+    error_status: int = 503
+    slow_body_bytes_per_second: Optional[float] = None
+    reset_rate: float = 0.0
+    seed: Optional[int] = None
+
+
+# Catalogue synthétique
+
+_CATEGORIES = [
+    ('cat-restaurants', 'Restaurants', 'restaurants', 'utensils'),
+    ('cat-fintech', 'Fintech', 'fintech', 'credit-card'),
+    ('cat-transport', 'Transport', 'transport', 'bus'),
+    ('cat-sante', 'Santé', 'sante', 'heart'),
+    ('cat-hotels', 'Hôtels', 'hotels', 'bed'),
+    ('cat-education', 'Éducation', 'education', 'book'),
+]
+_RESOURCE_TYPES = ['API', 'BUSINESS', 'SERVICE']
+_PLANS = ['FREE', 'PREMIUM', 'FEATURED']
+_CITY_COORDINATES = {
+    'Douala': (4.0511, 9.7679),
+    'Yaoundé': (3.848, 11.502),
+    'Bafoussam': (5.4781, 10.4176),
+    'Garoua': (9.3017, 13.3921),
+}
+
+
+class SyntheticCatalogue:
+    """
+    Catalogue déterministe de ressources au format de l'API
+
+    Les ressources sont générées à la demande à partir de leur index :
+    la mémoire utilisée ne dépend pas de la taille du catalogue.
+
+    Args:
+        size: Nombre de ressources
+        seed: Graine de génération
+    """
+
+    def __init__(self, size: int = 500, seed: int = 0):
+        self.size = size
+        self.seed = seed
+
+    def hit(self, index: int) -> Dict[str, Any]:
+        rng = random.Random(self.seed * 1_000_003 + index)
+        category = _CATEGORIES[index % len(_CATEGORIES)]
+        city = CAMEROON_CITIES[index % len(CAMEROON_CITIES)]
+        latitude, longitude = _CITY_COORDINATES.get(city, (4.0511, 9.7679))
+        resource_type = _RESOURCE_TYPES[index % len(_RESOURCE_TYPES)]
+        return {
+            'id': f"res-{index:06d}",
+            'name': f"{category[1]} {city} {index}",
+            'slug': f"{category[2]}-{index}",
+            'description': f"Ressource {index} ({category[1]}) à {city}",
+            'resourceType': resource_type,
+            'plan': _PLANS[index % len(_PLANS)],
+            'verified': index % 3 != 0,
+            'score': round(20.0 - 19.0 * index / max(self.size, 1), 4),
+            'category': {
+                'id': category[0],
+                'name': category[1],
+                'slug': category[2],
+                'icon': category[3],
+            },
+            'address': {
+                'addressLine1': f"{rng.randint(1, 300)} rue principale",
+                'city': city,
+                'country': 'CM',
+                'latitude': round(latitude + rng.uniform(-0.05, 0.05), 6),
+                'longitude': round(longitude + rng.uniform(-0.05, 0.05), 6),
+            },
+            'contact': {
+                'phone': f"+2376{rng.randint(10000000, 99999999)}",
+                'email': f"contact{index}@example.cm",
+            },
+            'tags': rng.sample(COMMON_SEARCH_TERMS, 3),
+            'rating': round(rng.uniform(2.5, 5.0), 1),
+            'createdAt': '2025-06-01T10:00:00.000Z',
+            'updatedAt': '2025-08-15T08:30:00.000Z',
+        }
+
+    def indexes(self, resource_types: Optional[List[str]] = None) -> range:
+        """Index des ressources (filtrés par type : une ressource sur trois par type)"""
+        if resource_types and len(resource_types) == 1 and resource_types[0] in _RESOURCE_TYPES:
+            return range(_RESOURCE_TYPES.index(resource_types[0]), self.size, len(_RESOURCE_TYPES))
+        return range(self.size)
+
+    def search(self, params: Dict[str, str], resource_types: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Page de résultats au format /search"""
+        page = max(int(params.get('page', 1)), 1)
+        limit = min(max(int(params.get('limit', 20)), 1), 100)
+        if resource_types is None and params.get('resourceTypes'):
+            resource_types = params['resourceTypes'].split(',')
+        indexes = self.indexes(resource_types)
+        total = len(indexes)
+        page_indexes = indexes[(page - 1) * limit:page * limit]
+        total_pages = max(-(-total // limit), 1)
+
+        hits = [self.hit(index) for index in page_indexes]
+        if 'latitude' in params:
+            for position, hit in enumerate(hits):
+                hit['distance'] = round(0.1 + position * 0.25, 3)
+
+        return {
+            'hits': hits,
+            'total': total,
+            'took': 5,
+            'facets': self.facets(),
+            'pagination': {
+                'page': page,
+                'limit': limit,
+                'totalPages': total_pages,
+                'hasNext': page < total_pages,
+                'hasPrev': page > 1,
+            },
+            'metadata': {
+                'query': params.get('q'),
+                'appliedFilters': sorted(key for key in params if key not in ('q', 'page', 'limit')),
+                'searchId': f"search-{page}-{limit}",
+            },
+        }
+
+    def facets(self) -> List[Dict[str, Any]]:
+        per_category = self.size // len(_CATEGORIES)
+        per_type = self.size // len(_RESOURCE_TYPES)
+        return [
+            {'name': 'categories', 'values': {c[1]: per_category for c in _CATEGORIES}, 'total': self.size},
+            {'name': 'resourceTypes', 'values': {t: per_type for t in _RESOURCE_TYPES}, 'total': self.size},
+        ]
+
+    def suggestions(self, params: Dict[str, str]) -> List[Dict[str, Any]]:
+        query = params.get('q', '').lower()
+        limit = int(params.get('limit', 10))
+        terms = [term for term in COMMON_SEARCH_TERMS if term.startswith(query)] or COMMON_SEARCH_TERMS
+        return [
+            {'text': term, 'score': round(10.0 - i * 0.5, 2), 'type': 'query', 'count': 100 - i}
+            for i, term in enumerate(terms[:limit])
+        ]
+
+    def multi_type(self, params: Dict[str, str]) -> Dict[str, Any]:
+        types = params.get('includeTypes', ','.join(_RESOURCE_TYPES)).split(',')
+        results_by_type = {}
+        pagination_by_type = {}
+        for resource_type in types:
+            page = self.search(params, [resource_type])
+            results_by_type[resource_type] = {
+                'hits': page['hits'],
+                'total': page['total'],
+                'facets': page['facets'],
+            }
+            pagination_by_type[resource_type] = page['pagination']
+        return {
+            'resultsByType': results_by_type,
+            'totalAcrossTypes': sum(r['total'] for r in results_by_type.values()),
+            'took': 8,
+            'paginationByType': pagination_by_type,
+        }
+
+    def export(self, params: Dict[str, str]) -> Dict[str, Any]:
+        types = params.get('exportTypes', ','.join(_RESOURCE_TYPES)).split(',')
+        max_results = min(int(params.get('maxResults', 1000)), 5000)
+        exported = {}
+        for resource_type in types:
+            indexes = self.indexes([resource_type])
+            data = []
+            for index in indexes[:max_results]:
+                hit = self.hit(index)
+                data.append({
+                    'id': hit['id'],
+                    'name': hit['name'],
+                    'description': hit['description'],
+                    'resourceType': hit['resourceType'],
+                    'category': hit['category']['name'],
+                    'plan': hit['plan'],
+                    'verified': hit['verified'],
+                    'contact': hit['contact'],
+                    'tags': hit['tags'],
+                    'createdAt': hit['createdAt'],
+                    'updatedAt': hit['updatedAt'],
+                    'score': hit['score'],
+                })
+            exported[resource_type] = {
+                'data': data,
+                'count': len(indexes),
+                'exportedAt': datetime.now(timezone.utc).isoformat(),
+                'format': 'json',
+            }
+        return exported
+
+    def category_hierarchy(self, params: Dict[str, str]) -> Dict[str, Any]:
+        per_category = self.size // len(_CATEGORIES)
+        return {
+            'categories': [
+                {'id': c[0], 'name': c[1], 'slug': c[2], 'icon': c[3], 'resourceCount': per_category, 'children': []}
+                for c in _CATEGORIES
+            ]
+        }
+
+    def category_search(self, params: Dict[str, str], category_key: str) -> Dict[str, Any]:
+        category = next((c for c in _CATEGORIES if category_key in (c[0], c[2])), _CATEGORIES[0])
+        results = self.search(params)
+        info = {
+            'id': category[0],
+            'name': category[1],
+            'slug': category[2],
+            'description': f"Catégorie {category[1]}",
+            'icon': category[3],
+            'resourceCount': self.size // len(_CATEGORIES),
+        }
+        results.update({
+            'categoryInfo': info,
+            'breadcrumbs': [{'id': category[0], 'name': category[1], 'slug': category[2], 'url': f"/{category[2]}"}],
+            'subcategories': [],
+        })
+        return results
+
+    def analytics(self, params: Dict[str, str]) -> Dict[str, Any]:
+        total = sum(range(10, 10 * len(COMMON_SEARCH_TERMS) + 1, 10))
+        return {
+            'popularTerms': [
+                {'term': term, 'count': count, 'percentage': round(count * 100 / total, 2)}
+                for term, count in zip(COMMON_SEARCH_TERMS, range(10 * len(COMMON_SEARCH_TERMS), 0, -10))
+            ],
+            'noResultsQueries': [],
+            'metrics': {
+                'averageResponseTime': 42.0,
+                'totalSearches': total,
+                'successRate': 99.0,
+                'cacheHitRate': 60.0,
+            },
+        }
+
+
+def default_fixtures(catalogue: Optional[SyntheticCatalogue] = None) -> Dict[str, Fixture]:
+    """Réponses par défaut construites sur un catalogue synthétique"""
+    catalogue = catalogue or SyntheticCatalogue()
+    return {
+        'search': lambda params, path: catalogue.search(params),
+        'nearby': lambda params, path: catalogue.search(params),
+        'suggest': lambda params, path: catalogue.suggestions(params),
+        'suggest_popular': lambda params, path: catalogue.suggestions({'limit': params.get('limit', 20)}),
+        'suggest_smart': lambda params, path: catalogue.suggestions(params),
+        'multi_type': lambda params, path: catalogue.multi_type(params),
+        'export': lambda params, path: catalogue.export(params),
+        'type': lambda params, path: catalogue.search(params, [path[-1]]),
+        'categories_hierarchy': lambda params, path: catalogue.category_hierarchy(params),
+        'category': lambda params, path: catalogue.category_search(params, path[-2] if path[-1] == 'hierarchy' else path[-1]),
+        'analytics': lambda params, path: catalogue.analytics(params),
+        'popular_terms': lambda params, path: catalogue.analytics(params)['popularTerms'][:int(params.get('limit', 50))],
+        'health': {'status': 'ok'},
+    }
+
+
+def resolve_route(path: str) -> Optional[Tuple[str, Tuple[str, ...]]]:
+    """
+    Associer un chemin à une clé de fixture
+
+    Le préfixe de version (/api/v1) est ignoré : seule la partie à partir
+    du segment ``search`` (ou ``health``) est prise en compte.
+
+    Returns:
+        Tuple: (clé de fixture, segments après ``search``) ou None
+    """
+    segments = [unquote(segment) for segment in path.strip('/').split('/') if segment]
+    if 'search' not in segments:
+        if 'health' in segments:
+            return 'health', tuple(segments[segments.index('health') + 1:])
+        return None
+    rest = tuple(segments[len(segments) - 1 - segments[::-1].index('search') + 1:])
+
+    if not rest:
+        return 'search', rest
+    head = rest[0]
+    if head == 'suggest':
+        if len(rest) == 1:
+            return 'suggest', rest
+        return {'popular': 'suggest_popular', 'smart': 'suggest_smart'}.get(rest[1], 'suggest'), rest
+    if head == 'nearby':
+        return 'nearby', rest
+    if head == 'multi-type':
+        if len(rest) > 1 and rest[1] == 'export':
+            return 'export', rest
+        return 'multi_type', rest
+    if head == 'type' and len(rest) == 2:
+        return 'type', rest
+    if head == 'categories' and len(rest) >= 2:
+        if rest[1] == 'hierarchy':
+            return 'categories_hierarchy', rest
+        return 'category', rest
+    if head == 'analytics':
+        if len(rest) > 1 and rest[1] == 'popular-terms':
+            return 'popular_terms', rest
+        return 'analytics', rest
+    return None
+
+
+class _FaultState:
+    """État partagé des pathologies (fenêtre de limitation, rafale en cours)"""
+
+    def __init__(self, profile: FaultProfile):
+        self.profile = profile
+        self.rng = random.Random(profile.seed)
+        self.lock = threading.Lock()
+        self.window_start = time.time()
+        self.window_count = 0
+        self.burst_remaining = 0
+
+
+class _FakeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # En-têtes et corps envoyés en un seul segment (évite l'attente Nagle / ACK retardé)
+    disable_nagle_algorithm = True
+    wbufsize = -1
+    fake_server: 'FakeSearchServer' = None
+
+    def do_GET(self):
+        try:
+            self.fake_server._handle(self)
+        except (BrokenPipeError, ConnectionResetError):
+            # Client parti avant la fin de la réponse (timeout, échéance dépassée)
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeSearchServer:
+    """
+    Faux serveur de l'API de recherche exécuté dans un thread
+
+    Args:
+        fixtures: Réponses par clé de route (voir ``default_fixtures``) ;
+            les clés absentes utilisent le catalogue synthétique
+        profile: Pathologies injectées (défaut: aucune)
+        catalogue: Catalogue synthétique des réponses par défaut
+        host: Adresse d'écoute
+        port: Port d'écoute (0: port libre choisi par le système)
+
+    Attributes:
+        stats: Compteurs de requêtes (total, par route, par statut, resets)
+    """
+
+    def __init__(
+        self,
+        fixtures: Optional[Dict[str, Fixture]] = None,
+        profile: Optional[FaultProfile] = None,
+        catalogue: Optional[SyntheticCatalogue] = None,
+        host: str = '127.0.0.1',
+        port: int = 0
+    ):
+        self.fixtures = default_fixtures(catalogue)
+        self.fixtures.update(fixtures or {})
+        self._faults = _FaultState(profile or FaultProfile())
+        self._stats_lock = threading.Lock()
+        self.stats: Dict[str, Any] = {}
+        self.reset_stats()
+
+        handler = type('FakeHandler', (_FakeHandler,), {'fake_server': self})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/v1/"
+
+    @property
+    def profile(self) -> FaultProfile:
+        return self._faults.profile
+
+    def set_profile(self, profile: FaultProfile) -> None:
+        """Changer les pathologies injectées (réinitialise la fenêtre et les rafales)"""
+        self._faults = _FaultState(profile)
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self.stats = {'requests': 0, 'by_route': {}, 'by_status': {}, 'resets': 0}
+
+    def start(self) -> 'FakeSearchServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self) -> None:
+        """Servir au premier plan (jusqu'à interruption)"""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def __enter__(self) -> 'FakeSearchServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _handle(self, handler: BaseHTTPRequestHandler) -> None:
+        url = urlsplit(handler.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        route = resolve_route(url.path)
+        route_key = route[0] if route else 'unknown'
+        faults = self._faults
+        profile = faults.profile
+
+        with faults.lock:
+            reset = profile.reset_rate and faults.rng.random() < profile.reset_rate
+            latency = profile.latency.sample(faults.rng) if profile.latency else 0.0
+            rate_headers, retry_after = self._check_rate_limit(faults)
+            error = False
+            if retry_after is None:
+                if faults.burst_remaining > 0:
+                    faults.burst_remaining -= 1
+                    error = True
+                elif profile.error_rate and faults.rng.random() < profile.error_rate:
+                    faults.burst_remaining = max(profile.error_burst, 1) - 1
+                    error = True
+
+        if reset:
+            self._record(route_key, None)
+            self._reset_connection(handler)
+            return
+
+        if latency > 0:
+            time.sleep(latency)
+
+        headers = dict(rate_headers)
+        if retry_after is not None:
+            status, payload = 429, {'error': {'message': 'Rate limit exceeded'}}
+            headers['Retry-After'] = str(retry_after)
+        elif error:
+            status, payload = profile.error_status, {'error': {'message': 'Injected server error'}}
+        elif route is None:
+            status, payload = 404, {'error': {'message': 'Not found'}}
+        else:
+            fixture = self.fixtures[route_key]
+            try:
+                payload = fixture(params, route[1]) if callable(fixture) else fixture
+                status = 200
+            except (ValueError, KeyError) as e:
+                status, payload = 400, {'error': {'message': f"Invalid request: {e}"}}
+
+        body = payload if isinstance(payload, bytes) else json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self._record(route_key, status)
+
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json; charset=utf-8')
+        handler.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        self._write_body(handler, body, profile.slow_body_bytes_per_second)
+
+    def _check_rate_limit(self, faults: _FaultState) -> Tuple[Dict[str, str], Optional[int]]:
+        """Fenêtre fixe : renvoie les en-têtes X-RateLimit-* et le Retry-After éventuel"""
+        profile = faults.profile
+        if profile.rate_limit is None:
+            return {}, None
+
+        now = time.time()
+        if now - faults.window_start >= profile.rate_limit_window:
+            faults.window_start = now
+            faults.window_count = 0
+        faults.window_count += 1
+
+        reset_at = faults.window_start + profile.rate_limit_window
+        headers = {
+            'X-RateLimit-Limit': str(profile.rate_limit),
+            'X-RateLimit-Remaining': str(max(profile.rate_limit - faults.window_count, 0)),
+            'X-RateLimit-Reset': str(int(math.ceil(reset_at))),
+        }
+        if faults.window_count > profile.rate_limit:
+            return headers, max(int(math.ceil(reset_at - now)), 1)
+        return headers, None
+
+    @staticmethod
+    def _write_body(handler: BaseHTTPRequestHandler, body: bytes, bytes_per_second: Optional[float]) -> None:
+        if not bytes_per_second:
+            handler.wfile.write(body)
+            return
+        # En-têtes immédiats puis corps par blocs de 100 ms (l'attente précède
+        # chaque bloc pour ne pas retarder la requête suivante sur la connexion)
+        chunk_size = max(int(bytes_per_second / 10), 1)
+        handler.wfile.flush()
+        for start in range(0, len(body), chunk_size):
+            chunk = body[start:start + chunk_size]
+            time.sleep(len(chunk) / bytes_per_second)
+            handler.wfile.write(chunk)
+            handler.wfile.flush()
+
+    @staticmethod
+    def _reset_connection(handler: BaseHTTPRequestHandler) -> None:
+        """Fermer la connexion avec un RST (SO_LINGER à zéro)"""
+        handler.close_connection = True
+        try:
+            handler.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+            handler.connection.close()
+        except OSError:
+            pass
+
+    def _record(self, route_key: str, status: Optional[int]) -> None:
+        with self._stats_lock:
+            self.stats['requests'] += 1
+            by_route = self.stats['by_route']
+            by_route[route_key] = by_route.get(route_key, 0) + 1
+            if status is None:
+                self.stats['resets'] += 1
+            else:
+                by_status = self.stats['by_status']
+                by_status[status] = by_status.get(status, 0) + 1
+
+
+class FakeRedis:
+    """
+    Client Redis en mémoire (sous-ensemble de l'API redis-py)
+
+    Implémente les commandes utilisées par ``RedisCacheBackend`` (get, mget,
+    set avec expiration, delete, scan_iter) pour tester un cache partagé sans
+    serveur : plusieurs clients SDK partageant une même instance se
+    comportent comme des hôtes d'un cluster partageant un Redis.
+
+    Attributes:
+        commands: Nombre de commandes reçues par nom (allers-retours simulés)
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+        self._lock = threading.Lock()
+        self.commands: Dict[str, int] = {}
+
+    def _count(self, command: str) -> None:
+        self.commands[command] = self.commands.get(command, 0) + 1
+
+    def _live(self, key: str) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            self._count('get')
+            return self._live(key)
+
+    def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        with self._lock:
+            self._count('mget')
+            return [self._live(key) for key in keys]
+
+    def set(self, key: str, value: Union[bytes, str], ex: Optional[float] = None, px: Optional[int] = None) -> bool:
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+        ttl = px / 1000.0 if px is not None else ex
+        with self._lock:
+            self._count('set')
+            self._data[key] = (value, time.monotonic() + ttl if ttl is not None else None)
+        return True
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            self._count('delete')
+            return sum(1 for key in keys if self._data.pop(key, None) is not None)
+
+    def scan_iter(self, match: Optional[str] = None) -> Iterator[str]:
+        with self._lock:
+            self._count('scan')
+            keys = [key for key in list(self._data) if self._live(key) is not None]
+        return iter([key for key in keys if match is None or fnmatch.fnmatchcase(key, match)])
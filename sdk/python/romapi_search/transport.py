@@ -0,0 +1,487 @@
+"""
+Transports HTTP du client
+
+Le client délègue l'envoi des requêtes à un transport interchangeable :
+
+- ``requests`` (défaut) : ``requests.Session`` avec retries urllib3 ;
+- ``urllib3`` : ``PoolManager`` appelé directement, sans la préparation de
+  requête de ``requests`` (hooks, cookies, variables d'environnement) ;
+  le surcoût CPU par requête est nettement plus faible pour les petites
+  réponses (suggestions) ;
+- ``http2`` : ``httpx`` en HTTP/2, les requêtes concurrentes (recherche
+  fédérée, export) sont multiplexées sur une seule connexion. Nécessite
+  ``pip install romapi-search-sdk[http2]``.
+
+Tous les transports renvoient un objet exposant ``status_code``,
+``headers``, ``content``, ``encoding``, ``ok``, ``json()``,
+``iter_content()`` et ``close()``, et lèvent ``NetworkError`` en cas
+d'échec réseau ou de retries épuisés (``RateLimitError`` si les retries
+sont épuisés sur des réponses 429).
+
+Example:
+    >>> client = ROMAPISearchClient(transport='urllib3')
+"""
+
+import json
+import time
+from typing import Any, Dict, Iterator, Optional, Union
+from urllib.parse import urlencode
+
+import requests
+import urllib3
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+
+from .deadline import TimeoutValue, current_deadline, deadline_sleep, split_timeout
+from .exceptions import NetworkError, RateLimitError, ROMAPIError, ValidationError
+from .instrumentation import (
+    InstrumentedHTTPAdapter,
+    current_timing,
+    timed_pool_classes,
+    warm_pool,
+)
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RateLimitedResponse(ResponseError):
+    """Raison d'un ``MaxRetryError`` : retries épuisés sur des réponses 429"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class DeadlineRetry(Retry):
+    """Retry urllib3 dont les attentes respectent l'échéance de l'appel en cours"""
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        try:
+            return super().increment(method, url, response, error, _pool, _stacktrace)
+        except MaxRetryError as e:
+            if response is None or response.status != 429:
+                raise
+            # Distinguer la limitation de débit des autres retries épuisés
+            reason = RateLimitedResponse(str(e.reason), self.get_retry_after(response))
+            raise MaxRetryError(_pool, url, reason) from e
+
+    def sleep(self, response: Any = None) -> None:
+        deadline = current_deadline()
+        if deadline is not None:
+            delay = None
+            if response is not None and self.respect_retry_after_header:
+                delay = self.get_retry_after(response)
+            # Attente qui dépasserait l'échéance : TimeoutError immédiate
+            deadline.check(self.get_backoff_time() if delay is None else delay)
+        super().sleep(response)
+
+
+def retry_strategy(retries: int) -> Retry:
+    """Politique de retry commune aux transports urllib3"""
+    return DeadlineRetry(
+        total=retries,
+        backoff_factor=1,
+        status_forcelist=list(RETRY_STATUSES),
+        allowed_methods=["GET", "POST"]
+    )
+
+
+def request_failed(error: Exception) -> ROMAPIError:
+    """Erreur du SDK pour un envoi échoué (``RateLimitError`` si les retries sont épuisés sur des 429)"""
+    # requests enveloppe le MaxRetryError d'urllib3 dans un RetryError
+    cause = error.args[0] if isinstance(error, requests.exceptions.RetryError) and error.args else error
+    reason = getattr(cause, 'reason', None)
+    if isinstance(reason, RateLimitedResponse):
+        retry_after = int(reason.retry_after) if reason.retry_after is not None else None
+        return RateLimitError(f"Rate limit exceeded: {str(error)}", retry_after=retry_after)
+    return NetworkError(f"Request failed: {str(error)}")
+
+
+class Transport:
+    """
+    Interface des transports HTTP
+
+    Args:
+        retries: Nombre de tentatives supplémentaires (statuts 429 et 5xx, erreurs réseau)
+    """
+
+    name = ''
+
+    def __init__(self, retries: int = 3):
+        self.retries = retries
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: TimeoutValue = None,
+        stream: bool = False,
+        **kwargs
+    ) -> Any:
+        """
+        Envoyer une requête
+
+        Args:
+            method: Méthode HTTP
+            url: URL sans paramètres de requête
+            params: Paramètres de requête
+            json: Corps JSON
+            headers: En-têtes de la requête
+            timeout: Timeout en secondes, ou couple (connexion, lecture) ;
+                réduit au temps restant sous une échéance (``deadline_scope``)
+            stream: Ne pas lire le corps avant de rendre la réponse
+
+        Returns:
+            Réponse (interface de ``requests.Response``)
+
+        Raises:
+            NetworkError: En cas d'échec réseau ou de retries épuisés
+            RateLimitError: Si les retries sont épuisés sur des réponses 429
+            TimeoutError: Si l'échéance de l'appel est atteinte
+        """
+        raise NotImplementedError
+
+    def warmup(self, url: str, connections: int) -> int:
+        """
+        Ouvrir à l'avance des connexions vers l'hôte d'une URL
+
+        Les connexions restent dans le pool et servent aux requêtes suivantes.
+        Le nombre est borné par la taille du pool du transport.
+
+        Args:
+            url: URL de l'hôte à préchauffer
+            connections: Nombre de connexions souhaitées
+
+        Returns:
+            int: Nombre de connexions ouvertes (0 si le transport ne gère pas de pool)
+        """
+        return 0
+
+    def close(self) -> None:
+        """Fermer les connexions du transport"""
+
+
+class RequestsTransport(Transport):
+    """
+    Transport ``requests.Session``
+
+    Args:
+        retries: Nombre de tentatives supplémentaires
+        session: Session existante, utilisée telle quelle (défaut: session
+            instrumentée avec retries)
+        resolver: Cache DNS des connexions (ignoré avec une session existante)
+    """
+
+    name = 'requests'
+
+    def __init__(self, retries: int = 3, session: Optional[requests.Session] = None, resolver: Any = None):
+        super().__init__(retries)
+        if session is None:
+            session = requests.Session()
+            adapter = InstrumentedHTTPAdapter(max_retries=retry_strategy(retries), resolver=resolver)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+
+    def request(self, method, url, params=None, json=None, headers=None, timeout=None, stream=False, **kwargs):
+        try:
+            return self.session.request(
+                method=method,
+                url=url,
+                params=params,
+                json=json,
+                headers=headers,
+                timeout=timeout,
+                stream=stream,
+                **kwargs
+            )
+        except requests.RequestException as e:
+            raise request_failed(e)
+
+    def warmup(self, url, connections):
+        adapter = self.session.get_adapter(url)
+        try:
+            if hasattr(adapter, 'get_connection_with_tls_context'):
+                # Même clé de pool que les requêtes réelles (contexte TLS compris)
+                prepared = requests.Request('GET', url).prepare()
+                pool = adapter.get_connection_with_tls_context(prepared, verify=self.session.verify)
+            else:
+                pool = adapter.get_connection(url)
+            return warm_pool(pool, connections)
+        except (AttributeError, TypeError):
+            # Adaptateur tiers sans pool urllib3
+            return 0
+        except (requests.RequestException, urllib3.exceptions.HTTPError, OSError) as e:
+            raise NetworkError(f"Warmup failed: {str(e)}")
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class Urllib3Response:
+    """Réponse urllib3 avec l'interface utilisée par le client"""
+
+    def __init__(self, raw: Any):
+        self.raw = raw
+        self.status_code = raw.status
+        self.headers = raw.headers
+        self._content: Optional[bytes] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def encoding(self) -> Optional[str]:
+        content_type = self.headers.get('Content-Type', '')
+        for part in content_type.split(';')[1:]:
+            name, _, value = part.strip().partition('=')
+            if name.lower() == 'charset':
+                return value.strip('"') or None
+        return None
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            try:
+                self._content = self.raw.data
+            except urllib3.exceptions.HTTPError as e:
+                raise NetworkError(f"Request failed: {str(e)}")
+        return self._content
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        try:
+            yield from self.raw.stream(chunk_size, decode_content=True)
+        except urllib3.exceptions.HTTPError as e:
+            raise NetworkError(f"Request failed: {str(e)}")
+
+    def close(self) -> None:
+        self.raw.release_conn()
+
+
+class Urllib3Transport(Transport):
+    """
+    Transport ``urllib3.PoolManager`` direct
+
+    Args:
+        retries: Nombre de tentatives supplémentaires
+        num_pools: Nombre d'hôtes conservés dans le pool
+        maxsize: Connexions conservées par hôte
+        resolver: Cache DNS des connexions (optionnel)
+    """
+
+    name = 'urllib3'
+
+    def __init__(self, retries: int = 3, num_pools: int = 10, maxsize: int = 10, resolver: Any = None):
+        super().__init__(retries)
+        self.pool = urllib3.PoolManager(
+            num_pools=num_pools,
+            maxsize=maxsize,
+            retries=retry_strategy(retries),
+            headers={'Accept-Encoding': 'gzip, deflate'}
+        )
+        self.pool.pool_classes_by_scheme = timed_pool_classes(resolver)
+
+    def request(self, method, url, params=None, json=None, headers=None, timeout=None, stream=False, **kwargs):
+        headers = dict(self.pool.headers, **(headers or {}))
+        body = None
+        if json is not None:
+            body = _json_dumps(json)
+            headers['Content-Type'] = 'application/json'
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        connect, read = split_timeout(timeout)
+
+        try:
+            raw = self.pool.urlopen(
+                method,
+                url,
+                body=body,
+                headers=headers,
+                timeout=urllib3.Timeout(total=None, connect=connect, read=read),
+                preload_content=not stream,
+                redirect=True
+            )
+        except urllib3.exceptions.HTTPError as e:
+            raise request_failed(e)
+        return Urllib3Response(raw)
+
+    def warmup(self, url, connections):
+        try:
+            return warm_pool(self.pool.connection_from_url(url), connections)
+        except (urllib3.exceptions.HTTPError, OSError) as e:
+            raise NetworkError(f"Warmup failed: {str(e)}")
+
+    def close(self) -> None:
+        self.pool.clear()
+
+
+class HTTPXResponse:
+    """Réponse httpx avec l'interface utilisée par le client"""
+
+    def __init__(self, response: Any, errors: tuple):
+        self._response = response
+        self._errors = errors
+        self.status_code = response.status_code
+        self.headers = response.headers
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def encoding(self) -> Optional[str]:
+        return self._response.charset_encoding
+
+    @property
+    def content(self) -> bytes:
+        try:
+            return self._response.read()
+        except self._errors as e:
+            raise NetworkError(f"Request failed: {str(e)}")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        try:
+            yield from self._response.iter_bytes(chunk_size)
+        except self._errors as e:
+            raise NetworkError(f"Request failed: {str(e)}")
+
+    def close(self) -> None:
+        self._response.close()
+
+
+class HTTP2Transport(Transport):
+    """
+    Transport ``httpx`` en HTTP/2 (multiplexage des requêtes concurrentes)
+
+    Les retries suivent la politique des autres transports : backoff
+    exponentiel (facteur 1) sur les statuts 429 et 5xx et les erreurs de
+    connexion, en respectant ``Retry-After``.
+
+    Args:
+        retries: Nombre de tentatives supplémentaires
+        max_connections: Connexions maximum (chacune multiplexe des flux HTTP/2)
+        resolver: Non utilisé (httpx gère ses propres connexions) ; le
+            préchauffage passe par la requête de santé du client
+
+    Raises:
+        ImportError: Si httpx (avec le support HTTP/2) n'est pas installé
+    """
+
+    name = 'http2'
+
+    def __init__(self, retries: int = 3, max_connections: int = 10, resolver: Any = None):
+        super().__init__(retries)
+        try:
+            import httpx
+            import h2  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "The http2 transport requires httpx with HTTP/2 support: "
+                "pip install romapi-search-sdk[http2]"
+            )
+        self._httpx = httpx
+        self.client = httpx.Client(http2=True, limits=httpx.Limits(max_connections=max_connections))
+
+    def request(self, method, url, params=None, json=None, headers=None, timeout=None, stream=False, **kwargs):
+        httpx = self._httpx
+        timing = current_timing()
+        deadline = current_deadline()
+        request = self.client.build_request(method, url, params=params, json=json, headers=headers)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if timing is not None:
+                timing.attempts += 1
+            connect, read = deadline.timeouts(timeout) if deadline is not None else split_timeout(timeout)
+            request.extensions['timeout'] = httpx.Timeout(read, connect=connect).as_dict()
+            sent = time.perf_counter()
+            try:
+                response = self.client.send(request, stream=True)
+            except httpx.TransportError as e:
+                if attempt <= self.retries:
+                    deadline_sleep(self._backoff(attempt))
+                    continue
+                raise NetworkError(f"Request failed: {str(e)}")
+
+            if timing is not None:
+                timing.headers_received_at = time.perf_counter()
+                timing.ttfb += timing.headers_received_at - sent
+
+            if response.status_code in RETRY_STATUSES:
+                response.close()
+                if attempt <= self.retries:
+                    deadline_sleep(self._retry_delay(response, attempt))
+                    continue
+                message = f"too many {response.status_code} error responses for {url}"
+                if response.status_code == 429:
+                    retry_after = response.headers.get('Retry-After')
+                    raise RateLimitError(
+                        f"Rate limit exceeded: {message}",
+                        retry_after=int(retry_after) if retry_after and retry_after.isdigit() else None
+                    )
+                raise NetworkError(f"Request failed: {message}")
+            break
+
+        wrapped = HTTPXResponse(response, (httpx.HTTPError, httpx.StreamError))
+        if not stream:
+            wrapped.content
+        return wrapped
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        # Même progression que urllib3 : 0, 2, 4, 8... secondes (plafond 120)
+        return 0.0 if attempt <= 1 else min(2.0 ** (attempt - 1), 120.0)
+
+    def _retry_delay(self, response: Any, attempt: int) -> float:
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return self._backoff(attempt)
+
+    def close(self) -> None:
+        self.client.close()
+
+
+def _json_dumps(data: Any) -> bytes:
+    return json.dumps(data).encode('utf-8')
+
+
+TRANSPORTS = {
+    RequestsTransport.name: RequestsTransport,
+    Urllib3Transport.name: Urllib3Transport,
+    HTTP2Transport.name: HTTP2Transport,
+}
+
+
+def create_transport(transport: Union[str, Transport], retries: int = 3, resolver: Any = None) -> Transport:
+    """
+    Obtenir un transport à partir de son nom
+
+    Args:
+        transport: Nom ('requests', 'urllib3', 'http2') ou instance de Transport
+        retries: Nombre de tentatives supplémentaires
+        resolver: Cache DNS des connexions (ignoré pour une instance)
+
+    Returns:
+        Transport: Transport prêt à l'emploi
+
+    Raises:
+        ValidationError: Si le nom est inconnu
+    """
+    if isinstance(transport, Transport):
+        return transport
+    transport_class = TRANSPORTS.get(transport)
+    if transport_class is None:
+        raise ValidationError(f"Unknown transport '{transport}' (expected one of {', '.join(TRANSPORTS)})")
+    return transport_class(retries=retries, resolver=resolver)
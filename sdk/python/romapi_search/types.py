@@ -7,6 +7,38 @@ from typing import Dict, List, Optional, Union, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 
+# Valeurs répétées d'un résultat à l'autre (catégories, villes, régions, tags) :
+# une seule instance par valeur. Chaque table est bornée par deux générations :
+# pleine, la génération récente devient l'ancienne et la précédente est
+# oubliée ; une valeur retrouvée dans l'ancienne y est reprise (LRU approché,
+# sans coût de mise à jour sur le chemin des succès).
+_SHARED_STRINGS: Dict[str, str] = {}
+_SHARED_STRINGS_PREVIOUS: Dict[str, str] = {}
+_SHARED_STRINGS_MAX = 10000
+_SHARED_CATEGORIES_MAX = 1000
+
+
+def _promote(recent: Dict[Any, Any], previous: Dict[Any, Any], max_size: int, key: Any, value: Any) -> Any:
+    """Ranger une valeur dans la génération récente d'une table partagée"""
+    if len(recent) >= max_size // 2:
+        previous.clear()
+        previous.update(recent)
+        recent.clear()
+    return recent.setdefault(key, value)
+
+
+def _shared_string(value: Optional[str]) -> Optional[str]:
+    """Instance partagée d'une chaîne (None et chaîne vide renvoyées telles quelles)"""
+    if not value:
+        return value
+    shared = _SHARED_STRINGS.get(value)
+    if shared is None:
+        shared = _promote(
+            _SHARED_STRINGS, _SHARED_STRINGS_PREVIOUS, _SHARED_STRINGS_MAX,
+            value, _SHARED_STRINGS_PREVIOUS.get(value, value)
+        )
+    return shared
+
 
 class ResourceType(Enum):
     """Types de ressources disponibles"""
@@ -97,15 +129,62 @@ class Contact:
     website: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class Category:
-    """Informations de catégorie"""
+    """
+    Informations de catégorie
+
+    Immuable : les résultats d'une même catégorie partagent une seule
+    instance (voir ``Category.shared``), utilisable comme clé de regroupement.
+    """
     id: str
     name: str
     slug: str
     description: Optional[str] = None
     icon: Optional[str] = None
 
+    @classmethod
+    def shared(
+        cls,
+        id: str,
+        name: str,
+        slug: str,
+        description: Optional[str] = None,
+        icon: Optional[str] = None
+    ) -> 'Category':
+        """
+        Instance partagée d'une catégorie
+
+        Toutes les réponses décodées par le processus partagent la même
+        instance pour les mêmes valeurs (table bornée à 1000 catégories).
+        """
+        return _shared_category(cls, (id, name, slug, description, icon))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Category':
+        """Catégorie partagée à partir d'un dictionnaire"""
+        return _shared_category(cls, (
+            data.get('id', ''),
+            data.get('name', ''),
+            data.get('slug', ''),
+            data.get('description'),
+            data.get('icon')
+        ))
+
+
+_SHARED_CATEGORIES: Dict[tuple, Category] = {}
+_SHARED_CATEGORIES_PREVIOUS: Dict[tuple, Category] = {}
+
+
+def _shared_category(cls: type, key: tuple) -> Category:
+    category = _SHARED_CATEGORIES.get(key)
+    if category is None:
+        category = _promote(
+            _SHARED_CATEGORIES, _SHARED_CATEGORIES_PREVIOUS, _SHARED_CATEGORIES_MAX,
+            key, _SHARED_CATEGORIES_PREVIOUS.get(key) or cls(*key)
+        )
+    return category
+
 
 @dataclass
 class SearchFilters:
@@ -216,27 +295,30 @@ class SearchHit:
         if data.get('updatedAt'):
             updated_at = datetime.fromisoformat(data['updatedAt'].replace('Z', '+00:00'))
 
-        # Convertir la catégorie
+        # Catégorie et chaînes répétées partagées entre les résultats
         category_data = data.get('category', {})
-        category = Category(
-            id=category_data.get('id', ''),
-            name=category_data.get('name', ''),
-            slug=category_data.get('slug', ''),
-            description=category_data.get('description'),
-            icon=category_data.get('icon')
+        category_key = (
+            category_data.get('id', ''),
+            category_data.get('name', ''),
+            category_data.get('slug', ''),
+            category_data.get('description'),
+            category_data.get('icon')
         )
+        category = _shared_category(Category, category_key)
+        tags = data.get('tags') or []
 
         # Convertir l'adresse
         address = None
         if data.get('address'):
             address_data = data['address']
+            city, region, country = address_data.get('city'), address_data.get('region'), address_data.get('country')
             address = Address(
                 address_line1=address_data.get('addressLine1'),
                 address_line2=address_data.get('addressLine2'),
-                city=address_data.get('city'),
-                region=address_data.get('region'),
+                city=_shared_string(city),
+                region=_shared_string(region),
                 postal_code=address_data.get('postalCode'),
-                country=address_data.get('country'),
+                country=_shared_string(country),
                 latitude=address_data.get('latitude'),
                 longitude=address_data.get('longitude')
             )
@@ -263,7 +345,7 @@ class SearchHit:
             category=category,
             address=address,
             contact=contact,
-            tags=data.get('tags', []),
+            tags=list(map(_shared_string, tags)),
             rating=data.get('rating'),
             distance=data.get('distance'),
             created_at=created_at,
@@ -324,6 +406,66 @@ class SearchMetadata:
         )
 
 
+@dataclass
+class RequestMetadata:
+    """
+    Mesures côté client de la requête ayant produit un résultat
+
+    Les durées sont en secondes. ``total_time`` couvre l'appel complet
+    (cache, réseau, retries, décodage JSON et construction des objets) ;
+    ``server_time`` reprend le ``took`` rapporté par l'API.
+    """
+    endpoint: str
+    total_time: float
+    network_time: float = 0.0
+    decode_time: float = 0.0
+    build_time: float = 0.0
+    server_time: Optional[float] = None
+    bytes_received: int = 0
+    from_cache: bool = False
+    cache_age: Optional[float] = None
+    retries: int = 0
+
+    @property
+    def sdk_time(self) -> float:
+        """Temps passé dans le SDK (décodage JSON et construction des objets)"""
+        return self.decode_time + self.build_time
+
+    def breakdown(self) -> Dict[str, float]:
+        """
+        Répartition de la latence entre serveur, réseau et SDK
+
+        Returns:
+            Dict: Durées ``server``, ``network`` (hors temps serveur), ``sdk`` et ``other``
+        """
+        server = min(self.server_time or 0.0, self.network_time) if not self.from_cache else 0.0
+        return {
+            'server': server,
+            'network': self.network_time - server,
+            'sdk': self.sdk_time,
+            'other': max(self.total_time - self.network_time - self.sdk_time, 0.0),
+        }
+
+    def attribution(self) -> str:
+        """Composante dominante de la latence ('server', 'network', 'sdk' ou 'other')"""
+        breakdown = self.breakdown()
+        return max(breakdown, key=breakdown.get)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'endpoint': self.endpoint,
+            'total_time': self.total_time,
+            'network_time': self.network_time,
+            'decode_time': self.decode_time,
+            'build_time': self.build_time,
+            'server_time': self.server_time,
+            'bytes_received': self.bytes_received,
+            'from_cache': self.from_cache,
+            'cache_age': self.cache_age,
+            'retries': self.retries,
+        }
+
+
 @dataclass
 class SearchResults:
     """Résultats de recherche complets"""
@@ -334,6 +476,7 @@ class SearchResults:
     suggestions: Optional[List[str]] = None
     pagination: Optional[PaginationInfo] = None
     metadata: Optional[SearchMetadata] = None
+    request_metadata: Optional[RequestMetadata] = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SearchResults':
@@ -375,12 +518,12 @@ class Suggestion:
         category = None
         if data.get('category'):
             category_data = data['category']
-            category = Category(
-                id=category_data['id'],
-                name=category_data['name'],
-                slug=category_data['slug'],
-                description=category_data.get('description'),
-                icon=category_data.get('icon')
+            category = Category.shared(
+                category_data['id'],
+                category_data['name'],
+                category_data['slug'],
+                category_data.get('description'),
+                category_data.get('icon')
             )
 
         return cls(
@@ -456,9 +599,9 @@ class SEOInfo:
 @dataclass
 class CategorySearchResults(SearchResults):
     """Résultats de recherche par catégorie avec navigation"""
-    category_info: CategoryInfo
-    breadcrumbs: List[Breadcrumb]
-    subcategories: List[CategoryInfo]
+    category_info: Optional[CategoryInfo] = None
+    breadcrumbs: List[Breadcrumb] = field(default_factory=list)
+    subcategories: List[CategoryInfo] = field(default_factory=list)
     parent_category: Optional[CategoryInfo] = None
     seo: Optional[SEOInfo] = None
 
@@ -523,6 +666,7 @@ class MultiTypeSearchResults:
     took: int
     mixed_results: Optional[List[SearchHit]] = None
     pagination_by_type: Optional[Dict[str, PaginationInfo]] = None
+    request_metadata: Optional[RequestMetadata] = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'MultiTypeSearchResults':
@@ -606,6 +750,7 @@ class SearchAnalytics:
     popular_terms: List[PopularTerm]
     no_results_queries: List[NoResultsQuery]
     metrics: SearchMetrics
+    request_metadata: Optional[RequestMetadata] = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SearchAnalytics':
@@ -6,7 +6,8 @@ import time
 import hashlib
 import json
 import math
-from typing import Dict, List, Optional, Any, Union
+import threading
+from typing import Dict, Iterable, List, Optional, Any, Tuple, Union
 from urllib.parse import urlencode
 
 from .types import (
@@ -18,6 +19,8 @@ from .types import (
     SortOrder,
     GeoLocation,
     SearchHit,
+    SearchFacet,
+    SearchResults,
     PaginationParams,
     SortOptions,
     PriceRange,
@@ -288,10 +291,81 @@ class FormatUtils:
 
 
 class CacheUtils:
-    """Utilitaires de cache local"""
+    """
+    Utilitaires de cache local
     
-    def __init__(self):
+    Avec un ``backend`` (voir ``romapi_search.cache``), les entrées sont
+    sérialisées en JSON et stockées dans un cache partagé ; sinon elles
+    restent dans un dictionnaire du processus.
+    
+    Args:
+        backend: Backend de cache partagé (optionnel)
+        validator_grace: Durée de conservation supplémentaire, en secondes,
+            des entrées expirées possédant un validateur ; au-delà, elles
+            sont retirées et la requête suivante est complète
+    """
+    
+    # Écritures entre deux purges des entrées périmées (cache du processus)
+    PURGE_INTERVAL = 256
+    
+    def __init__(self, backend: Any = None, validator_grace: int = 3600):
         self._cache: Dict[str, Dict[str, Any]] = {}
+        self.backend = backend
+        self.validator_grace = validator_grace
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._writes = 0
+        # Compteurs partagés par les threads du client (recherches parallèles, préchargements)
+        self._lock = threading.Lock()
+    
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+    
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.backend is None:
+            return self._cache.get(key)
+        return self._decode(self.backend.get(key))
+    
+    @staticmethod
+    def _decode(raw: Optional[bytes]) -> Optional[Dict[str, Any]]:
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+    
+    def _retention(self, entry: Dict[str, Any]) -> float:
+        """Durée de conservation d'une entrée : TTL, plus le délai de grâce si elle est revalidable"""
+        if entry.get('etag') or entry.get('last_modified'):
+            return entry['ttl'] + self.validator_grace
+        return entry['ttl']
+    
+    def _write(self, key: str, entry: Dict[str, Any]) -> None:
+        if self.backend is None:
+            self._cache[key] = entry
+            with self._lock:
+                self._writes += 1
+                purge = self._writes % self.PURGE_INTERVAL == 0
+            # Entrées jamais relues : retirées périodiquement pour borner la mémoire
+            if purge:
+                self._purge()
+            return
+        # Les entrées revalidables survivent à leur TTL (requête conditionnelle)
+        self.backend.set(key, json.dumps(entry, separators=(',', ':')).encode('utf-8'), self._retention(entry))
+    
+    def _purge(self) -> None:
+        """Retirer les entrées du processus au-delà de leur durée de conservation"""
+        now = time.time()
+        stale = [
+            key for key, entry in list(self._cache.items())
+            if now - entry['timestamp'] > self._retention(entry)
+        ]
+        for key in stale:
+            self._cache.pop(key, None)
+        self._count('evictions', len(stale))
     
     def generate_cache_key(self, url: str, params: Dict[str, Any]) -> str:
         """
@@ -309,7 +383,14 @@ class CacheUtils:
         cache_string = f"{url}?{urlencode(sorted_params)}"
         return hashlib.md5(cache_string.encode()).hexdigest()
     
-    def set(self, key: str, data: Any, ttl_seconds: int = 300) -> None:
+    def set(
+        self,
+        key: str,
+        data: Any,
+        ttl_seconds: int = 300,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
         """
         Mettre en cache avec TTL
         
@@ -317,52 +398,187 @@ class CacheUtils:
             key: Clé de cache
             data: Données à mettre en cache
             ttl_seconds: Durée de vie en secondes
+            etag: Validateur ETag renvoyé par le serveur (optionnel)
+            last_modified: Validateur Last-Modified renvoyé par le serveur (optionnel)
         """
-        self._cache[key] = {
+        self._write(key, {
             'data': data,
             'timestamp': time.time(),
-            'ttl': ttl_seconds
-        }
+            'ttl': ttl_seconds,
+            'etag': etag,
+            'last_modified': last_modified
+        })
     
     def get(self, key: str) -> Optional[Any]:
         """
         Récupérer du cache
         
+        Les entrées expirées possédant un validateur (ETag/Last-Modified)
+        sont conservées pour permettre une revalidation conditionnelle.
+        
         Args:
             key: Clé de cache
             
         Returns:
             Any: Données en cache ou None si expirées/inexistantes
         """
-        if key not in self._cache:
+        return self._lookup(key, self._read(key))
+    
+    def get_many(self, keys: List[str], with_age: bool = False) -> List[Any]:
+        """
+        Récupérer plusieurs entrées (un seul aller-retour avec un backend)
+        
+        Args:
+            keys: Clés de cache
+            with_age: Renvoyer des couples (données, âge en secondes)
+            
+        Returns:
+            List: Données en cache (None si expirées/inexistantes), dans l'ordre des clés
+        """
+        results = self.lookup_many(keys)
+        if with_age:
+            return [(data, age) for data, age, _ in results]
+        return [data for data, _, _ in results]
+    
+    def lookup(self, key: str) -> Tuple[Optional[Any], Optional[float], Dict[str, str]]:
+        """
+        Lire une entrée en une fois : données, âge et validateurs
+        
+        Args:
+            key: Clé de cache
+            
+        Returns:
+            Tuple: (données ou None si expirées/inexistantes, âge en secondes
+            si les données sont servies, en-têtes de requête conditionnelle)
+        """
+        return self._lookup_entry(key, self._read(key), time.time())
+    
+    def lookup_many(self, keys: List[str]) -> List[Tuple[Optional[Any], Optional[float], Dict[str, str]]]:
+        """
+        Lire plusieurs entrées (un seul aller-retour avec un backend)
+        
+        Args:
+            keys: Clés de cache
+            
+        Returns:
+            List: Triplets (données, âge, validateurs) de ``lookup``, dans l'ordre des clés
+        """
+        if self.backend is None:
+            entries = [self._cache.get(key) for key in keys]
+        else:
+            entries = [self._decode(raw) for raw in self.backend.get_many(keys)]
+        now = time.time()
+        return [self._lookup_entry(key, entry, now) for key, entry in zip(keys, entries)]
+    
+    def _lookup_entry(
+        self, key: str, entry: Optional[Dict[str, Any]], now: float
+    ) -> Tuple[Optional[Any], Optional[float], Dict[str, str]]:
+        data = self._lookup(key, entry)
+        if entry is None:
+            return None, None, {}
+        age = now - entry['timestamp']
+        if data is not None:
+            return data, age, self._validators(entry)
+        # Entrée expirée : validateurs utilisables tant qu'elle est conservée
+        return None, None, self._validators(entry) if age <= self._retention(entry) else {}
+    
+    def _lookup(self, key: str, entry: Optional[Dict[str, Any]]) -> Optional[Any]:
+        if entry is None:
+            self._count('misses')
             return None
         
-        entry = self._cache[key]
-        if time.time() - entry['timestamp'] > entry['ttl']:
-            del self._cache[key]
+        age = time.time() - entry['timestamp']
+        if age > entry['ttl']:
+            # Avec un backend, l'expiration des clés est gérée par le backend ;
+            # les entrées revalidables sont gardées pendant le délai de grâce
+            if self.backend is None and age > self._retention(entry):
+                self._cache.pop(key, None)
+                self._count('evictions')
+            self._count('misses')
+            return None
+        
+        self._count('hits')
+        return entry['data']
+    
+    def age(self, key: str) -> Optional[float]:
+        """Âge d'une entrée en secondes depuis sa dernière écriture ou revalidation"""
+        entry = self._read(key)
+        return time.time() - entry['timestamp'] if entry else None
+    
+    def get_validators(self, key: str) -> Dict[str, str]:
+        """
+        Obtenir les en-têtes de requête conditionnelle pour une entrée
+        
+        Args:
+            key: Clé de cache
+            
+        Returns:
+            Dict: En-têtes If-None-Match / If-Modified-Since (vide si aucun validateur)
+        """
+        entry = self._read(key)
+        return self._validators(entry) if entry else {}
+    
+    @staticmethod
+    def _validators(entry: Dict[str, Any]) -> Dict[str, str]:
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def revalidate(self, key: str, ttl_seconds: Optional[int] = None) -> Optional[Any]:
+        """
+        Prolonger une entrée après une réponse 304 Not Modified
+        
+        Args:
+            key: Clé de cache
+            ttl_seconds: Nouvelle durée de vie (défaut: TTL d'origine)
+            
+        Returns:
+            Any: Données en cache réutilisées ou None si l'entrée n'existe plus
+        """
+        entry = self._read(key)
+        if not entry:
             return None
         
+        entry['timestamp'] = time.time()
+        if ttl_seconds is not None:
+            entry['ttl'] = ttl_seconds
+        if self.backend is not None:
+            self._write(key, entry)
         return entry['data']
     
     def clear(self) -> None:
         """Vider tout le cache"""
         self._cache.clear()
+        if self.backend is not None:
+            self.backend.clear()
     
     def cleanup(self) -> None:
-        """Nettoyer les entrées expirées"""
+        """Nettoyer les entrées expirées (les backends expirent leurs clés eux-mêmes)"""
         current_time = time.time()
         expired_keys = [
-            key for key, entry in self._cache.items()
+            key for key, entry in list(self._cache.items())
             if current_time - entry['timestamp'] > entry['ttl']
         ]
         
         for key in expired_keys:
-            del self._cache[key]
+            self._cache.pop(key, None)
+        self._count('evictions', len(expired_keys))
     
     @property
     def size(self) -> int:
         """Nombre d'entrées en cache"""
+        if self.backend is not None:
+            return self.backend.size()
         return len(self._cache)
+    
+    @property
+    def hit_ratio(self) -> float:
+        """Proportion de lectures servies depuis le cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
 
 
 class ResultsUtils:
@@ -438,6 +654,172 @@ class ResultsUtils:
         }
 
 
+class ResultsAggregator:
+    """
+    Agrégateur incrémental de statistiques et de facettes
+    
+    Les résultats sont ajoutés page par page (ou requête par requête) et
+    seuls des compteurs sont conservés : la mémoire ne dépend pas du nombre
+    de résultats agrégés, uniquement du nombre de catégories, types et
+    valeurs de facettes distincts.
+    
+    Example:
+        >>> aggregator = ResultsAggregator()
+        >>> for page in range(1, 11):
+        ...     results = client.search(query="restaurant", page=page, limit=100)
+        ...     aggregator.add_hits(results.hits)
+        ...     if page == 1:
+        ...         aggregator.add_facets(results.facets)
+        >>> stats = aggregator.stats()
+    """
+    
+    def __init__(self):
+        self.total_hits = 0
+        self.verified_count = 0
+        self._score_sum = 0.0
+        self._min_score: Optional[float] = None
+        self._max_score: Optional[float] = None
+        self._rating_sum = 0.0
+        self._rating_count = 0
+        self._min_rating: Optional[float] = None
+        self._max_rating: Optional[float] = None
+        self._type_distribution: Dict[str, int] = {}
+        self._category_counts: Dict[str, int] = {}
+        self._facet_values: Dict[str, Dict[str, int]] = {}
+        self._facet_totals: Dict[str, int] = {}
+    
+    def add_hit(self, hit: SearchHit) -> 'ResultsAggregator':
+        """Ajouter un résultat"""
+        self.total_hits += 1
+        if hit.verified:
+            self.verified_count += 1
+        
+        self._score_sum += hit.score
+        if self._min_score is None or hit.score < self._min_score:
+            self._min_score = hit.score
+        if self._max_score is None or hit.score > self._max_score:
+            self._max_score = hit.score
+        
+        if hit.rating is not None:
+            self._rating_sum += hit.rating
+            self._rating_count += 1
+            if self._min_rating is None or hit.rating < self._min_rating:
+                self._min_rating = hit.rating
+            if self._max_rating is None or hit.rating > self._max_rating:
+                self._max_rating = hit.rating
+        
+        resource_type = hit.resource_type.value
+        self._type_distribution[resource_type] = self._type_distribution.get(resource_type, 0) + 1
+        
+        category_name = hit.category.name
+        self._category_counts[category_name] = self._category_counts.get(category_name, 0) + 1
+        return self
+    
+    def add_hits(self, hits: Iterable[SearchHit]) -> 'ResultsAggregator':
+        """Ajouter une page (ou un flux) de résultats"""
+        for hit in hits:
+            self.add_hit(hit)
+        return self
+    
+    def add_facet(self, facet: SearchFacet) -> 'ResultsAggregator':
+        """
+        Fusionner une facette
+        
+        Les facettes décrivent une requête entière : ne les ajouter qu'une
+        fois par requête pour ne pas compter plusieurs fois les mêmes valeurs.
+        """
+        values = self._facet_values.setdefault(facet.name, {})
+        for value, count in facet.values.items():
+            values[value] = values.get(value, 0) + count
+        self._facet_totals[facet.name] = self._facet_totals.get(facet.name, 0) + facet.total
+        return self
+    
+    def add_facets(self, facets: Iterable[SearchFacet]) -> 'ResultsAggregator':
+        """Fusionner une liste de facettes"""
+        for facet in facets:
+            self.add_facet(facet)
+        return self
+    
+    def add_results(self, results: SearchResults, include_facets: bool = True) -> 'ResultsAggregator':
+        """Ajouter les résultats et (optionnellement) les facettes d'une réponse"""
+        self.add_hits(results.hits)
+        if include_facets:
+            self.add_facets(results.facets)
+        return self
+    
+    def merge(self, other: 'ResultsAggregator') -> 'ResultsAggregator':
+        """Fusionner un autre agrégateur (par exemple calculé sur une autre requête)"""
+        self.total_hits += other.total_hits
+        self.verified_count += other.verified_count
+        self._score_sum += other._score_sum
+        self._rating_sum += other._rating_sum
+        self._rating_count += other._rating_count
+        
+        self._min_score = self._min_value(self._min_score, other._min_score)
+        self._max_score = self._max_value(self._max_score, other._max_score)
+        self._min_rating = self._min_value(self._min_rating, other._min_rating)
+        self._max_rating = self._max_value(self._max_rating, other._max_rating)
+        
+        for key, count in other._type_distribution.items():
+            self._type_distribution[key] = self._type_distribution.get(key, 0) + count
+        for key, count in other._category_counts.items():
+            self._category_counts[key] = self._category_counts.get(key, 0) + count
+        for name, values in other._facet_values.items():
+            merged = self._facet_values.setdefault(name, {})
+            for value, count in values.items():
+                merged[value] = merged.get(value, 0) + count
+        for name, total in other._facet_totals.items():
+            self._facet_totals[name] = self._facet_totals.get(name, 0) + total
+        return self
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Statistiques courantes
+        
+        Returns:
+            Dict: Mêmes clés que ResultsUtils.calculate_stats, plus min/max
+            des scores et notes et le nombre de résultats par catégorie
+            (toujours présentes, y compris sans résultat)
+        """
+        # Mêmes clés sans résultat : valeurs nulles, min/max à None
+        return {
+            'average_score': self._score_sum / self.total_hits if self.total_hits else 0,
+            'average_rating': self._rating_sum / self._rating_count if self._rating_count else 0,
+            'verified_count': self.verified_count,
+            'type_distribution': dict(self._type_distribution),
+            'total_hits': self.total_hits,
+            'verified_percentage': (self.verified_count / self.total_hits) * 100 if self.total_hits else 0,
+            'min_score': self._min_score,
+            'max_score': self._max_score,
+            'min_rating': self._min_rating,
+            'max_rating': self._max_rating,
+            'category_counts': dict(self._category_counts)
+        }
+    
+    def facets(self) -> List[SearchFacet]:
+        """Facettes fusionnées"""
+        return [
+            SearchFacet(name=name, values=dict(values), total=self._facet_totals.get(name, 0))
+            for name, values in self._facet_values.items()
+        ]
+    
+    @staticmethod
+    def _min_value(a: Optional[float], b: Optional[float]) -> Optional[float]:
+        if a is None:
+            return b
+        if b is None:
+            return a
+        return min(a, b)
+    
+    @staticmethod
+    def _max_value(a: Optional[float], b: Optional[float]) -> Optional[float]:
+        if a is None:
+            return b
+        if b is None:
+            return a
+        return max(a, b)
+
+
 class AsyncUtils:
     """Utilitaires pour opérations asynchrones"""
     
@@ -0,0 +1,232 @@
+"""
+Préchauffage du cache à partir des termes de recherche populaires
+
+Après un redémarrage, le cache du client est vide : les recherches les plus
+fréquentes paient toutes un aller-retour vers l'API. ``CacheWarmer``
+récupère les termes les plus recherchés (``/search/analytics/popular-terms``)
+et met en cache leurs recherches et suggestions, éventuellement pour
+chaque ville ou région configurée, à un débit borné et en priorité de fond.
+
+En tâche de fond (``start()``), les passages sont répétés deux fois par
+fenêtre de rafraîchissement : chaque entrée est renouvelée (revalidation
+conditionnelle si possible) avant son expiration, et la tête de la
+distribution des requêtes reste servie depuis la mémoire.
+
+Example:
+    >>> warmer = CacheWarmer(client, top_n=20, cities=['Douala', 'Yaoundé'], rate=5)
+    >>> warmer.warm()
+    {'terms': 20, 'targets': 60, 'fetched': 60, 'fresh': 0, 'errors': 0, ...}
+    >>> warmer.start()
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from .cache import CachePolicy, cache_policy_scope
+from .exceptions import RateLimitError, ROMAPIError, ValidationError
+from .scheduler import BACKGROUND, priority_scope
+
+logger = logging.getLogger(__name__)
+
+WARM_SEARCH = 'search'
+WARM_SUGGEST = 'suggest'
+
+
+@dataclass
+class WarmTarget:
+    """Requête préchauffée (méthode du client et ses arguments)"""
+    kind: str
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+class CacheWarmer:
+    """
+    Préchauffe et rafraîchit le cache d'un client
+
+    Les termes populaires ne sont pas ventilés par ville côté serveur : avec
+    ``cities`` ou ``regions``, chaque terme est préchauffé sans filtre puis
+    pour chaque ville et région.
+
+    Args:
+        client: Client dont le cache est préchauffé
+        top_n: Nombre de termes populaires préchauffés (défaut: 20)
+        cities: Villes pour lesquelles préchauffer chaque terme (optionnel)
+        regions: Régions pour lesquelles préchauffer chaque terme (optionnel)
+        include_suggestions: Préchauffer aussi les suggestions (défaut: True)
+        rate: Requêtes envoyées à l'API par seconde au maximum (défaut: 2)
+        refresh_ahead: Part du TTL du cache, avant expiration, pendant
+            laquelle une entrée est rafraîchie (défaut: 0.2)
+        terms: Termes à préchauffer à la place des termes populaires (optionnel)
+        priority: Priorité des requêtes dans l'ordonnanceur (défaut: BACKGROUND)
+
+    Raises:
+        ValidationError: Si le cache du client est désactivé ou si un paramètre est invalide
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        top_n: int = 20,
+        cities: Optional[Sequence[str]] = None,
+        regions: Optional[Sequence[str]] = None,
+        include_suggestions: bool = True,
+        rate: float = 2.0,
+        refresh_ahead: float = 0.2,
+        terms: Optional[Sequence[str]] = None,
+        priority: str = BACKGROUND
+    ):
+        if client.cache is None:
+            raise ValidationError("Cache warming requires the client cache (enable_cache=True)")
+        if top_n < 1 or top_n > 100:
+            raise ValidationError("top_n must be between 1 and 100")
+        if rate <= 0:
+            raise ValidationError("Rate must be > 0")
+        if not 0 < refresh_ahead < 1:
+            raise ValidationError("refresh_ahead must be between 0 and 1")
+        self.client = client
+        self.top_n = top_n
+        self.cities = list(cities or [])
+        self.regions = list(regions or [])
+        self.include_suggestions = include_suggestions
+        self.rate = rate
+        self.refresh_ahead = refresh_ahead
+        self.terms = list(terms) if terms is not None else None
+        self.priority = priority
+        self.stats: Dict[str, Any] = {
+            'passes': 0, 'fetched': 0, 'fresh': 0, 'errors': 0, 'last_pass': None,
+        }
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def refresh_age(self) -> float:
+        """Âge, en secondes, à partir duquel une entrée est rafraîchie"""
+        return self.client.cache_timeout * (1 - self.refresh_ahead)
+
+    @property
+    def interval(self) -> float:
+        """Intervalle entre deux passages (deux par fenêtre de rafraîchissement)"""
+        return self.client.cache_timeout * self.refresh_ahead / 2
+
+    def popular_terms(self) -> List[str]:
+        """Termes à préchauffer (``terms`` ou termes populaires de l'API)"""
+        if self.terms is not None:
+            return self.terms[:self.top_n]
+        return [term.term for term in self.client.get_popular_terms(limit=self.top_n)][:self.top_n]
+
+    def targets(self, terms: Sequence[str]) -> List[WarmTarget]:
+        """
+        Requêtes préchauffées pour des termes, par ordre de popularité
+
+        Args:
+            terms: Termes de recherche
+
+        Returns:
+            List[WarmTarget]: Recherches (sans filtre, par ville, par région) et suggestions
+        """
+        targets = []
+        for term in terms:
+            targets.append(WarmTarget(WARM_SEARCH, {'query': term}))
+            targets.extend(WarmTarget(WARM_SEARCH, {'query': term, 'city': city}) for city in self.cities)
+            targets.extend(WarmTarget(WARM_SEARCH, {'query': term, 'region': region}) for region in self.regions)
+            if self.include_suggestions:
+                targets.append(WarmTarget(WARM_SUGGEST, {'query': term}))
+        return targets
+
+    def warm(self) -> Dict[str, Any]:
+        """
+        Préchauffer le cache une fois
+
+        Les entrées encore fraîches (plus jeunes que ``refresh_age``) sont
+        laissées telles quelles ; les autres sont récupérées au débit
+        ``rate``. Une réponse 429 interrompt le passage.
+
+        Returns:
+            Dict: Bilan du passage (termes, requêtes, récupérées, fraîches, erreurs, durée)
+        """
+        started = time.perf_counter()
+        report = {'terms': 0, 'targets': 0, 'fetched': 0, 'fresh': 0, 'errors': 0, 'elapsed': 0.0}
+        policy = CachePolicy(max_age=self.refresh_age)
+
+        with priority_scope(self.priority):
+            try:
+                terms = self.popular_terms()
+            except ROMAPIError as e:
+                logger.warning("Cache warming: popular terms unavailable: %s", e)
+                terms = []
+                report['errors'] += 1
+        targets = self.targets(terms)
+        report['terms'] = len(terms)
+        report['targets'] = len(targets)
+
+        with priority_scope(self.priority), cache_policy_scope(policy):
+            next_request = time.monotonic()
+            for target in targets:
+                if self._stop.is_set():
+                    break
+                # Seules les requêtes envoyées à l'API sont espacées
+                delay = next_request - time.monotonic()
+                if delay > 0 and self._stop.wait(delay):
+                    break
+                misses = policy.misses
+                try:
+                    self._fetch(target)
+                except RateLimitError as e:
+                    logger.warning("Cache warming paused by rate limiting: %s", e)
+                    report['errors'] += 1
+                    break
+                except ROMAPIError as e:
+                    logger.warning("Cache warming failed for %s %s: %s", target.kind, target.params, e)
+                    report['errors'] += 1
+                if policy.misses > misses:
+                    next_request = max(next_request, time.monotonic()) + 1.0 / self.rate
+
+        report['fetched'] = policy.misses
+        report['fresh'] = policy.hits
+        report['elapsed'] = time.perf_counter() - started
+        self.stats['passes'] += 1
+        self.stats['fetched'] += report['fetched']
+        self.stats['fresh'] += report['fresh']
+        self.stats['errors'] += report['errors']
+        self.stats['last_pass'] = report
+        return report
+
+    def _fetch(self, target: WarmTarget) -> None:
+        if target.kind == WARM_SUGGEST:
+            self.client.suggest(**target.params)
+        else:
+            self.client.search(**target.params)
+
+    def start(self) -> 'CacheWarmer':
+        """Préchauffer puis rafraîchir le cache en tâche de fond"""
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='romapi-cache-warmer', daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self.warm()
+            except Exception:
+                logger.exception("Cache warming pass failed")
+            self._stop.wait(max(self.interval - (time.monotonic() - started), 0.0))
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Arrêter le rafraîchissement en tâche de fond"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> 'CacheWarmer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,241 @@
+"""
+Flux de changements d'une recherche
+
+Pour maintenir un miroir d'une recherche (par exemple toutes les API
+fintech vérifiées), ``SearchWatcher`` la réexécute périodiquement et ne
+produit que les différences : ressources ajoutées, modifiées (``updated_at``
+différent) et retirées. L'état conservé entre deux interrogations est une
+empreinte compacte par ressource (identifiant et date de modification).
+
+Deux stratégies d'interrogation :
+
+- incrémentale : résultats triés par ``updatedAt`` décroissant, lecture
+  arrêtée dès la première ressource antérieure à la dernière modification
+  vue. Le coût suit le volume de changements et non la taille du résultat.
+  Si le total annoncé ne correspond pas à l'état mis à jour (ressource
+  retirée), un parcours complet est effectué ;
+- complète : parcours de toutes les pages (triées par date de création),
+  au premier passage puis tous les ``full_scan_every`` passages, pour
+  détecter les retraits non visibles dans le total.
+
+Chaque page est redemandée, en priorité BACKGROUND, avec ses validateurs
+(If-None-Match / If-Modified-Since) lorsque le cache du client les
+connaît : une page inchangée coûte une réponse 304 sans corps.
+
+Example:
+    >>> params = {'categories': ['fintech'], 'resource_types': [ResourceType.API], 'verified': True}
+    >>> for changes in client.watch(params, interval=60):
+    ...     mirror.upsert(changes.added + changes.updated)
+    ...     mirror.delete(changes.removed)
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from .cache import CachePolicy, cache_policy_scope
+from .exceptions import ROMAPIError, ValidationError
+from .scheduler import BACKGROUND, priority_scope
+from .types import SearchHit, SearchResults, SortField, SortOrder
+
+logger = logging.getLogger(__name__)
+
+# Paramètres fixés par le watcher (tri et pagination)
+_RESERVED_PARAMS = ('sort', 'order', 'page', 'limit')
+
+
+@dataclass
+class ChangeSet:
+    """Différences d'une recherche depuis l'interrogation précédente"""
+    added: List[SearchHit] = field(default_factory=list)
+    updated: List[SearchHit] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    full_scan: bool = False
+    pages: int = 0
+    pages_not_modified: int = 0
+    total: int = 0
+    polled_at: float = field(default_factory=time.time)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.updated) + len(self.removed)
+
+
+def fingerprint(hit: SearchHit) -> Optional[float]:
+    """Empreinte d'une ressource : date de modification (epoch, secondes)"""
+    return hit.updated_at.timestamp() if hit.updated_at else None
+
+
+class SearchWatcher:
+    """
+    Interroge une recherche et produit ses changements
+
+    Args:
+        client: Client utilisé pour les recherches
+        search_params: Arguments de ``search`` (hors tri et pagination)
+        page_size: Résultats par page (max 100, défaut: 100)
+        full_scan_every: Parcours complet tous les N passages (défaut: 10,
+            1 pour toujours parcourir toutes les pages)
+        state: Empreintes d'un passage précédent (``watcher.state``) pour
+            reprendre un miroir sans tout reproduire
+
+    Raises:
+        ValidationError: Si les paramètres sont invalides
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        search_params: Optional[Dict[str, Any]] = None,
+        page_size: int = 100,
+        full_scan_every: int = 10,
+        state: Optional[Dict[str, Optional[float]]] = None
+    ):
+        search_params = dict(search_params or {})
+        reserved = [name for name in _RESERVED_PARAMS if name in search_params]
+        if reserved:
+            raise ValidationError(f"Watched searches set their own {', '.join(reserved)}")
+        if not 1 <= page_size <= 100:
+            raise ValidationError("Page size must be between 1 and 100")
+        if full_scan_every < 1:
+            raise ValidationError("full_scan_every must be >= 1")
+        self.client = client
+        self.search_params = search_params
+        self.page_size = page_size
+        self.full_scan_every = full_scan_every
+        self.state: Dict[str, Optional[float]] = dict(state or {})
+        self.watermark: Optional[float] = max((ts for ts in self.state.values() if ts is not None), default=None)
+        self.stats = {'polls': 0, 'full_scans': 0, 'pages': 0, 'pages_not_modified': 0, 'changes': 0}
+        # Un état fourni est considéré comme issu d'un parcours complet
+        self._since_full_scan = 0 if state is None else 1
+
+    def poll(self) -> ChangeSet:
+        """
+        Interroger la recherche une fois
+
+        L'état n'est mis à jour qu'après un passage complet : une erreur en
+        cours de passage laisse l'état intact.
+
+        Returns:
+            ChangeSet: Ressources ajoutées, modifiées et retirées
+
+        Raises:
+            ROMAPIError: En cas d'erreur API
+        """
+        changes = None
+        if self.state and self._since_full_scan % self.full_scan_every:
+            changes = self._poll_incremental()
+        if changes is None:
+            changes = self._poll_full()
+            self._since_full_scan = 0
+        self._since_full_scan += 1
+
+        self.stats['polls'] += 1
+        self.stats['full_scans'] += changes.full_scan
+        self.stats['pages'] += changes.pages
+        self.stats['pages_not_modified'] += changes.pages_not_modified
+        self.stats['changes'] += len(changes)
+        return changes
+
+    def watch(self, interval: float = 60.0, max_polls: Optional[int] = None) -> Iterator[ChangeSet]:
+        """
+        Interroger la recherche à intervalle régulier
+
+        Les erreurs API d'un passage sont journalisées et le passage est
+        retenté à l'intervalle suivant (sauf ``ValidationError``).
+
+        Args:
+            interval: Intervalle entre deux débuts de passage, en secondes
+            max_polls: Nombre maximum de passages (défaut: illimité)
+
+        Yields:
+            ChangeSet: Changements de chaque passage (éventuellement vides)
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            started = time.monotonic()
+            polls += 1
+            try:
+                yield self.poll()
+            except ValidationError:
+                raise
+            except ROMAPIError as e:
+                logger.warning("Watched search poll failed: %s", e)
+            if max_polls is None or polls < max_polls:
+                time.sleep(max(interval - (time.monotonic() - started), 0.0))
+
+    def _pages(self, sort: SortField, order: SortOrder, changes: ChangeSet) -> Iterator[SearchResults]:
+        # max_age=0 : chaque page est redemandée, avec ses validateurs s'ils sont connus ;
+        # synchronisation de fond, comme un export
+        page = 1
+        while True:
+            with priority_scope(BACKGROUND), cache_policy_scope(CachePolicy(max_age=0)):
+                results = self.client.search(
+                    **self.search_params, sort=sort, order=order, page=page, limit=self.page_size
+                )
+            changes.pages += 1
+            if results.request_metadata is not None and results.request_metadata.from_cache:
+                changes.pages_not_modified += 1
+            if page == 1:
+                changes.total = results.total
+            yield results
+            if not (results.pagination and results.pagination.has_next) or not results.hits:
+                return
+            page += 1
+
+    def _poll_incremental(self) -> Optional[ChangeSet]:
+        """Passage incrémental (None si un parcours complet est nécessaire)"""
+        changes = ChangeSet()
+        seen: Dict[str, Optional[float]] = {}
+        watermark = self.watermark
+        for results in self._pages(SortField.UPDATED_AT, SortOrder.DESC, changes):
+            older = False
+            for hit in results.hits:
+                stamp = fingerprint(hit)
+                # Ressources modifiées à la même date que le repère : revérifiées
+                if watermark is not None and stamp is not None and stamp < watermark:
+                    older = True
+                    break
+                if hit.id in seen:
+                    continue
+                seen[hit.id] = stamp
+                if hit.id not in self.state:
+                    changes.added.append(hit)
+                elif self.state[hit.id] != stamp:
+                    changes.updated.append(hit)
+            if older:
+                break
+
+        # Retraits invisibles dans un parcours incrémental : vérifiés par le total
+        if changes.total != len(self.state) + len(changes.added):
+            return None
+        self._apply(seen)
+        return changes
+
+    def _poll_full(self) -> ChangeSet:
+        changes = ChangeSet(full_scan=True)
+        seen: Dict[str, Optional[float]] = {}
+        for results in self._pages(SortField.CREATED_AT, SortOrder.ASC, changes):
+            for hit in results.hits:
+                if hit.id in seen:
+                    continue
+                stamp = fingerprint(hit)
+                seen[hit.id] = stamp
+                if hit.id not in self.state:
+                    changes.added.append(hit)
+                elif self.state[hit.id] != stamp:
+                    changes.updated.append(hit)
+
+        changes.removed = [resource_id for resource_id in self.state if resource_id not in seen]
+        self.state = seen
+        self.watermark = max((ts for ts in seen.values() if ts is not None), default=None)
+        return changes
+
+    def _apply(self, seen: Dict[str, Optional[float]]) -> None:
+        self.state.update(seen)
+        stamps = [ts for ts in seen.values() if ts is not None]
+        if stamps:
+            self.watermark = max(stamps + ([self.watermark] if self.watermark is not None else []))
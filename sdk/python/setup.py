@@ -29,7 +29,7 @@ setup(
         "Documentation": "https://docs.romapi.com/sdk/python",
         "Source Code": "https://github.com/romapi/search-sdk-python",
     },
-    packages=find_packages(exclude=["tests*"]),
+    packages=find_packages(exclude=["tests*", "benchmarks*"]),
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -62,11 +62,28 @@ setup(
         "async": [
             "aiohttp>=3.8.0",
         ],
+        "parquet": [
+            "pyarrow>=12.0.0",
+        ],
+        "http2": [
+            "httpx[http2]>=0.24.0",
+        ],
+        "redis": [
+            "redis>=4.0.0",
+        ],
+        "msgpack": [
+            "msgpack>=1.0.0",
+        ],
     },
     keywords=[
         "romapi", "search", "api", "cameroon", "sdk", 
         "elasticsearch", "autocomplete", "geosearch"
     ],
+    entry_points={
+        "console_scripts": [
+            "romapi-search=romapi_search.cli:main",
+        ],
+    },
     include_package_data=True,
     zip_safe=False,
 )
\ No newline at end of file
@@ -0,0 +1,23 @@
+"""
+Fixtures communes des tests
+"""
+
+import pytest
+
+from romapi_search import ROMAPISearchClient
+from romapi_search.testing import FakeSearchServer
+
+
+@pytest.fixture
+def server():
+    """Faux serveur démarré (catalogue synthétique de 500 ressources)"""
+    with FakeSearchServer() as fake_server:
+        yield fake_server
+
+
+@pytest.fixture
+def client(server):
+    """Client du faux serveur, sans retries"""
+    fake_client = ROMAPISearchClient(base_url=server.base_url, retries=0)
+    yield fake_client
+    fake_client.close()
@@ -0,0 +1,44 @@
+"""
+Tests de l'agrégateur incrémental de résultats
+"""
+
+from romapi_search.testing import SyntheticCatalogue
+from romapi_search.types import SearchHit
+from romapi_search.utils import ResultsAggregator, ResultsUtils
+
+
+def _hits(count):
+    catalogue = SyntheticCatalogue(size=count)
+    return [SearchHit.from_dict(catalogue.hit(index)) for index in range(count)]
+
+
+def test_empty_stats_have_the_populated_keys():
+    empty = ResultsAggregator().stats()
+    populated = ResultsAggregator().add_hits(_hits(3)).stats()
+
+    assert empty.keys() == populated.keys()
+    assert empty['total_hits'] == 0 and empty['verified_percentage'] == 0
+    assert empty['min_score'] is None and empty['max_rating'] is None
+    assert empty['category_counts'] == {} and empty['type_distribution'] == {}
+
+
+def test_stats_match_batch_computation():
+    hits = _hits(40)
+    aggregator = ResultsAggregator()
+    for start in range(0, 40, 15):
+        aggregator.add_hits(hits[start:start + 15])
+
+    stats = aggregator.stats()
+    expected = ResultsUtils.calculate_stats(hits)
+    assert stats['total_hits'] == 40
+    assert stats['verified_count'] == expected['verified_count']
+    assert stats['type_distribution'] == expected['type_distribution']
+    assert abs(stats['average_score'] - expected['average_score']) < 1e-9
+    assert stats['min_score'] == min(hit.score for hit in hits)
+    assert sum(stats['category_counts'].values()) == 40
+
+
+def test_merge_equals_single_aggregation():
+    hits = _hits(20)
+    merged = ResultsAggregator().add_hits(hits[:8]).merge(ResultsAggregator().add_hits(hits[8:]))
+    assert merged.stats() == ResultsAggregator().add_hits(hits).stats()
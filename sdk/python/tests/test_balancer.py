@@ -0,0 +1,92 @@
+"""
+Tests de la répartition de charge entre réplicas
+"""
+
+import time
+
+from romapi_search import ROMAPISearchClient
+from romapi_search.balancer import LoadBalancer, Replica
+from romapi_search.exceptions import ROMAPIError
+from romapi_search.testing import FakeSearchServer, FaultProfile
+
+BROKEN = FaultProfile(error_rate=1.0, error_status=503)
+
+
+def _replica_client(healthy, broken, **kwargs):
+    return ROMAPISearchClient(
+        base_url=[healthy.base_url, broken.base_url], retries=0, enable_cache=False, **kwargs
+    )
+
+
+def _search_ignoring_errors(client, count):
+    failures = 0
+    for _ in range(count):
+        try:
+            client.search("restaurant")
+        except ROMAPIError:
+            failures += 1
+    return failures
+
+
+def test_failing_replica_is_ejected_after_consecutive_failures():
+    with FakeSearchServer() as healthy, FakeSearchServer(profile=BROKEN) as broken:
+        client = _replica_client(healthy, broken, health_check_interval=None)
+        failures = _search_ignoring_errors(client, 30)
+
+        good, bad = client.balancer.replicas
+        assert failures == client.balancer.max_failures
+        assert bad.ejected and bad.ejections == 1
+        assert not good.ejected
+
+        served = bad.requests
+        assert _search_ignoring_errors(client, 10) == 0
+        assert bad.requests == served
+        client.close()
+
+
+def test_probe_reinstates_recovered_replica():
+    with FakeSearchServer() as healthy, FakeSearchServer(profile=BROKEN) as broken:
+        client = _replica_client(healthy, broken, health_check_interval=None)
+        client.balancer.ejection_time = 0.0
+        _search_ignoring_errors(client, 30)
+        bad = client.balancer.replicas[1]
+        assert bad.ejected
+
+        # Sonde en échec : l'éjection est prolongée
+        client.balancer.probe_ejected()
+        assert bad.ejected
+
+        broken.set_profile(FaultProfile())
+        client.balancer.probe_ejected()
+        assert not bad.ejected
+        client.close()
+
+
+def test_background_prober_reinstates_replica():
+    with FakeSearchServer() as healthy, FakeSearchServer(profile=BROKEN) as broken:
+        client = _replica_client(healthy, broken, health_check_interval=0.05)
+        client.balancer.ejection_time = 0.0
+        _search_ignoring_errors(client, 30)
+        bad = client.balancer.replicas[1]
+        assert bad.ejected
+
+        broken.set_profile(FaultProfile())
+        deadline = time.monotonic() + 5
+        while bad.ejected and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert not bad.ejected
+        client.close()
+
+
+def test_lower_latency_replica_receives_more_requests():
+    fast, slow = Replica('http://fast', None), Replica('http://slow', None)
+    balancer = LoadBalancer([fast, slow], probe_interval=None, seed=1)
+    fast.latency, slow.latency = 0.01, 0.2
+
+    chosen = []
+    for _ in range(200):
+        replica = balancer.acquire()
+        chosen.append(replica)
+        balancer.release(replica, replica.latency)
+    # Avec deux réplicas, les deux choix aléatoires désignent toujours le meilleur
+    assert chosen.count(fast) == 200
@@ -0,0 +1,110 @@
+"""
+Tests du cache local (CacheUtils)
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from romapi_search.cache import RedisCacheBackend
+from romapi_search.testing import FakeRedis
+from romapi_search.utils import CacheUtils
+
+
+def test_expired_entry_with_validator_is_kept_for_revalidation(monkeypatch):
+    cache = CacheUtils(validator_grace=60)
+    now = time.time()
+    cache.set('key', {'total': 1}, ttl_seconds=10, etag='"v1"')
+
+    monkeypatch.setattr(time, 'time', lambda: now + 30)
+    assert cache.get('key') is None
+    assert cache.get_validators('key') == {'If-None-Match': '"v1"'}
+    assert cache.size == 1
+
+
+def test_expired_entry_with_validator_is_dropped_after_grace(monkeypatch):
+    cache = CacheUtils(validator_grace=60)
+    now = time.time()
+    cache.set('key', {'total': 1}, ttl_seconds=10, etag='"v1"')
+
+    monkeypatch.setattr(time, 'time', lambda: now + 100)
+    assert cache.get('key') is None
+    assert cache.get_validators('key') == {}
+    assert cache.size == 0
+    assert cache.evictions == 1
+
+
+def test_stale_entries_never_read_again_are_purged_on_write(monkeypatch):
+    cache = CacheUtils(validator_grace=60)
+    now = time.time()
+    for index in range(100):
+        cache.set(f'old-{index}', index, ttl_seconds=10, last_modified='Mon, 01 Jan 2024 00:00:00 GMT')
+
+    monkeypatch.setattr(time, 'time', lambda: now + 100)
+    for index in range(CacheUtils.PURGE_INTERVAL):
+        cache.set(f'new-{index}', index, ttl_seconds=10)
+
+    assert cache.size == CacheUtils.PURGE_INTERVAL
+    assert cache.evictions == 100
+
+
+class UnreachableRedis(FakeRedis):
+    """Client Redis dont toutes les commandes échouent"""
+
+    def _count(self, command):
+        raise ConnectionRefusedError(f"{command}: connection refused")
+
+
+def test_unreachable_redis_backend_degrades_to_misses():
+    backend = RedisCacheBackend(client=UnreachableRedis())
+    backend.set('key', b'value', ttl=10)
+    assert backend.get('key') is None
+    assert backend.get_many(['key', 'other']) == [None, None]
+    backend.delete('key')
+    backend.clear()
+    assert backend.size() == 0
+
+    cache = CacheUtils(backend=backend)
+    cache.set('key', {'total': 1})
+    assert cache.get('key') is None
+
+
+def test_client_reads_each_cache_entry_once_per_request():
+    from romapi_search import ROMAPISearchClient
+    from romapi_search.testing import FakeSearchServer
+
+    redis = FakeRedis()
+    with FakeSearchServer() as server:
+        client = ROMAPISearchClient(base_url=server.base_url, cache_backend=RedisCacheBackend(client=redis))
+        client.search("restaurant")
+        assert redis.commands == {'get': 1, 'set': 1}
+
+        client.search("restaurant")
+        assert redis.commands == {'get': 2, 'set': 1}
+
+
+def test_lookup_returns_validators_of_expired_entry(monkeypatch):
+    cache = CacheUtils(validator_grace=60)
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now)
+    cache.set('key', {'total': 1}, ttl_seconds=10, etag='"v1"')
+    assert cache.lookup('key') == ({'total': 1}, 0.0, {'If-None-Match': '"v1"'})
+
+    monkeypatch.setattr(time, 'time', lambda: now + 30)
+    assert cache.lookup('key') == (None, None, {'If-None-Match': '"v1"'})
+
+    monkeypatch.setattr(time, 'time', lambda: now + 100)
+    assert cache.lookup('key') == (None, None, {})
+    assert cache.size == 0
+
+
+def test_counters_are_exact_under_concurrent_lookups():
+    cache = CacheUtils()
+    cache.set('present', {'total': 1})
+
+    def read(index):
+        for _ in range(500):
+            cache.get('present' if index % 2 else 'absent')
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(read, range(8)))
+    assert cache.hits == 2000 and cache.misses == 2000
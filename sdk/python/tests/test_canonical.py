@@ -0,0 +1,57 @@
+"""
+Tests de la canonicalisation des clés de cache
+"""
+
+from romapi_search.canonical import CanonicalRules, QueryCanonicalizer
+
+
+def test_spacing_and_case_share_a_key():
+    canonicalizer = QueryCanonicalizer()
+    assert canonicalizer.canonicalize('/search', {'q': 'Restaurant  Douala'}) == \
+        canonicalizer.canonicalize('/search', {'q': 'restaurant douala'}) == {'q': 'restaurant douala'}
+
+
+def test_reordered_lists_share_a_key():
+    canonicalizer = QueryCanonicalizer()
+    first = canonicalizer.canonicalize('/search', {'tags': 'wifi,parking,wifi', 'categories': ['b', 'a']})
+    second = canonicalizer.canonicalize('/search', {'tags': ['parking', 'wifi'], 'categories': 'a,b'})
+    assert first == second == {'tags': 'parking,wifi', 'categories': 'a,b'}
+
+
+def test_server_defaults_are_dropped():
+    canonicalizer = QueryCanonicalizer()
+    # Valeurs par défaut de SearchController (page 1, 20 résultats, pertinence décroissante)
+    assert canonicalizer.canonicalize('/search', {
+        'q': 'taxi', 'page': 1, 'limit': '20', 'sort': 'relevance', 'order': 'desc',
+    }) == {'q': 'taxi'}
+    assert canonicalizer.canonicalize('/search', {'q': 'taxi', 'page': 2, 'limit': 20.0}) == {'q': 'taxi', 'page': '2'}
+    assert canonicalizer.canonicalize('/search/nearby', {'lat': 4.05, 'radius': 10}) == {'lat': '4.05'}
+    assert canonicalizer.canonicalize('/search/categories/cat-1/hierarchy', {
+        'includeSubcategories': True, 'maxDepth': 3, 'showCounts': True,
+    }) == {}
+    assert canonicalizer.canonicalize('/search/suggest', {'q': 'taxi', 'limit': 10, 'includePopular': True}) == \
+        {'q': 'taxi'}
+
+
+def test_suggestions_keep_case():
+    canonicalizer = QueryCanonicalizer()
+    assert canonicalizer.canonicalize('/search/suggest', {'q': 'Dou  '}) == {'q': 'Dou'}
+    assert canonicalizer.canonicalize('/search/suggest/smart', {'q': 'Dou'}) != \
+        canonicalizer.canonicalize('/search/suggest/smart', {'q': 'dou'})
+
+
+def test_endpoint_rules_override_defaults():
+    canonicalizer = QueryCanonicalizer(endpoints={
+        '/search': CanonicalRules(fold_accents=True),
+        '/search/nearby': None,
+    })
+    assert canonicalizer.canonicalize('/search', {'q': 'Yaoundé', 'page': 1}) == {'q': 'yaounde', 'page': '1'}
+    assert canonicalizer.canonicalize('/search/nearby', {'radius': 10}) == {'radius': 10}
+
+
+def test_client_cache_serves_canonical_variants(client, server):
+    client.search(query="Restaurant  Douala", tags=['wifi', 'parking'])
+    results = client.search(query="restaurant douala", tags=['parking', 'wifi'])
+    assert results.request_metadata.from_cache
+    assert server.stats['requests'] == 1
+    assert client.canonicalizer.stats['hits'] == 1 and client.canonicalizer.stats['raw_hits'] == 0
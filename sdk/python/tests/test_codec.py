@@ -0,0 +1,60 @@
+"""
+Tests du codec binaire des résultats
+"""
+
+import json
+import os
+
+import pytest
+
+from romapi_search import codec
+from romapi_search.testing import SyntheticCatalogue
+from romapi_search.types import CategorySearchResults, MultiTypeSearchResults, SearchResults, Suggestion
+
+from benchmarks.stub_server import PAYLOADS_DIR
+
+
+def _load(filename):
+    with open(os.path.join(PAYLOADS_DIR, filename), 'rb') as f:
+        return json.load(f)
+
+
+def _results():
+    category = SyntheticCatalogue().category_search({'limit': '20'}, 'restaurants')
+    return {
+        'search': SearchResults.from_dict(_load('search.json')),
+        'multi_type': MultiTypeSearchResults.from_dict(_load('multi_type.json')),
+        'category': CategorySearchResults.from_dict(category),
+        'suggestions': [Suggestion.from_dict(item) for item in _load('suggest.json')],
+    }
+
+
+FORMATS = [
+    pytest.param(codec.FORMAT_MSGPACK, id='msgpack', marks=pytest.mark.skipif(
+        codec.msgpack is None, reason="msgpack non installé"
+    )),
+    pytest.param(codec.FORMAT_JSON, id='json'),
+]
+
+
+@pytest.mark.parametrize('format', FORMATS)
+@pytest.mark.parametrize('name', ['search', 'multi_type', 'category', 'suggestions'])
+def test_round_trip(name, format):
+    value = _results()[name]
+    decoded = codec.decode(codec.encode(value, format))
+    assert decoded == value
+    assert type(decoded) is type(value)
+
+
+def test_version_mismatch_is_rejected():
+    data = bytearray(codec.encode(_results()['search'], codec.FORMAT_JSON))
+    data[2] = codec.CODEC_VERSION + 1
+    with pytest.raises(ValueError, match='Unsupported codec version'):
+        codec.decode(bytes(data))
+
+
+def test_unknown_format_is_rejected():
+    data = bytearray(codec.encode(_results()['search'], codec.FORMAT_JSON))
+    data[3] = 0xFF
+    with pytest.raises(ValueError, match='Unknown codec format'):
+        codec.decode(bytes(data))
@@ -0,0 +1,61 @@
+"""
+Tests des échéances de bout en bout
+"""
+
+import time
+
+import pytest
+
+from romapi_search import ROMAPISearchClient
+from romapi_search.deadline import Deadline, current_deadline, deadline_scope
+from romapi_search.exceptions import TimeoutError
+from romapi_search.testing import FakeSearchServer, FaultProfile, FixedLatency
+
+
+def test_attempt_timeouts_shrink_to_remaining_budget():
+    deadline = Deadline(0.5)
+    connect, read = deadline.timeouts((3.05, 10))
+    assert 0 < connect <= 0.5 and 0 < read <= 0.5
+    assert deadline.timeouts((0.1, None))[0] == 0.1
+
+
+def test_expired_deadline_raises_timeout_error():
+    deadline = Deadline(0.0)
+    assert deadline.expired
+    with pytest.raises(TimeoutError):
+        deadline.timeouts(5)
+    with pytest.raises(TimeoutError):
+        Deadline(1.0).check(2.0)
+
+
+def test_nested_scope_cannot_extend_enclosing_deadline():
+    with deadline_scope(0.2) as outer:
+        with deadline_scope(10) as inner:
+            assert inner is outer
+            assert current_deadline() is outer
+        with deadline_scope(0.05) as shorter:
+            assert shorter is not outer
+            assert current_deadline() is shorter
+        assert current_deadline() is outer
+    assert current_deadline() is None
+
+
+def test_slow_response_exceeds_budget():
+    with FakeSearchServer(profile=FaultProfile(latency=FixedLatency(1.0))) as server:
+        client = ROMAPISearchClient(base_url=server.base_url, retries=0)
+        started = time.perf_counter()
+        with pytest.raises(TimeoutError):
+            with client.deadline(0.2):
+                client.search("restaurant")
+        assert time.perf_counter() - started < 0.8
+
+
+def test_backoff_that_would_exceed_budget_fails_fast():
+    # Une rafale de 503 : le backoff (puis Retry-After) dépasserait le budget
+    profile = FaultProfile(error_rate=1.0, error_burst=10, error_status=503)
+    with FakeSearchServer(profile=profile) as server:
+        client = ROMAPISearchClient(base_url=server.base_url, retries=3, timeout_budget=0.5)
+        started = time.perf_counter()
+        with pytest.raises(TimeoutError):
+            client.search("restaurant")
+        assert time.perf_counter() - started < 0.5
@@ -0,0 +1,110 @@
+"""
+Tests de l'export massif
+"""
+
+import csv
+import json
+import threading
+
+import pytest
+
+from romapi_search.exceptions import ROMAPIError
+from romapi_search.export import FLAT_FIELDS, BulkExporter, NDJSONWriter
+from romapi_search.types import ResourceType
+
+
+def _read_ndjson(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_ndjson_export_writes_every_result_without_caching_pages(client, tmp_path):
+    output = str(tmp_path / 'export.ndjson')
+    summary = BulkExporter(client, output, page_size=25, concurrency=4).export_search()
+
+    rows = _read_ndjson(output)
+    assert summary.rows == len(rows) == 500
+    assert summary.pages == 20
+    assert len({row['id'] for row in rows}) == 500
+    assert list(rows[0]) == FLAT_FIELDS
+    assert client.cache.size == 0
+
+
+def test_csv_export_uses_flat_columns(client, tmp_path):
+    output = str(tmp_path / 'export.csv')
+    BulkExporter(client, output, format='csv', page_size=50).export_search()
+
+    with open(output, encoding='utf-8', newline='') as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
+    assert reader.fieldnames == FLAT_FIELDS
+    assert len(rows) == 500
+    assert all(row['category_id'] and row['city'] for row in rows)
+
+
+def test_export_by_type_flattens_records(client, tmp_path):
+    output = str(tmp_path / 'by_type.csv')
+    summary = BulkExporter(client, output, format='csv').export_by_type(
+        [ResourceType.BUSINESS, ResourceType.API], max_results=20
+    )
+
+    with open(output, encoding='utf-8', newline='') as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
+    assert reader.fieldnames == FLAT_FIELDS
+    assert summary.rows == len(rows) == 40
+    assert {row['resource_type'] for row in rows} == {'BUSINESS', 'API'}
+    assert all(row['category_name'] and not row['category_name'].startswith('{') for row in rows)
+    assert all(row['phone'] for row in rows)
+
+
+def test_interrupted_export_resumes_from_checkpoint(client, tmp_path, monkeypatch):
+    output = str(tmp_path / 'export.ndjson')
+    exporter = BulkExporter(client, output, page_size=25, concurrency=1, checkpoint_interval=2)
+
+    search = client.search
+    fail = {'page': 7}
+
+    def flaky_search(**params):
+        if params['page'] == fail['page']:
+            raise ROMAPIError("interrupted")
+        return search(**params)
+
+    monkeypatch.setattr(client, 'search', flaky_search)
+    with pytest.raises(ROMAPIError):
+        exporter.export_search()
+    assert json.load(open(exporter.checkpoint_path))['page'] == 6
+
+    fail['page'] = None
+    summary = exporter.export_search()
+    rows = _read_ndjson(output)
+    assert summary.resumed_from_page == 7
+    assert summary.rows == len(rows) == 500
+    assert len({row['id'] for row in rows}) == 500
+
+
+def test_pending_pages_stay_within_window(client, tmp_path, monkeypatch):
+    lock = threading.Lock()
+    counts = {'started': 0, 'written': 0, 'max_pending': 0}
+    search = client.search
+
+    def counting_search(**params):
+        with lock:
+            counts['started'] += 1
+            counts['max_pending'] = max(counts['max_pending'], counts['started'] - counts['written'])
+        return search(**params)
+
+    write_rows = NDJSONWriter.write_rows
+
+    def counting_write_rows(self, rows):
+        write_rows(self, rows)
+        with lock:
+            counts['written'] += 1
+
+    monkeypatch.setattr(client, 'search', counting_search)
+    monkeypatch.setattr(NDJSONWriter, 'write_rows', counting_write_rows)
+    exporter = BulkExporter(client, str(tmp_path / 'export.ndjson'), page_size=10, concurrency=4, max_pending_pages=6)
+    summary = exporter.export_search()
+
+    assert summary.pages == 50
+    assert counts['max_pending'] <= 6
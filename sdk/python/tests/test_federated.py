@@ -0,0 +1,57 @@
+"""
+Tests de la recherche multi-types fédérée
+"""
+
+import time
+
+from romapi_search import ROMAPISearchClient
+from romapi_search.testing import FakeSearchServer, SyntheticCatalogue
+from romapi_search.types import ResourceType
+
+
+def test_federated_search_matches_per_type_results(client):
+    types = [ResourceType.SERVICE, ResourceType.API]
+    results = client.search_multi_type("restaurant", include_types=types, federated=True)
+
+    assert list(results.results_by_type) == ['SERVICE', 'API']
+    for resource_type in types:
+        expected = client.search_by_type(resource_type, "restaurant")
+        typed = results.results_by_type[resource_type.value]
+        assert [hit.id for hit in typed.hits] == [hit.id for hit in expected.hits]
+        assert typed.total == expected.total
+    assert results.total_across_types == sum(typed.total for typed in results.results_by_type.values())
+    assert results.request_metadata.endpoint == '/search/type'
+
+
+def test_federated_global_sort_merges_hits_by_score(client):
+    results = client.search_multi_type("restaurant", federated=True, global_relevance_sort=True)
+    scores = [hit.score for hit in results.mixed_results]
+    assert len(scores) == sum(len(typed.hits) for typed in results.results_by_type.values())
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_as_completed_does_not_wait_for_slow_type():
+    catalogue = SyntheticCatalogue()
+
+    def by_type(params, path):
+        if path[-1] == 'API':
+            time.sleep(0.5)
+        return catalogue.search(params, [path[-1]])
+
+    with FakeSearchServer(fixtures={'type': by_type}) as server:
+        client = ROMAPISearchClient(base_url=server.base_url, retries=0)
+        started = time.perf_counter()
+        arrivals = []
+        for resource_type, results in client.search_multi_type_as_completed("restaurant"):
+            arrivals.append((resource_type, time.perf_counter() - started))
+
+    assert arrivals[-1][0] == ResourceType.API
+    assert all(elapsed < 0.4 for _, elapsed in arrivals[:-1])
+    assert {resource_type for resource_type, _ in arrivals} == set(ResourceType)
+
+
+def test_merged_search_reads_further_pages_lazily(client):
+    hits = list(client.search_multi_type_merged("restaurant", max_pages=2, limit=10))
+    scores = [hit.score for hit in hits]
+    assert len(hits) == 2 * 10 * len(ResourceType)
+    assert scores == sorted(scores, reverse=True)
@@ -0,0 +1,21 @@
+"""
+Tests du budget d'import du paquet (interpréteurs neufs, ``-X importtime``)
+
+``ROMAPI_IMPORT_BUDGET_SCALE`` relâche le budget sur les machines lentes.
+"""
+
+import os
+
+from benchmarks.importtime import BUDGETS_MS, eagerly_loaded_modules, measure_import
+
+
+def test_bare_import_loads_no_heavy_dependency():
+    eager = eagerly_loaded_modules()
+    for module in ('requests', 'urllib3', 'msgpack'):
+        assert module not in eager
+    assert eager == []
+
+
+def test_bare_import_stays_under_budget():
+    scale = float(os.environ.get('ROMAPI_IMPORT_BUDGET_SCALE', '1.0'))
+    assert measure_import('romapi_search', runs=3) <= BUDGETS_MS['romapi_search'] * scale
@@ -0,0 +1,34 @@
+"""
+Tests des hooks d'instrumentation des requêtes
+"""
+
+import pytest
+
+from romapi_search.exceptions import ROMAPIError
+from romapi_search.instrumentation import CACHE_HIT, CACHE_MISS
+from romapi_search.testing import FaultProfile
+
+
+def test_response_hook_reports_cache_hit(client):
+    events = []
+    client.add_hook('response', events.append)
+
+    client.search(query="restaurant")
+    client.search(query="restaurant")
+
+    assert [event.cache for event in events] == [CACHE_MISS, CACHE_HIT]
+    assert events[0].status_code == 200 and events[0].timing.total > 0
+    assert events[1].from_cache
+
+
+def test_error_hook_receives_exception(client, server):
+    requests, errors = [], []
+    client.add_hook('request', requests.append)
+    client.add_hook('error', errors.append)
+    server.set_profile(FaultProfile(error_rate=1.0, error_status=503))
+
+    with pytest.raises(ROMAPIError):
+        client.search(query="transport")
+
+    assert len(requests) == 1 and len(errors) == 1
+    assert isinstance(errors[0].error, ROMAPIError)
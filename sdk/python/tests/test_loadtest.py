@@ -0,0 +1,24 @@
+"""
+Tests du rapport de test de charge (LoadTestReport)
+"""
+
+from romapi_search.loadtest import LoadTestReport
+
+
+def _report(latencies):
+    return LoadTestReport(requests=len(latencies), errors=0, duration=1.0, latencies=latencies)
+
+
+def test_percentile_uses_nearest_rank():
+    report = _report([float(value) for value in range(1, 11)])
+    assert report.percentile(50) == 5.0
+    assert report.percentile(90) == 9.0
+    assert report.percentile(91) == 10.0
+    assert report.percentile(100) == 10.0
+    assert report.percentile(0) == 1.0
+
+
+def test_percentile_of_small_samples():
+    assert _report([3.0, 1.0]).percentile(50) == 1.0
+    assert _report([3.0, 1.0]).percentile(99) == 3.0
+    assert _report([]).percentile(99) == 0.0
@@ -0,0 +1,24 @@
+"""
+Tests des métriques du client
+"""
+
+from romapi_search.metrics import endpoint_label
+
+
+def test_endpoint_label_templates_category_paths():
+    assert endpoint_label('/search/categories/fintech') == '/search/categories/{slug}'
+    assert endpoint_label('/search/categories/cat-fintech/hierarchy') == '/search/categories/{id}/hierarchy'
+    assert endpoint_label('/search/categories/hierarchy') == '/search/categories/hierarchy'
+    assert endpoint_label('/search') == '/search'
+
+
+def test_prometheus_export_uses_templated_endpoint(client):
+    client.search_by_category_slug('fintech')
+    client.search_by_category_slug('transport')
+    client.search_by_category_slug('transport')
+
+    exported = client.metrics.to_prometheus()
+    assert 'romapi_requests_total{endpoint="/search/categories/{slug}",status="200"} 2' in exported
+    assert 'romapi_requests_total{endpoint="/search/categories/{slug}",status="cache"} 1' in exported
+    assert 'fintech' not in exported and 'transport' not in exported
+    assert client.metrics.cache_hits.value() == 1
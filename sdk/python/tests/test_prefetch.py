@@ -0,0 +1,80 @@
+"""
+Tests du préchargement prédictif
+"""
+
+import time
+
+from romapi_search import ROMAPISearchClient
+from romapi_search.cache import current_cache_policy
+from romapi_search.prefetch import Prediction, PredictivePrefetcher
+from romapi_search.testing import FakeSearchServer, FaultProfile
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert condition()
+
+
+def test_next_page_is_prefetched_and_counted_as_used(server):
+    client = ROMAPISearchClient(base_url=server.base_url, retries=0, prefetch=True)
+    prefetcher = client.prefetcher
+
+    client.search("restaurant")
+    _wait_for(lambda: prefetcher.stats['prefetched'] == 1)
+    page_two = client.search("restaurant", page=2)
+    assert page_two.request_metadata.from_cache
+    assert prefetcher.stats['used'] == 1
+
+    # Page 3 préchargée à son tour mais jamais demandée
+    _wait_for(lambda: prefetcher.stats['prefetched'] == 2)
+    assert prefetcher.accuracy == 0.5
+    client.close()
+    assert prefetcher.stats['expired'] == 1
+
+
+def test_prefetch_is_suspended_below_quota_headroom():
+    with FakeSearchServer(profile=FaultProfile(rate_limit=10)) as server:
+        client = ROMAPISearchClient(base_url=server.base_url, retries=0, prefetch=True)
+        prefetcher = client.prefetcher
+
+        def settled():
+            return prefetcher.stats['scheduled'] == prefetcher.stats['prefetched'] + prefetcher.stats['errors']
+
+        # 10 requêtes par fenêtre, marge de 20 % : plus de préchargement à 2 requêtes restantes ou moins
+        for page in (1, 3, 5, 7, 9):
+            client.search("restaurant", page=page)
+            _wait_for(settled)
+        assert prefetcher.stats['prefetched'] == 4
+        assert prefetcher.stats['skipped'] == 1
+        assert server.stats['by_status'].get(429, 0) == 0
+        client.close()
+
+
+def _counting_fetch(fetched):
+    def fetch(endpoint, params):
+        # Requête envoyée à l'API : comptée comme absence du cache
+        current_cache_policy().misses += 1
+        fetched.append((endpoint, params))
+    return fetch
+
+
+def test_headroom_uses_last_rate_limit_window():
+    fetched = []
+    info = {'limit': 100, 'remaining': 20, 'reset_time': time.time() + 60}
+    prefetcher = PredictivePrefetcher(_counting_fetch(fetched), lambda: info, headroom=0.2)
+
+    assert not prefetcher.schedule(Prediction('/search', {'page': 2}))
+    assert prefetcher.stats['skipped'] == 1
+
+    info['remaining'] = 21
+    assert prefetcher.schedule(Prediction('/search', {'page': 2}))
+    # Déjà en attente : pas de second préchargement
+    assert not prefetcher.schedule(Prediction('/search', {'page': 2}))
+
+    info.update(remaining=0, reset_time=time.time() - 1)
+    assert prefetcher.schedule(Prediction('/search', {'page': 3}))
+    prefetcher._executor.shutdown(wait=True)
+    assert sorted(params['page'] for _, params in fetched) == [2, 3]
+    assert prefetcher.stats['prefetched'] == 2
@@ -0,0 +1,46 @@
+"""
+Tests du cache DNS et des connexions instrumentées
+"""
+
+import pytest
+from urllib3.exceptions import NewConnectionError
+
+from romapi_search.instrumentation import timed_pool_classes
+from romapi_search.testing import FakeSearchServer
+
+
+class StubResolver:
+    """Résolveur renvoyant des adresses fixes"""
+
+    def __init__(self, addresses):
+        self.addresses = addresses
+        self.invalidated = []
+
+    def resolve_all(self, host, port):
+        return self.addresses
+
+    def invalidate(self, host=None):
+        self.invalidated.append(host)
+
+
+def _pool(resolver, port):
+    return timed_pool_classes(resolver)['http']('localhost', port, retries=False)
+
+
+def test_connection_falls_back_to_next_cached_address():
+    # 127.0.0.2 est une adresse de boucle locale où rien n'écoute : connexion refusée
+    resolver = StubResolver(['127.0.0.2', '127.0.0.1'])
+    with FakeSearchServer() as server:
+        port = server._server.server_address[1]
+        response = _pool(resolver, port).request('GET', '/api/v1/search?q=test')
+    assert response.status == 200
+    assert resolver.invalidated == []
+
+
+def test_cache_entry_is_invalidated_when_every_address_fails():
+    resolver = StubResolver(['127.0.0.2', '127.0.0.3'])
+    with FakeSearchServer() as server:
+        port = server._server.server_address[1]
+        with pytest.raises(NewConnectionError):
+            _pool(resolver, port).request('GET', '/api/v1/search?q=test')
+    assert resolver.invalidated == ['localhost']
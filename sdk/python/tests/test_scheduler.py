@@ -0,0 +1,43 @@
+"""
+Tests de l'ordonnanceur de requêtes
+"""
+
+import pytest
+
+from romapi_search import ROMAPISearchClient
+from romapi_search.exceptions import ValidationError
+from romapi_search.scheduler import RequestScheduler
+
+
+class OpenLimiter:
+    """Limiteur qui laisse toujours passer"""
+
+    def __init__(self):
+        self.taken = 0
+
+    def take(self):
+        self.taken += 1
+        return 0.0
+
+
+def test_scheduler_without_concurrency_cap_only_applies_limiter():
+    limiter = OpenLimiter()
+    scheduler = RequestScheduler(max_concurrency=None, limiter=limiter)
+    for _ in range(50):
+        scheduler.acquire()
+    assert scheduler.in_flight == 50
+    assert limiter.taken == 50
+
+
+def test_invalid_concurrency_cap_is_rejected():
+    with pytest.raises(ValidationError):
+        RequestScheduler(max_concurrency=0)
+
+
+def test_shared_quota_alone_does_not_cap_concurrency(tmp_path):
+    client = ROMAPISearchClient(shared_quota=str(tmp_path / 'quota.json'))
+    assert client.scheduler is not None
+    assert client.scheduler.max_concurrency is None
+
+    client = ROMAPISearchClient(shared_quota=str(tmp_path / 'quota.json'), max_concurrency=4)
+    assert client.scheduler.max_concurrency == 4
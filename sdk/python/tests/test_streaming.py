@@ -0,0 +1,66 @@
+"""
+Tests de l'analyse JSON incrémentale
+"""
+
+import json
+
+import pytest
+
+from romapi_search.streaming import JSONStreamError, iter_json_arrays
+from romapi_search.types import ResourceType
+
+DOCUMENT = {
+    'total': 3,
+    'facets': [{'name': 'categories', 'values': {'a': 1}}],
+    'hits': [
+        {'id': '1', 'name': 'Café "Le Wouri" \\ Douala', 'tags': ['wifi', 'terrasse']},
+        {'id': '2', 'name': 'Hôtel été', 'score': 1.5e-3, 'verified': True, 'rating': None},
+        {'id': '3', 'nested': {'hits': [{'id': 'ignored'}]}},
+    ],
+    'after': {'hits': [{'id': 'ignored'}]},
+}
+
+
+def _chunks(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize('size', [1, 2, 7, 64, 100000])
+def test_items_are_decoded_whatever_the_chunk_boundaries(size):
+    body = json.dumps(DOCUMENT, ensure_ascii=False).encode('utf-8')
+    items = list(iter_json_arrays(_chunks(body, size), [('hits',)]))
+    assert [path for path, _ in items] == [('hits',)] * 3
+    assert [item for _, item in items] == DOCUMENT['hits']
+
+
+def test_wildcard_patterns_report_the_actual_path():
+    document = {'resultsByType': {'API': {'hits': [{'id': 'a'}]}, 'SERVICE': {'hits': [{'id': 's'}, 1, 'x']}}}
+    items = list(iter_json_arrays([json.dumps(document)], [('resultsByType', '*', 'hits')]))
+    assert items == [
+        (('resultsByType', 'API', 'hits'), {'id': 'a'}),
+        (('resultsByType', 'SERVICE', 'hits'), {'id': 's'}),
+        (('resultsByType', 'SERVICE', 'hits'), 1),
+        (('resultsByType', 'SERVICE', 'hits'), 'x'),
+    ]
+
+
+def test_truncated_stream_is_rejected():
+    body = json.dumps(DOCUMENT)
+    with pytest.raises(JSONStreamError):
+        list(iter_json_arrays([body[:len(body) // 2]], [('hits',)]))
+
+
+def test_client_streams_hits_in_response_order(client):
+    expected = [hit.id for hit in client.search("restaurant", limit=50).hits]
+    streamed = [hit.id for hit in client.search_stream("restaurant", limit=50, chunk_size=512)]
+    assert streamed == expected
+
+
+def test_client_streams_multi_type_hits(client):
+    by_type = {}
+    for resource_type, hit in client.search_multi_type_stream(
+        "restaurant", include_types=[ResourceType.API, ResourceType.SERVICE], chunk_size=256
+    ):
+        by_type.setdefault(resource_type, []).append(hit)
+    assert set(by_type) == {ResourceType.API, ResourceType.SERVICE}
+    assert all(hit.resource_type == resource_type for resource_type, hits in by_type.items() for hit in hits)
@@ -0,0 +1,41 @@
+"""
+Tests du partage des valeurs répétées au décodage
+"""
+
+from romapi_search import types
+from romapi_search.types import Category, SearchHit
+
+
+def _hit(index, city='Douala', tags=('wifi',)):
+    return {
+        'id': str(index), 'name': f"Lieu {index}", 'slug': f"lieu-{index}", 'description': '',
+        'resourceType': 'BUSINESS', 'plan': 'FREE', 'verified': False, 'score': 1.0, 'tags': list(tags),
+        'category': {'id': 'c1', 'name': 'Restaurants', 'slug': 'restaurants'},
+        'address': {'city': city, 'region': None, 'country': ''},
+    }
+
+
+def test_repeated_values_share_one_instance():
+    first = SearchHit.from_dict(_hit(1, city=''.join(['Dou', 'ala'])))
+    second = SearchHit.from_dict(_hit(2, city=''.join(['Dou', 'ala'])))
+    assert first.category is second.category
+    assert first.address.city is second.address.city
+    assert first.tags[0] is second.tags[0]
+
+
+def test_missing_and_empty_strings_are_not_stored():
+    SearchHit.from_dict(_hit(1))
+    assert None not in types._SHARED_STRINGS
+    assert '' not in types._SHARED_STRINGS
+
+
+def test_tables_stay_bounded_and_keep_recently_used_values(monkeypatch):
+    monkeypatch.setattr(types, '_SHARED_CATEGORIES_MAX', 10)
+    monkeypatch.setattr(types, '_SHARED_CATEGORIES', {})
+    monkeypatch.setattr(types, '_SHARED_CATEGORIES_PREVIOUS', {})
+
+    hot = Category.shared('hot', 'Hot', 'hot')
+    for index in range(100):
+        Category.shared(str(index), f"Catégorie {index}", f"categorie-{index}")
+        assert Category.shared('hot', 'Hot', 'hot') is hot
+        assert len(types._SHARED_CATEGORIES) + len(types._SHARED_CATEGORIES_PREVIOUS) <= 10
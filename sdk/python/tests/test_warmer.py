@@ -0,0 +1,34 @@
+"""
+Tests du préchauffage du cache
+"""
+
+import pytest
+
+from romapi_search import ROMAPISearchClient
+from romapi_search.exceptions import RateLimitError
+from romapi_search.testing import FakeSearchServer, FaultProfile
+from romapi_search.warmer import CacheWarmer
+
+
+@pytest.mark.parametrize('transport', ['requests', 'urllib3'])
+def test_rate_limited_response_surfaces_as_rate_limit_error(transport):
+    with FakeSearchServer(profile=FaultProfile(rate_limit=1)) as server:
+        client = ROMAPISearchClient(base_url=server.base_url, transport=transport, retries=0)
+        client.search("restaurant")
+        with pytest.raises(RateLimitError):
+            client.search("hotel")
+
+
+def test_rate_limiting_stops_the_warming_pass():
+    with FakeSearchServer(profile=FaultProfile(rate_limit=2)) as server:
+        client = ROMAPISearchClient(base_url=server.base_url, retries=0)
+        warmer = CacheWarmer(
+            client, terms=['restaurant', 'hotel', 'pharmacie', 'banque', 'garage'],
+            include_suggestions=False, rate=100
+        )
+        report = warmer.warm()
+
+    assert report['targets'] == 5
+    assert report['errors'] == 1
+    assert server.stats['requests'] == 3
+    assert server.stats['by_status'] == {200: 2, 429: 1}
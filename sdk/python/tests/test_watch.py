@@ -0,0 +1,100 @@
+"""
+Tests du flux de changements d'une recherche
+"""
+
+import pytest
+
+from romapi_search import ROMAPISearchClient
+from romapi_search.exceptions import ValidationError
+from romapi_search.testing import FakeSearchServer, SyntheticCatalogue
+from romapi_search.watch import SearchWatcher
+
+
+class MutableCatalogue:
+    """Ressources modifiables servies triées et paginées comme /search"""
+
+    def __init__(self, size):
+        catalogue = SyntheticCatalogue(size=size)
+        self.resources = {}
+        for index in range(size):
+            self.add(catalogue.hit(index), f"2025-01-01T00:{index:02d}:00.000Z")
+
+    def add(self, hit, stamp):
+        hit['createdAt'] = hit['updatedAt'] = stamp
+        self.resources[hit['id']] = hit
+
+    def touch(self, resource_id, stamp):
+        self.resources[resource_id]['updatedAt'] = stamp
+
+    def search(self, params, path):
+        page, limit = int(params.get('page', 1)), int(params.get('limit', 20))
+        key = 'updatedAt' if params.get('sort') == 'updatedAt' else 'createdAt'
+        hits = sorted(self.resources.values(), key=lambda hit: (hit[key], hit['id']),
+                      reverse=params.get('order') == 'desc')
+        total_pages = max(-(-len(hits) // limit), 1)
+        return {
+            'hits': hits[(page - 1) * limit:page * limit],
+            'total': len(hits),
+            'took': 1,
+            'facets': [],
+            'pagination': {
+                'page': page, 'limit': limit, 'totalPages': total_pages,
+                'hasNext': page < total_pages, 'hasPrev': page > 1,
+            },
+        }
+
+
+@pytest.fixture
+def catalogue():
+    return MutableCatalogue(30)
+
+
+@pytest.fixture
+def watcher(catalogue):
+    with FakeSearchServer(fixtures={'search': catalogue.search}) as server:
+        client = ROMAPISearchClient(base_url=server.base_url, retries=0)
+        yield SearchWatcher(client, page_size=10, full_scan_every=10)
+        client.close()
+
+
+def test_first_poll_is_a_full_scan(watcher):
+    changes = watcher.poll()
+    assert changes.full_scan
+    assert len(changes.added) == 30 and not changes.updated and not changes.removed
+    assert changes.pages == 3
+    assert len(watcher.state) == 30
+
+
+def test_incremental_poll_stops_at_watermark(watcher, catalogue):
+    watcher.poll()
+    first_watermark = watcher.watermark
+    ids = sorted(catalogue.resources)
+    catalogue.touch(ids[0], "2025-01-05T00:00:00.000Z")
+    catalogue.touch(ids[1], "2025-01-05T00:00:00.000Z")
+    catalogue.add(SyntheticCatalogue(size=40).hit(35), "2025-01-06T00:00:00.000Z")
+
+    changes = watcher.poll()
+    assert not changes.full_scan
+    assert changes.pages == 1
+    assert {hit.id for hit in changes.updated} == {ids[0], ids[1]}
+    assert len(changes.added) == 1
+    assert watcher.watermark > first_watermark
+
+    unchanged = watcher.poll()
+    assert not unchanged and not unchanged.full_scan
+
+
+def test_removal_triggers_a_full_scan(watcher, catalogue):
+    watcher.poll()
+    removed = sorted(catalogue.resources)[3]
+    del catalogue.resources[removed]
+
+    changes = watcher.poll()
+    assert changes.full_scan
+    assert changes.removed == [removed]
+    assert removed not in watcher.state
+
+
+def test_reserved_parameters_are_rejected(client):
+    with pytest.raises(ValidationError):
+        SearchWatcher(client, {'page': 2})
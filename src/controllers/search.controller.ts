@@ -19,7 +19,8 @@ import {
   DefaultValuePipe,
   ParseArrayPipe,
   Req,
-  Ip
+  Ip,
+  UseInterceptors
 } from '@nestjs/common';
 import { Request } from 'express';
 import { 
@@ -51,6 +52,7 @@ import {
 } from '../modules/search/interfaces/category-search.interfaces';
 import { ResourceType, ResourcePlan } from '@prisma/client';
 import { Suggestion } from '../modules/search/types/suggestion.types';
+import { ConditionalRequestInterceptor } from '../interceptors/conditional-request.interceptor';
 
 @ApiTags('Search')
 @Controller('api/v1/search')
@@ -468,6 +470,7 @@ export class SearchController {
   }
 
   @Get('suggest/popular')
+  @UseInterceptors(ConditionalRequestInterceptor)
   @ApiOperation({ 
     summary: 'Suggestions populaires',
     description: 'Obtient les suggestions les plus populaires pour pré-cache ou affichage initial'
@@ -715,6 +718,7 @@ export class SearchController {
   }
 
   @Get('categories/hierarchy')
+  @UseInterceptors(ConditionalRequestInterceptor)
   @ApiOperation({ 
     summary: 'Obtenir la hiérarchie complète des catégories',
     description: 'Retourne la structure hiérarchique des catégories avec compteurs'
@@ -0,0 +1,104 @@
+import {
+  Injectable,
+  NestInterceptor,
+  ExecutionContext,
+  CallHandler,
+  HttpStatus,
+} from '@nestjs/common';
+import { Observable } from 'rxjs';
+import { map } from 'rxjs/operators';
+import { Request, Response } from 'express';
+import { createHash } from 'crypto';
+
+interface ValidatorEntry {
+  etag: string;
+  lastModified: Date;
+}
+
+const MAX_TRACKED_URLS = 1000;
+const MAX_AGE_SECONDS = 60;
+
+/**
+ * Interceptor emitting HTTP validators (ETag / Last-Modified) so that clients
+ * can revalidate cached payloads with conditional GETs.
+ *
+ * The ETag is computed from the raw handler payload (before the global
+ * ResponseInterceptor adds its per-request timestamp), so it only changes
+ * when the data itself changes. Matching If-None-Match / If-Modified-Since
+ * requests are answered with 304 Not Modified and an empty body.
+ */
+@Injectable()
+export class ConditionalRequestInterceptor implements NestInterceptor {
+  private readonly validators = new Map<string, ValidatorEntry>();
+
+  intercept(context: ExecutionContext, next: CallHandler): Observable<any> {
+    const request = context.switchToHttp().getRequest<Request>();
+    const response = context.switchToHttp().getResponse<Response>();
+
+    return next.handle().pipe(
+      map((data) => {
+        const entry = this.getValidators(request.originalUrl, data);
+
+        response.setHeader('ETag', entry.etag);
+        response.setHeader('Last-Modified', entry.lastModified.toUTCString());
+        response.setHeader('Cache-Control', `private, max-age=${MAX_AGE_SECONDS}, must-revalidate`);
+
+        if (this.isNotModified(request, entry)) {
+          response.status(HttpStatus.NOT_MODIFIED);
+          return undefined;
+        }
+
+        return data;
+      })
+    );
+  }
+
+  /**
+   * Compute the validators for a payload, keeping Last-Modified stable
+   * as long as the ETag of the URL does not change
+   */
+  private getValidators(url: string, data: any): ValidatorEntry {
+    const hash = createHash('sha1')
+      .update(JSON.stringify(data ?? null))
+      .digest('base64');
+    const etag = `W/"${hash}"`;
+
+    const previous = this.validators.get(url);
+    if (previous && previous.etag === etag) {
+      return previous;
+    }
+
+    // Last-Modified has a one second resolution
+    const lastModified = new Date(Math.floor(Date.now() / 1000) * 1000);
+    const entry = { etag, lastModified };
+
+    if (!previous && this.validators.size >= MAX_TRACKED_URLS) {
+      const oldestUrl = this.validators.keys().next().value;
+      this.validators.delete(oldestUrl);
+    }
+    this.validators.set(url, entry);
+
+    return entry;
+  }
+
+  /**
+   * Check conditional request headers (If-None-Match takes precedence)
+   */
+  private isNotModified(request: Request, entry: ValidatorEntry): boolean {
+    const ifNoneMatch = request.headers['if-none-match'];
+    if (ifNoneMatch) {
+      return ifNoneMatch
+        .split(',')
+        .map((tag) => tag.trim().replace(/^W\//, ''))
+        .some((tag) => tag === '*' || tag === entry.etag.replace(/^W\//, ''));
+    }
+
+    const ifModifiedSince = request.headers['if-modified-since'];
+    if (ifModifiedSince) {
+      const since = Date.parse(ifModifiedSince);
+      return !isNaN(since) && entry.lastModified.getTime() <= since;
+    }
+
+    return false;
+  }
+}
@@ -1 +1,2 @@
-export { ResponseInterceptor } from './response.interceptor';
\ No newline at end of file
+export { ResponseInterceptor } from './response.interceptor';
+export { ConditionalRequestInterceptor } from './conditional-request.interceptor';
\ No newline at end of file